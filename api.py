@@ -13,7 +13,7 @@ from pydantic import BaseModel, Field
 from src.agents.orchestrator import OrchestratorAgent
 from src.config import get_settings
 from src.memory import ConversationMemory
-from src.models import QueryResult
+from src.models import QueryResult, SearchFilter
 from src.pipeline import build_pipeline
 from src.tracing import setup_tracing
 
@@ -25,6 +25,7 @@ memory: ConversationMemory
 
 class QueryRequest(BaseModel):
     question: str = Field(min_length=1)
+    filter: SearchFilter | None = None
 
 
 class QueryResponse(BaseModel):
@@ -41,6 +42,11 @@ class HealthResponse(BaseModel):
     status: str
 
 
+class MetricsResponse(BaseModel):
+    embedding_dispatcher: dict[str, float]
+    query_cache: dict[str, float] | None = None
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Personal KB - API Server")
     parser.add_argument(
@@ -64,6 +70,8 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await agent.aclose()
+
 
 app = FastAPI(title="Personal KB API", lifespan=lifespan)
 
@@ -102,7 +110,9 @@ async def query(request: QueryRequest):
         )
 
     result: QueryResult = await agent.ask_async(
-        request.question, message_history=memory.get_history()
+        request.question,
+        message_history=memory.get_history(),
+        search_filter=request.filter,
     )
 
     memory.add_turn(request.question, result.answer)
@@ -114,6 +124,11 @@ async def health():
     return HealthResponse(status="ok")
 
 
+@app.get("/api/v1/metrics", response_model=MetricsResponse)
+async def metrics():
+    return MetricsResponse(**agent.metrics())
+
+
 if __name__ == "__main__":
     args = parse_args()
     app.state.reindex = args.reindex
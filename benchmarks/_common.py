@@ -0,0 +1,85 @@
+"""Shared helpers for the vector index benchmarks."""
+
+import statistics
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from src.models import Chunk
+
+
+def synthetic_corpus(
+    size: int, dimension: int, queries: int, clusters: int = 64, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Generate clustered unit vectors and queries drawn near the same clusters.
+
+    Uniform random vectors make every neighbour nearly equidistant, which
+    flatters approximate indexes; clustered data behaves more like text
+    embeddings.
+
+    Returns:
+        (corpus, queries) as float32 arrays of unit vectors.
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimension)).astype(np.float32)
+
+    def sample(n: int) -> np.ndarray:
+        vectors = centers[rng.integers(clusters, size=n)]
+        vectors = vectors + 0.6 * rng.standard_normal((n, dimension)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    return sample(size), sample(queries)
+
+
+def synthetic_chunks(size: int) -> list[Chunk]:
+    """Placeholder chunks to pair with synthetic vectors."""
+    return [Chunk(text=f"chunk {i}", source="synthetic", chunk_index=i) for i in range(size)]
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> list[set[int]]:
+    """Exact cosine top-k indices per query (vectors are unit length)."""
+    scores = queries @ corpus.T
+    top = np.argpartition(-scores, k, axis=1)[:, :k]
+    return [set(row.tolist()) for row in top]
+
+
+def recall_at_k(expected: list[set[int]], found: list[set[int]]) -> float:
+    """Mean fraction of the exact top-k found by the index."""
+    return statistics.fmean(len(e & f) / len(e) for e, f in zip(expected, found, strict=True))
+
+
+def timed(fn: Callable[[np.ndarray], set[int]], queries: np.ndarray) -> tuple[list[set[int]], dict]:
+    """Run fn per query and return its results and latency percentiles in ms."""
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(fn(query))
+        latencies.append(1000 * (time.perf_counter() - start))
+    return results, latency_percentiles(latencies)
+
+
+def latency_percentiles(latencies_ms: list[float]) -> dict[str, float]:
+    """p50/p95/p99 of a list of latencies in milliseconds."""
+    p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99])
+    return {"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+
+def wait_for_green(url: str | None, collection: str, timeout: float = 300.0) -> None:
+    """Wait until a remote collection has finished optimizing (indexing, quantizing).
+
+    Searches issued earlier may fall back to a plain scan and skew the numbers.
+    Embedded clients (url None) index synchronously, so this returns at once.
+    """
+    if url is None:
+        return
+    from qdrant_client import QdrantClient
+    from qdrant_client.models import CollectionStatus
+
+    client = QdrantClient(url=url)
+    deadline = time.monotonic() + timeout
+    while client.get_collection(collection).status != CollectionStatus.GREEN:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Collection {collection} not ready after {timeout:.0f}s")
+        time.sleep(0.5)
+    client.close()
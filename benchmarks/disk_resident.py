@@ -0,0 +1,178 @@
+"""Benchmark: RAM-resident vs disk-resident Qdrant collections as the corpus grows.
+
+For each corpus size and layout, uploads a synthetic corpus into a fresh
+collection, then reports the server's resident memory (RSS) and search
+latency percentiles for a first pass over the queries and a second, warm
+pass. Layouts:
+
+    ram          vectors, HNSW graph and payloads in RAM (the default)
+    disk         memory-mapped vectors and HNSW graph, payloads on disk
+    disk-scalar  as disk, plus int8 quantized vectors kept in RAM for the
+                 first pass; the on-disk originals are only read to rescore
+
+With the disk layouts RSS is bounded by the page cache the OS grants the
+server rather than by the corpus, at the cost of latency on cache misses.
+To measure a real ceiling, cap the container's memory, e.g.
+``docker run -m 2g ...``; ``ram`` then fails to load the larger corpora.
+For a truly cold first pass, run with --keep, restart the container, and
+run again with --skip-load.
+
+The corpus is generated and uploaded in slices, so the benchmark process
+itself stays small even at 5M chunks. RSS is read from the server's
+Prometheus endpoint (``memory_resident_bytes``).
+
+Usage:
+    docker run -m 2g -p 6333:6333 qdrant/qdrant
+    uv run python -m benchmarks.disk_resident --sizes 100000
+    uv run python -m benchmarks.disk_resident --sizes 100000 1000000 5000000 \\
+        --layouts disk disk-scalar --output eval_results/disk_resident.json
+"""
+
+import argparse
+import json
+import time
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks._common import timed, wait_for_green
+from src.config import get_settings
+from src.models import Chunk
+from src.vectorstore import VectorStore
+
+LAYOUTS = {
+    "ram": {},
+    "disk": {"on_disk_vectors": True, "on_disk_hnsw": True, "on_disk_payload": True},
+    "disk-scalar": {
+        "on_disk_vectors": True,
+        "on_disk_hnsw": True,
+        "on_disk_payload": True,
+        "quantization": "scalar",
+    },
+}
+
+# Vectors generated and uploaded per slice.
+_SLICE = 50_000
+
+
+def resident_mb(url: str) -> float:
+    """Resident memory of the Qdrant server in MiB, from its /metrics endpoint."""
+    with urllib.request.urlopen(f"{url.rstrip('/')}/metrics", timeout=10) as response:
+        for line in response.read().decode().splitlines():
+            if line.startswith("memory_resident_bytes "):
+                return float(line.split()[1]) / 2**20
+    raise RuntimeError("Qdrant /metrics did not report memory_resident_bytes")
+
+
+def _centers(dimension: int, clusters: int = 64, seed: int = 0) -> np.ndarray:
+    """Cluster centers shared by the corpus and the queries (see synthetic_corpus)."""
+    return np.random.default_rng(seed).standard_normal((clusters, dimension)).astype(np.float32)
+
+
+def _sample(centers: np.ndarray, n: int, rng: np.random.Generator) -> np.ndarray:
+    """Unit vectors drawn around random cluster centers."""
+    vectors = centers[rng.integers(len(centers), size=n)]
+    vectors = vectors + 0.6 * rng.standard_normal(vectors.shape).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _stream(size: int, centers: np.ndarray) -> tuple[Iterator[Chunk], Iterator[np.ndarray]]:
+    """Synthetic chunks and vectors, generated lazily one slice at a time."""
+    rng = np.random.default_rng(1)
+
+    def chunks() -> Iterator[Chunk]:
+        for i in range(size):
+            yield Chunk(text=f"chunk {i}", source="synthetic", chunk_index=i)
+
+    def vectors() -> Iterator[np.ndarray]:
+        for start in range(0, size, _SLICE):
+            yield from _sample(centers, min(_SLICE, size - start), rng)
+
+    return chunks(), vectors()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark disk-resident Qdrant collections")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--layouts", nargs="+", default=list(LAYOUTS), choices=LAYOUTS)
+    parser.add_argument("--url", default=None, help="Qdrant URL (default: QDRANT_URL).")
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--upsert-parallel", type=int, default=4)
+    parser.add_argument("--keep", action="store_true", help="Keep the collections afterwards.")
+    parser.add_argument(
+        "--skip-load", action="store_true", help="Search collections kept by an earlier --keep run."
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON.")
+    args = parser.parse_args()
+
+    url = args.url or get_settings().qdrant_url
+    centers = _centers(args.dimension)
+    queries = _sample(centers, args.queries, np.random.default_rng(2))
+
+    results = []
+    for size in args.sizes:
+        for layout in args.layouts:
+            collection = f"bench_disk_{layout}_{size}"
+            store = VectorStore(
+                collection_name=collection,
+                url=url,
+                use_memory=False,
+                embedding_dimension=args.dimension,
+                upsert_batch_size=1024,
+                upsert_parallel=args.upsert_parallel,
+                **LAYOUTS[layout],
+            )
+            start = time.perf_counter()
+            if not args.skip_load:
+                store.delete_collection()
+                store.ensure_collection()
+                store.add_chunks(*_stream(size, centers))
+                wait_for_green(url, collection, timeout=3600)
+            load_seconds = time.perf_counter() - start
+            rss_loaded = resident_mb(url)
+
+            def search(query, store=store):
+                hits = store.search(query, top_k=args.top_k, score_threshold=-1.0)
+                return {r.chunk.chunk_index for r in hits}
+
+            _, first = timed(search, queries)
+            _, warm = timed(search, queries)
+            results.append(
+                {
+                    "size": size,
+                    "layout": layout,
+                    "load_seconds": load_seconds,
+                    "rss_loaded_mb": rss_loaded,
+                    "rss_after_search_mb": resident_mb(url),
+                    "first_pass": first,
+                    "warm": warm,
+                }
+            )
+            if not (args.keep or args.skip_load):
+                store.delete_collection()
+            store.close()
+
+    print(f"\n{args.dimension}-dim vectors, {args.queries} queries, top {args.top_k}")
+    print(
+        f"{'size':>9} {'layout':<12} {'RSS MB':>8} {'RSS q MB':>9} "
+        f"{'1st p50':>9} {'1st p99':>9} {'warm p50':>9} {'warm p99':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['size']:>9} {r['layout']:<12} {r['rss_loaded_mb']:>8.0f} "
+            f"{r['rss_after_search_mb']:>9.0f} {r['first_pass']['p50_ms']:>9.2f} "
+            f"{r['first_pass']['p99_ms']:>9.2f} {r['warm']['p50_ms']:>9.2f} {r['warm']['p99_ms']:>9.2f}"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
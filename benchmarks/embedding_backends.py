@@ -0,0 +1,131 @@
+"""Benchmark: embedding inference backends.
+
+Compares chunk-encoding throughput, single-query latency, and cosine
+agreement with the fp32 PyTorch backend for each backend in
+EMBEDDING_BACKENDS, using the notes corpus as input.
+
+Usage:
+    uv run python -m benchmarks.embedding_backends
+    uv run python -m benchmarks.embedding_backends --backends torch torch-int8 --repeat 20
+    uv run python -m benchmarks.embedding_backends --backends torch onnx \\
+        --onnx-file onnx/model_qint8_avx512.onnx
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.config import get_settings
+from src.document_loader import load_and_chunk
+from src.embeddings import EMBEDDING_BACKENDS, EmbeddingModel
+
+QUERIES = [
+    "What is Project Alpha's deadline?",
+    "What was decided about the database migration?",
+    "How long should I proof sourdough?",
+    "What is gradient descent?",
+    "Who attended the January meeting?",
+]
+
+
+def _cosine_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity between two equally shaped matrices."""
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return np.sum(a * b, axis=1)
+
+
+def run_backend(
+    backend: str,
+    texts: list[str],
+    model_name: str,
+    onnx_file: str | None,
+    batch_size: int,
+) -> tuple[dict, np.ndarray]:
+    """Encode the corpus with one backend and return its stats and vectors."""
+    start = time.perf_counter()
+    model = EmbeddingModel(
+        model_name=model_name,
+        batch_size=batch_size,
+        backend=backend,
+        onnx_file=onnx_file,
+    )
+    load_seconds = time.perf_counter() - start
+
+    model.embed_texts_array(texts[:batch_size])  # warm-up
+    vectors = model.embed_texts_array(texts)
+    stats = model.last_encode_stats
+
+    latencies = []
+    for query in QUERIES * 5:
+        t0 = time.perf_counter()
+        model.embed_text_array(query)
+        latencies.append(time.perf_counter() - t0)
+
+    return {
+        "backend": backend,
+        "load_seconds": load_seconds,
+        "chunks": stats.count,
+        "chunks_per_second": stats.chunks_per_second,
+        "query_latency_ms_median": 1000 * statistics.median(latencies),
+    }, vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark embedding inference backends")
+    parser.add_argument("--backends", nargs="+", default=list(EMBEDDING_BACKENDS))
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Repeat the notes corpus this many times to get a stable throughput figure.",
+    )
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--onnx-file", default=None)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON.")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    chunks = load_and_chunk(settings.notes_dir, settings.chunk_size, settings.chunk_overlap)
+    # Suffix each repeat so no two texts are identical.
+    texts = [f"{c.text} ({i})" for i in range(args.repeat) for c in chunks]
+
+    reference: np.ndarray | None = None
+    results = []
+    for backend in ["torch", *[b for b in args.backends if b != "torch"]]:
+        stats, vectors = run_backend(
+            backend, texts, settings.embedding_model, args.onnx_file, args.batch_size
+        )
+        if reference is None:
+            reference = vectors
+        cosines = _cosine_rows(reference, vectors)
+        stats["cosine_vs_fp32_mean"] = float(cosines.mean())
+        stats["cosine_vs_fp32_min"] = float(cosines.min())
+        baseline_rate = results[0]["chunks_per_second"] if results else stats["chunks_per_second"]
+        stats["speedup_vs_fp32"] = stats["chunks_per_second"] / baseline_rate
+        results.append(stats)
+
+    print(f"\n{len(texts)} chunks, batch_size={args.batch_size}")
+    print(
+        f"{'backend':<12} {'load s':>7} {'chunks/s':>10} {'speedup':>8} "
+        f"{'query ms':>9} {'cos mean':>9} {'cos min':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['backend']:<12} {r['load_seconds']:>7.2f} {r['chunks_per_second']:>10.1f} "
+            f"{r['speedup_vs_fp32']:>7.2f}x {r['query_latency_ms_median']:>9.2f} "
+            f"{r['cosine_vs_fp32_mean']:>9.4f} {r['cosine_vs_fp32_min']:>8.4f}"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
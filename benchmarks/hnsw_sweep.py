@@ -0,0 +1,140 @@
+"""Benchmark: HNSW parameter sweep.
+
+Builds one collection per (m, ef_construct) pair and, for each query-time
+hnsw_ef, measures recall@k against exact search and latency percentiles.
+Configurations that no other configuration beats on both recall and p99
+latency are marked as Pareto-optimal.
+
+The corpus is synthetic and clustered by default; --vectors loads real
+embeddings from a .npy file and holds out --queries rows as queries.
+HNSW is only used by a Qdrant server; the in-memory client searches exactly.
+
+Usage:
+    docker run -p 6333:6333 qdrant/qdrant
+    uv run python -m benchmarks.hnsw_sweep
+    uv run python -m benchmarks.hnsw_sweep --m 8 16 32 --ef-construct 64 128 \\
+        --hnsw-ef 16 32 64 128 --size 100000 --output eval_results/hnsw_sweep.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks._common import (
+    exact_top_k,
+    recall_at_k,
+    synthetic_chunks,
+    synthetic_corpus,
+    timed,
+    wait_for_green,
+)
+from src.config import get_settings
+from src.vectorstore import VectorStore
+
+
+def load_corpus(args: argparse.Namespace) -> tuple[np.ndarray, np.ndarray]:
+    """Return (corpus, queries) as unit-length float32 arrays."""
+    if args.vectors is None:
+        return synthetic_corpus(args.size, args.dimension, args.queries)
+    vectors = np.load(args.vectors).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(vectors))
+    return vectors[order[args.queries :]], vectors[order[: args.queries]]
+
+
+def pareto_front(results: list[dict], recall_key: str) -> None:
+    """Mark results not dominated on (higher recall, lower p99 latency)."""
+    for r in results:
+        r["pareto"] = not any(
+            o[recall_key] >= r[recall_key]
+            and o["p99_ms"] <= r["p99_ms"]
+            and (o[recall_key] > r[recall_key] or o["p99_ms"] < r["p99_ms"])
+            for o in results
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep HNSW parameters")
+    parser.add_argument("--m", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--ef-construct", type=int, nargs="+", default=[100])
+    parser.add_argument("--hnsw-ef", type=int, nargs="+", default=[16, 32, 64, 128])
+    parser.add_argument("--url", default=None, help="Qdrant URL (default: QDRANT_URL).")
+    parser.add_argument("--memory", action="store_true", help="Use the in-memory client.")
+    parser.add_argument("--vectors", type=Path, default=None, help="Real embeddings (.npy).")
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON.")
+    args = parser.parse_args()
+
+    url = None if args.memory else (args.url or get_settings().qdrant_url)
+    corpus, queries = load_corpus(args)
+    expected = exact_top_k(corpus, queries, args.top_k)
+    recall_key = f"recall_at_{args.top_k}"
+
+    results = []
+    for m in args.m:
+        for ef_construct in args.ef_construct:
+            collection = f"bench_hnsw_m{m}_ef{ef_construct}"
+            store = VectorStore(
+                collection_name=collection,
+                url=url,
+                use_memory=args.memory,
+                embedding_dimension=corpus.shape[1],
+                hnsw_m=m,
+                hnsw_ef_construct=ef_construct,
+                upsert_batch_size=1024,
+                upsert_parallel=4,
+            )
+            store.delete_collection()
+            store.ensure_collection()
+            store.add_chunks(synthetic_chunks(len(corpus)), corpus)
+            wait_for_green(url, collection)
+
+            for hnsw_ef in args.hnsw_ef:
+
+                def search(query, store=store, hnsw_ef=hnsw_ef):
+                    hits = store.search(
+                        query, top_k=args.top_k, score_threshold=-1.0, hnsw_ef=hnsw_ef
+                    )
+                    return {r.chunk.chunk_index for r in hits}
+
+                search(queries[0])  # warm-up
+                found, latency = timed(search, queries)
+                results.append(
+                    {
+                        "m": m,
+                        "ef_construct": ef_construct,
+                        "hnsw_ef": hnsw_ef,
+                        recall_key: recall_at_k(expected, found),
+                        **latency,
+                    }
+                )
+            store.delete_collection()
+            store.close()
+
+    pareto_front(results, recall_key)
+    print(f"\n{len(corpus)} x {corpus.shape[1]}-dim vectors, {len(queries)} queries")
+    print(
+        f"{'m':>4} {'ef_constr':>10} {'hnsw_ef':>8} {'recall':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  pareto"
+    )
+    for r in results:
+        print(
+            f"{r['m']:>4} {r['ef_construct']:>10} {r['hnsw_ef']:>8} {r[recall_key]:>7.3f} "
+            f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f}  "
+            f"{'*' if r['pareto'] else ''}"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
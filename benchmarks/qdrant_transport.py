@@ -0,0 +1,103 @@
+"""Benchmark: REST vs gRPC transport to a remote Qdrant server.
+
+For each transport, uploads a synthetic corpus into a fresh collection and
+reports bulk upsert throughput, then single-query search latency
+percentiles. REST sends every vector as a JSON float list; gRPC sends packed
+floats, which mostly shows up in upsert throughput and in the latency tail.
+
+Only meaningful against a server: embedded clients have no transport.
+
+Usage:
+    docker run -p 6333:6333 -p 6334:6334 qdrant/qdrant
+    uv run python -m benchmarks.qdrant_transport
+    uv run python -m benchmarks.qdrant_transport --size 100000 --upsert-parallel 4 \\
+        --pool-size 8 --output eval_results/qdrant_transport.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from benchmarks._common import synthetic_chunks, synthetic_corpus, timed, wait_for_green
+from src.config import get_settings
+from src.vectorstore import VectorStore
+
+TRANSPORTS = ("rest", "grpc")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Qdrant REST vs gRPC transport")
+    parser.add_argument("--transports", nargs="+", default=list(TRANSPORTS), choices=TRANSPORTS)
+    parser.add_argument("--url", default=None, help="Qdrant URL (default: QDRANT_URL).")
+    parser.add_argument("--grpc-port", type=int, default=None, help="Default: QDRANT_GRPC_PORT.")
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--upsert-batch-size", type=int, default=256)
+    parser.add_argument("--upsert-parallel", type=int, default=1)
+    parser.add_argument("--pool-size", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON.")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    url = args.url or settings.qdrant_url
+    corpus, queries = synthetic_corpus(args.size, args.dimension, args.queries)
+
+    results = []
+    for transport in args.transports:
+        collection = f"bench_transport_{transport}"
+        store = VectorStore(
+            collection_name=collection,
+            url=url,
+            use_memory=False,
+            embedding_dimension=args.dimension,
+            upsert_batch_size=args.upsert_batch_size,
+            upsert_parallel=args.upsert_parallel,
+            prefer_grpc=transport == "grpc",
+            grpc_port=args.grpc_port or settings.qdrant_grpc_port,
+            pool_size=args.pool_size,
+        )
+        store.delete_collection()
+        store.ensure_collection()
+        store.add_chunks(synthetic_chunks(args.size), corpus)
+        upsert = store.last_upsert_stats
+        wait_for_green(url, collection)
+
+        def search(query, store=store):
+            hits = store.search(query, top_k=args.top_k, score_threshold=-1.0)
+            return {r.chunk.chunk_index for r in hits}
+
+        for query in queries[:20]:  # warm up connections
+            search(query)
+        _, latency = timed(search, queries)
+        results.append(
+            {
+                "transport": transport,
+                "upsert_seconds": upsert.seconds,
+                "upsert_points_per_second": upsert.points_per_second,
+                **latency,
+            }
+        )
+        store.delete_collection()
+        store.close()
+
+    print(
+        f"\n{args.size} x {args.dimension}-dim vectors, batch {args.upsert_batch_size}, "
+        f"parallel {args.upsert_parallel}, {args.queries} queries"
+    )
+    print(f"{'transport':<10} {'upsert pts/s':>13} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for r in results:
+        print(
+            f"{r['transport']:<10} {r['upsert_points_per_second']:>13.0f} {r['p50_ms']:>8.2f} "
+            f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f}"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark: Qdrant vector quantization.
+
+Builds one collection per quantization method over a synthetic clustered
+corpus and compares recall@k against exact search, search latency
+percentiles, and the RAM needed for the vectors searched in memory.
+
+Quantization only takes effect on a Qdrant server; the in-memory client
+accepts the configuration but always searches the original vectors.
+
+Usage:
+    docker run -p 6333:6333 qdrant/qdrant
+    uv run python -m benchmarks.quantization
+    uv run python -m benchmarks.quantization --size 100000 --oversampling 3 \\
+        --output eval_results/quantization.json
+"""
+
+import argparse
+import json
+import math
+from pathlib import Path
+
+from benchmarks._common import (
+    exact_top_k,
+    recall_at_k,
+    synthetic_chunks,
+    synthetic_corpus,
+    timed,
+    wait_for_green,
+)
+from src.config import get_settings
+from src.vectorstore import QUANTIZATION_METHODS, VectorStore
+
+
+def vector_ram_bytes(method: str, size: int, dimension: int) -> int:
+    """Bytes of vector data Qdrant keeps in RAM for a collection."""
+    if method == "scalar":
+        return size * dimension
+    if method == "binary":
+        return size * math.ceil(dimension / 8)
+    return size * dimension * 4
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Qdrant quantization")
+    parser.add_argument("--methods", nargs="+", default=list(QUANTIZATION_METHODS))
+    parser.add_argument("--url", default=None, help="Qdrant URL (default: QDRANT_URL).")
+    parser.add_argument("--memory", action="store_true", help="Use the in-memory client.")
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--oversampling", type=float, default=2.0)
+    parser.add_argument("--no-rescore", action="store_true")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON.")
+    args = parser.parse_args()
+
+    url = None if args.memory else (args.url or get_settings().qdrant_url)
+    corpus, queries = synthetic_corpus(args.size, args.dimension, args.queries)
+    expected = exact_top_k(corpus, queries, args.top_k)
+
+    results = []
+    for method in args.methods:
+        collection = f"bench_quantization_{method}"
+        store = VectorStore(
+            collection_name=collection,
+            url=url,
+            use_memory=args.memory,
+            embedding_dimension=args.dimension,
+            quantization=method,
+            oversampling=args.oversampling,
+            rescore=not args.no_rescore,
+            upsert_batch_size=1024,
+            upsert_parallel=4,
+        )
+        store.delete_collection()
+        store.ensure_collection()
+        store.add_chunks(synthetic_chunks(args.size), corpus)
+        wait_for_green(url, collection)
+
+        def search(query, store=store):
+            hits = store.search(query, top_k=args.top_k, score_threshold=-1.0)
+            return {r.chunk.chunk_index for r in hits}
+
+        search(queries[0])  # warm-up
+        found, latency = timed(search, queries)
+        results.append(
+            {
+                "method": method,
+                f"recall_at_{args.top_k}": recall_at_k(expected, found),
+                **latency,
+                "vector_ram_mb": vector_ram_bytes(method, args.size, args.dimension) / 2**20,
+            }
+        )
+        store.delete_collection()
+        store.close()
+
+    baseline_ram = vector_ram_bytes("none", args.size, args.dimension) / 2**20
+    print(f"\n{args.size} x {args.dimension}-dim vectors, {args.queries} queries")
+    print(
+        f"{'method':<8} {'recall':>7} {'p50 ms':>8} {'p99 ms':>8} {'vector MB':>10} {'saving':>7}"
+    )
+    for r in results:
+        print(
+            f"{r['method']:<8} {r[f'recall_at_{args.top_k}']:>7.3f} {r['p50_ms']:>8.2f} "
+            f"{r['p99_ms']:>8.2f} {r['vector_ram_mb']:>10.1f} "
+            f"{baseline_ram / r['vector_ram_mb']:>6.0f}x"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
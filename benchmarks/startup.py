@@ -0,0 +1,90 @@
+"""Benchmark: CLI/API cold start.
+
+Breaks cold start down into module import, embedding model load, indexing,
+agent construction, and the first retrieval query. Each mode runs in a
+fresh interpreter so import costs are measured from scratch.
+
+Modes:
+    eager  - model loaded at startup (default configuration)
+    lazy   - EMBEDDING_LAZY_LOAD: model loaded on first encode; with a warm
+             embedding cache, startup needs no model at all
+
+Usage:
+    uv run python -m benchmarks.startup
+    uv run python -m benchmarks.startup --modes lazy --runs 3 --output eval_results/startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PHASES = ["import", "model_load", "indexing", "agents", "first_query", "total"]
+
+
+def _child(lazy: bool) -> None:
+    """Measure one cold start in this (fresh) process and print JSON."""
+    start = time.perf_counter()
+    from src.config import get_settings
+    from src.pipeline import build_pipeline
+
+    timings = {"import": time.perf_counter() - start}
+
+    settings = get_settings()
+    settings.bookmark_sync_enabled = False
+    settings.embedding_lazy_load = lazy
+    agent = build_pipeline(settings, timings=timings)
+
+    query_start = time.perf_counter()
+    query_embedding = agent.embedding_model.embed_text_array("What is Project Alpha's deadline?")
+    agent.vectorstore.search(query_embedding, top_k=5)
+    timings["first_query"] = time.perf_counter() - query_start
+    timings["total"] = time.perf_counter() - start
+    print(json.dumps(timings))
+
+
+def _run_mode(mode: str) -> dict[str, float]:
+    """Run one cold start for a mode in a subprocess and return its timings."""
+    cmd = [sys.executable, "-m", "benchmarks.startup", "--child"]
+    if mode == "lazy":
+        cmd.append("--lazy")
+    output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start phases")
+    parser.add_argument("--modes", nargs="+", default=["eager", "lazy"], choices=["eager", "lazy"])
+    parser.add_argument(
+        "--runs", type=int, default=3, help="Cold starts per mode (median reported)."
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--lazy", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.lazy)
+        return
+
+    results = {}
+    for mode in args.modes:
+        runs = [_run_mode(mode) for _ in range(args.runs)]
+        results[mode] = {phase: statistics.median(r[phase] for r in runs) for phase in PHASES}
+
+    print(f"\nMedian of {args.runs} cold starts (seconds)")
+    print(f"{'mode':<8}" + "".join(f"{phase:>13}" for phase in PHASES))
+    for mode, timings in results.items():
+        print(f"{mode:<8}" + "".join(f"{timings[phase]:>13.2f}" for phase in PHASES))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
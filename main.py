@@ -4,8 +4,8 @@ import argparse
 
 from src.config import get_settings
 from src.memory import ConversationMemory
-from src.models import QueryResult
-from src.pipeline import build_pipeline
+from src.models import SOURCE_TYPES, QueryResult
+from src.pipeline import build_pipeline, export_index, rollback_index
 from src.tracing import setup_tracing
 
 
@@ -33,6 +33,21 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Clear all indexed data and reindex notes and bookmarks from scratch.",
     )
+    parser.add_argument(
+        "--reindex-source",
+        choices=SOURCE_TYPES,
+        help="Clear and reindex one source type only (needs PER_SOURCE_COLLECTIONS=true).",
+    )
+    parser.add_argument(
+        "--rollback-index",
+        action="store_true",
+        help="Serve the Qdrant collection from before the last reindex again and exit.",
+    )
+    parser.add_argument(
+        "--export-index",
+        metavar="DIR",
+        help="Embed all notes and bookmarks into a portable index artifact in DIR and exit.",
+    )
     parser.add_argument("question", nargs="*", help="Question to ask (interactive mode if omitted)")
     return parser.parse_args()
 
@@ -44,11 +59,21 @@ def main():
     setup_tracing()
 
     print("Personal KB - Second Brain")
+    if args.rollback_index:
+        for alias, collection in rollback_index(settings).items():
+            print(f"{alias} now serves {collection}")
+        return
+    if args.export_index:
+        manifest = export_index(settings, args.export_index)
+        print(f"Exported {manifest['count']} chunks to {args.export_index}")
+        return
     if args.reindex:
         print("Reindexing all data from scratch...")
+    elif args.reindex_source:
+        print(f"Reindexing {args.reindex_source} data from scratch...")
     print("Loading knowledge base...")
 
-    agent = build_pipeline(settings, reindex=args.reindex)
+    agent = build_pipeline(settings, reindex=args.reindex, reindex_source=args.reindex_source)
 
     print("Ready for questions!")
 
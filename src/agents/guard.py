@@ -1,5 +1,7 @@
 """Guard Agent — validates inputs and outputs for safety and relevance."""
 
+from functools import cached_property
+
 from pydantic import BaseModel
 
 from src.config import get_settings
@@ -48,10 +50,18 @@ class GuardAgent:
     """
 
     def __init__(self):
-        self._input_agent = self._create_input_agent()
-        self._output_agent = self._create_output_agent()
         self._settings = get_settings()
 
+    @cached_property
+    def _input_agent(self):
+        """Input-validation Agent, built on first use."""
+        return self._create_input_agent()
+
+    @cached_property
+    def _output_agent(self):
+        """Output-validation Agent, built on first use."""
+        return self._create_output_agent()
+
     @staticmethod
     def _create_input_agent():
         """Create the pydantic-ai Agent for input validation."""
@@ -10,8 +10,8 @@ from src.agents.research import ResearchAgent
 from src.agents.retrieval import RetrievalAgent, RetrievalDeps
 from src.config import get_settings
 from src.embeddings import EmbeddingModel
-from src.models import QueryResult, SearchResult
-from src.vectorstore import VectorStore
+from src.models import QueryResult, SearchFilter, SearchResult
+from src.partitioned_store import AnyVectorStore
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +29,7 @@ class OrchestratorAgent:
 
     def __init__(
         self,
-        vectorstore: VectorStore,
+        vectorstore: AnyVectorStore,
         embedding_model: EmbeddingModel,
     ):
         self._settings = get_settings()
@@ -45,7 +45,7 @@ class OrchestratorAgent:
         self._guard_agent = GuardAgent() if self._settings.guardrails_enabled else None
 
     @property
-    def vectorstore(self) -> VectorStore:
+    def vectorstore(self) -> AnyVectorStore:
         """Access the vector store."""
         return self._vectorstore
 
@@ -54,6 +54,18 @@ class OrchestratorAgent:
         """Access the embedding model."""
         return self._embedding_model
 
+    def metrics(self) -> dict[str, dict[str, float]]:
+        """Return runtime metrics for the retrieval path."""
+        metrics = {"embedding_dispatcher": self._retrieval_agent.dispatcher.metrics.as_dict()}
+        if self._retrieval_agent.query_cache is not None:
+            metrics["query_cache"] = self._retrieval_agent.query_cache.stats()
+        return metrics
+
+    async def aclose(self) -> None:
+        """Stop the query embedding dispatcher and close the vector store's async client."""
+        await self._retrieval_agent.dispatcher.close()
+        await self._vectorstore.aclose()
+
     @staticmethod
     def _filter_cited_sources(
         cited_sources: list[str],
@@ -94,12 +106,15 @@ class OrchestratorAgent:
         self,
         question: str,
         message_history: Sequence[ModelMessage] | None = None,
+        search_filter: SearchFilter | None = None,
     ) -> QueryResult:
         """Process a question through the multi-agent pipeline (sync).
 
         Args:
             question: The user's question.
             message_history: Optional conversation history for follow-up context.
+            search_filter: Optional restriction of retrieval by source type,
+                source or date.
 
         Returns:
             A QueryResult with the answer and source documents.
@@ -116,7 +131,7 @@ class OrchestratorAgent:
                 return QueryResult(answer=verdict.reason, sources=[])
 
         # Step 2: Retrieve relevant chunks
-        search_results = self._retrieval_agent.search(question)
+        search_results = self._retrieval_agent.search(question, search_filter)
         context = self._retrieval_agent.format_results(search_results)
 
         # Step 3: Synthesize answer with conversation history
@@ -150,12 +165,15 @@ class OrchestratorAgent:
         self,
         question: str,
         message_history: Sequence[ModelMessage] | None = None,
+        search_filter: SearchFilter | None = None,
     ) -> QueryResult:
         """Process a question through the multi-agent pipeline (async).
 
         Args:
             question: The user's question.
             message_history: Optional conversation history for follow-up context.
+            search_filter: Optional restriction of retrieval by source type,
+                source or date.
 
         Returns:
             A QueryResult with the answer and source documents.
@@ -172,7 +190,7 @@ class OrchestratorAgent:
                 return QueryResult(answer=verdict.reason, sources=[])
 
         # Step 2: Retrieve relevant chunks
-        search_results = self._retrieval_agent.search(question)
+        search_results = await self._retrieval_agent.search_async(question, search_filter)
         context = self._retrieval_agent.format_results(search_results)
 
         # Step 3: Synthesize answer with conversation history
@@ -1,6 +1,7 @@
 """Research Agent — synthesizes answers from retrieved chunks with citations."""
 
 from collections.abc import Sequence
+from functools import cached_property
 
 from pydantic_ai import RunContext
 from pydantic_ai.messages import ModelMessage
@@ -52,8 +53,10 @@ class ResearchAgent:
     validator that ensures sources are cited when context is available.
     """
 
-    def __init__(self):
-        self._agent = self._create_agent()
+    @cached_property
+    def _agent(self):
+        """Synthesis Agent, built on first use."""
+        return self._create_agent()
 
     @staticmethod
     def _create_agent():
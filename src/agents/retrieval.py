@@ -1,18 +1,27 @@
 """Retrieval Agent — searches the vector store for relevant chunks."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
-from src.config import get_settings
+import numpy as np
+
+from src.config import Settings, get_settings
+from src.diversity import mmr_select
+from src.embedding_cache import QueryEmbeddingCache
+from src.embedding_dispatcher import EmbeddingDispatcher
 from src.embeddings import EmbeddingModel
-from src.models import SearchResult
-from src.vectorstore import VectorStore
+from src.models import SearchFilter, SearchResult
+from src.partitioned_store import AnyVectorStore
+
+# Results returned per query.
+TOP_K = 5
 
 
 @dataclass
 class RetrievalDeps:
     """Dependencies for the retrieval agent."""
 
-    vectorstore: VectorStore
+    vectorstore: AnyVectorStore
     embedding_model: EmbeddingModel
 
 
@@ -24,14 +33,46 @@ class RetrievalAgent:
     """
 
     def __init__(self, deps: RetrievalDeps):
-        self._agent = self._create_agent()
+        settings = get_settings()
         self._deps = deps
+        self._dispatcher = EmbeddingDispatcher(
+            deps.embedding_model,
+            max_wait_ms=settings.query_batch_wait_ms,
+            max_batch_size=settings.query_batch_max_size,
+        )
+        self._query_cache = (
+            QueryEmbeddingCache(
+                max_size=settings.query_cache_size,
+                ttl_seconds=settings.query_cache_ttl_seconds or None,
+            )
+            if settings.query_cache_size > 0
+            else None
+        )
 
     @property
     def deps(self) -> RetrievalDeps:
         """Access the agent's dependencies."""
         return self._deps
 
+    @property
+    def dispatcher(self) -> EmbeddingDispatcher:
+        """Access the micro-batching dispatcher used by search_async."""
+        return self._dispatcher
+
+    @property
+    def query_cache(self) -> QueryEmbeddingCache | None:
+        """Access the query embedding cache (None when disabled)."""
+        return self._query_cache
+
+    @cached_property
+    def _agent(self):
+        """Tool-calling retrieval Agent, built on first use.
+
+        The orchestrator calls search()/search_async() directly, so in the
+        normal pipeline this is never constructed.
+        """
+        return self._create_agent()
+
     @staticmethod
     def _create_agent():
         """Create the pydantic-ai Agent for retrieval."""
@@ -60,10 +101,10 @@ class RetrievalAgent:
                 Formatted string of relevant chunks with their sources.
             """
             deps = ctx.deps
-            query_embedding = deps.embedding_model.embed_text(query)
+            query_embedding = deps.embedding_model.embed_text_array(query)
             results = deps.vectorstore.search(
                 query_embedding,
-                top_k=5,
+                top_k=TOP_K,
                 score_threshold=settings.search_score_threshold,
             )
 
@@ -78,25 +119,140 @@ class RetrievalAgent:
 
         return agent
 
-    def search(self, query: str) -> list[SearchResult]:
+    def _cached_query_embedding(self, query: str) -> np.ndarray | None:
+        """Look up a query embedding in the LRU cache, if enabled."""
+        if self._query_cache is None:
+            return None
+        return self._query_cache.get(query)
+
+    def _cache_query_embedding(self, query: str, embedding: np.ndarray) -> None:
+        """Store a freshly computed query embedding, if caching is enabled."""
+        if self._query_cache is not None:
+            self._query_cache.put(query, embedding)
+
+    @staticmethod
+    def _fetch_k(settings: Settings) -> int:
+        """Number of candidates to fetch from the vector store per query."""
+        return max(settings.mmr_fetch_k, TOP_K) if settings.mmr_enabled else TOP_K
+
+    @staticmethod
+    def _diversify(
+        settings: Settings, query_embedding: np.ndarray, results: list[SearchResult]
+    ) -> list[SearchResult]:
+        """Re-select a diverse top-k with MMR, if enabled."""
+        if not settings.mmr_enabled:
+            return results
+        return mmr_select(
+            query_embedding,
+            results,
+            TOP_K,
+            lambda_mult=settings.mmr_lambda,
+            max_per_source=settings.mmr_max_per_source,
+        )
+
+    def search(self, query: str, search_filter: SearchFilter | None = None) -> list[SearchResult]:
         """Search the knowledge base directly (without LLM).
 
         This bypasses the LLM and performs a direct vector search,
-        used by the orchestrator to get raw results.
+        used by the orchestrator to get raw results. Repeated queries are
+        served from the query embedding cache without a forward pass. With
+        MMR enabled, MMR_FETCH_K candidates are fetched and a diverse top-k
+        is kept.
+
+        Args:
+            query: The search query.
+            search_filter: Optional restriction by source type, source or
+                date, applied inside the vector store.
+
+        Returns:
+            List of SearchResult objects with relevance scores.
+        """
+        settings = get_settings()
+        query_embedding = self._cached_query_embedding(query)
+        if query_embedding is None:
+            query_embedding = self._deps.embedding_model.embed_text_array(query)
+            self._cache_query_embedding(query, query_embedding)
+        results = self._deps.vectorstore.search(
+            query_embedding,
+            top_k=self._fetch_k(settings),
+            score_threshold=settings.search_score_threshold,
+            search_filter=search_filter,
+            query_text=query,
+            with_vectors=settings.mmr_enabled,
+        )
+        return self._diversify(settings, query_embedding, results)
+
+    async def search_async(
+        self, query: str, search_filter: SearchFilter | None = None
+    ) -> list[SearchResult]:
+        """Search the knowledge base directly (async, without LLM).
+
+        The query embedding is computed through the micro-batching
+        dispatcher, so concurrent requests share one encode call that runs
+        off the event loop, and the vector search uses the store's async
+        client, so neither blocks other requests.
 
         Args:
             query: The search query.
+            search_filter: Optional restriction by source type, source or
+                date, applied inside the vector store.
 
         Returns:
             List of SearchResult objects with relevance scores.
         """
         settings = get_settings()
-        query_embedding = self._deps.embedding_model.embed_text(query)
-        return self._deps.vectorstore.search(
+        query_embedding = self._cached_query_embedding(query)
+        if query_embedding is None:
+            query_embedding = await self._dispatcher.embed(query)
+            self._cache_query_embedding(query, query_embedding)
+        results = await self._deps.vectorstore.asearch(
             query_embedding,
-            top_k=5,
+            top_k=self._fetch_k(settings),
+            score_threshold=settings.search_score_threshold,
+            search_filter=search_filter,
+            query_text=query,
+            with_vectors=settings.mmr_enabled,
+        )
+        return self._diversify(settings, query_embedding, results)
+
+    def search_batch(
+        self, queries: list[str], search_filter: SearchFilter | None = None
+    ) -> list[list[SearchResult]]:
+        """Search the knowledge base for several queries at once (without LLM).
+
+        Uncached queries are embedded in one encode call and all queries are
+        sent to the vector store in a single batch request.
+
+        Args:
+            queries: The search queries.
+            search_filter: Optional restriction by source type, source or
+                date, applied to every query.
+
+        Returns:
+            One list of SearchResult objects per query, in query order.
+        """
+        if not queries:
+            return []
+        settings = get_settings()
+        embeddings = [self._cached_query_embedding(query) for query in queries]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = self._deps.embedding_model.embed_queries_array([queries[i] for i in missing])
+            for i, embedding in zip(missing, computed, strict=True):
+                embeddings[i] = embedding
+                self._cache_query_embedding(queries[i], embedding)
+        batches = self._deps.vectorstore.search_batch(
+            np.stack(embeddings),
+            top_k=self._fetch_k(settings),
             score_threshold=settings.search_score_threshold,
+            search_filter=search_filter,
+            query_texts=queries,
+            with_vectors=settings.mmr_enabled,
         )
+        return [
+            self._diversify(settings, embedding, results)
+            for embedding, results in zip(embeddings, batches, strict=True)
+        ]
 
     def format_results(self, results: list[SearchResult]) -> str:
         """Format search results into a string for the research agent.
@@ -15,12 +15,85 @@ class Settings(BaseSettings):
     # Embeddings
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
     embedding_dimension: int = 384
+    embedding_backend: str = "torch"  # "torch", "torch-int8", or "onnx"
+    embedding_onnx_file: str = ""  # e.g. "onnx/model_qint8_avx512.onnx"; empty = default
+    embedding_lazy_load: bool = False  # load the model on first encode instead of at startup
+    embedding_cache_enabled: bool = True
+    embedding_cache_path: str = "data/embedding_cache.sqlite"
+    embedding_cache_max_entries: int = 200_000
+    embedding_batch_size: int = 32
+    embedding_workers: int = 0  # >1 starts a multi-process pool for bulk encoding
+    embedding_reduction: str = "none"  # "none", "pca", or "truncate"
+    embedding_reduced_dimension: int = 128
+    embedding_projection_path: str = "data/embedding_projection.npz"
+
+    # Vector store: "qdrant", or "numpy" for in-process exact search
+    vector_store_backend: str = "qdrant"
+    numpy_store_path: str = ""  # directory for the numpy index; empty = in-memory only
+    # One collection (or numpy index) per source type, searched concurrently. Overrides
+    # of qdrant_* settings per source type, e.g. {"bookmark": {"qdrant_quantization": "scalar"}}
+    per_source_collections: bool = False
+    source_collection_settings: dict[str, dict] = {}
 
     # Qdrant
     qdrant_url: str = "http://localhost:6333"
     qdrant_collection: str = "personal_kb"
     qdrant_use_memory: bool = True
+    # Serve the collection through an alias of versioned collections: --reindex builds a
+    # new version and switches the alias when done, keeping previous ones for rollback.
+    # Opt-in: an existing plain collection is replaced by the alias on its next rebuild.
+    qdrant_use_alias: bool = False
+    qdrant_keep_previous_collections: int = 1
+    qdrant_path: str = ""  # embedded on-disk storage, e.g. "data/qdrant"; overrides the above
+    index_manifest_path: str = "data/index_manifest.json"
+    index_artifact_path: str = ""  # prebuilt index from main.py --export-index; skips embedding
+    docstore_path: str = ""  # SQLite file for chunk text; empty keeps it in the Qdrant payload
     search_score_threshold: float = 0.1
+    qdrant_upsert_batch_size: int = 256  # points per upsert request when indexing
+    qdrant_upsert_parallel: int = 1  # upsert requests in flight (remote server only)
+    # Vector quantization for new collections: "none", "scalar" (int8), or "binary".
+    # Original vectors move to disk and are used to rescore oversampled candidates.
+    qdrant_quantization: str = "none"
+    qdrant_quantization_always_ram: bool = True
+    qdrant_search_oversampling: float = 2.0
+    qdrant_search_rescore: bool = True
+    # HNSW index: graph degree and build beam width for new collections, and the
+    # query-time beam width (0 = Qdrant default). See benchmarks/hnsw_sweep.py.
+    qdrant_hnsw_m: int = 16
+    qdrant_hnsw_ef_construct: int = 100
+    qdrant_hnsw_ef: int = 0
+    # Disk-resident collections (new collections only): memory-mapped vectors and HNSW
+    # graph, and payloads read from disk, so RAM use no longer grows with the corpus.
+    # See benchmarks/disk_resident.py.
+    qdrant_on_disk_vectors: bool = False
+    qdrant_on_disk_hnsw: bool = False
+    qdrant_on_disk_payload: bool = False
+    # Remote server transport: gRPC sends vectors as packed floats instead of JSON.
+    # Timeout and pool size 0 use the client defaults. See benchmarks/qdrant_transport.py.
+    qdrant_prefer_grpc: bool = False
+    qdrant_grpc_port: int = 6334
+    qdrant_timeout: int = 0  # seconds per request
+    qdrant_pool_size: int = 0  # connections (REST) or channels (gRPC)
+
+    # Hybrid retrieval: BM25 sparse search fused with dense search by reciprocal rank
+    # fusion. Existing Qdrant collections stay dense-only until --reindex adds sparse vectors.
+    hybrid_search_enabled: bool = False
+    hybrid_prefetch_k: int = 20  # candidates from each of the dense and sparse searches
+
+    # Maximal marginal relevance: over-fetch, then pick a diverse top-k so overlapping
+    # neighbouring chunks of one file do not fill the results.
+    mmr_enabled: bool = False
+    mmr_lambda: float = 0.7  # 1.0 = relevance only, 0.0 = diversity only
+    mmr_fetch_k: int = 20  # candidates fetched before re-selection
+    mmr_max_per_source: int = 0  # results allowed from one file or URL (0 = no cap)
+
+    # Query embedding micro-batching (async API path)
+    query_batch_wait_ms: float = 5.0
+    query_batch_max_size: int = 64
+
+    # Query embedding LRU cache (size 0 disables, TTL 0 means no expiry)
+    query_cache_size: int = 1024
+    query_cache_ttl_seconds: float = 0.0
 
     # Chunking
     chunk_size: int = 500
@@ -0,0 +1,74 @@
+"""Maximal marginal relevance (MMR) re-selection of search results.
+
+Chunks overlap by CHUNK_OVERLAP characters, so a plain top-k often holds
+neighbouring chunks of one file with nearly the same text. MMR over-fetches
+candidates and then picks results one at a time, trading relevance to the
+query against similarity to the results already picked.
+"""
+
+from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.models import SearchResult
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def mmr_select(
+    query_embedding: np.ndarray | Sequence[float],
+    results: Sequence[SearchResult],
+    top_k: int,
+    lambda_mult: float = 0.7,
+    max_per_source: int = 0,
+) -> list[SearchResult]:
+    """Pick a diverse top-k from over-fetched search results.
+
+    Each step picks the candidate maximizing
+    ``lambda_mult * sim(query, c) - (1 - lambda_mult) * max sim(c, picked)``,
+    with cosine similarity computed from the stored vectors.
+
+    Args:
+        query_embedding: The query embedding the results were searched with.
+        results: Candidates, fetched with with_vectors=True.
+        top_k: Number of results to return.
+        lambda_mult: 1.0 ranks by relevance only, 0.0 by diversity only.
+        max_per_source: Maximum results taken from one source (0 = no cap).
+
+    Returns:
+        Up to top_k results in selection order, keeping their search scores.
+
+    Raises:
+        ValueError: If a candidate has no stored vector.
+    """
+    if not results or top_k <= 0:
+        return []
+    if any(r.embedding is None for r in results):
+        raise ValueError("MMR needs search results fetched with with_vectors=True.")
+
+    vectors = _normalize(np.asarray([r.embedding for r in results], dtype=np.float32))
+    query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+    relevance = vectors @ query
+    redundancy = np.full(len(results), -np.inf, dtype=np.float32)
+    available = np.ones(len(results), dtype=bool)
+    per_source: Counter[str] = Counter()
+
+    picked: list[SearchResult] = []
+    while len(picked) < top_k and available.any():
+        penalty = np.where(np.isfinite(redundancy), redundancy, 0.0)
+        mmr = lambda_mult * relevance - (1 - lambda_mult) * penalty
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        available[best] = False
+        source = results[best].chunk.source
+        if max_per_source and per_source[source] >= max_per_source:
+            continue
+        per_source[source] += 1
+        picked.append(results[best])
+        redundancy = np.maximum(redundancy, vectors @ vectors[best])
+    return picked
@@ -0,0 +1,106 @@
+"""SQLite docstore holding chunk text and metadata outside the vector index.
+
+With a docstore, Qdrant points carry only the fields used for filtering, and
+VectorStore.search hydrates the top-k results from here in one query. This
+keeps chunk text out of the collection's memory and out of search responses.
+"""
+
+import sqlite3
+import threading
+from collections.abc import Collection, Sequence
+from pathlib import Path
+
+from src.models import Chunk
+from src.sqlite_lookup import select_in
+
+
+class ChunkDocstore:
+    """On-disk mapping of point ID to chunk, backed by a single SQLite file."""
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the docstore database.
+
+        Args:
+            path: Path to the SQLite docstore file.
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS chunks (id TEXT PRIMARY KEY, chunk TEXT)")
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        """Return the number of stored chunks."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def put_many(self, ids: Sequence[str], chunks: Sequence[Chunk]) -> None:
+        """Store chunks under their point IDs, replacing existing entries.
+
+        Args:
+            ids: Point IDs of the chunks.
+            chunks: Chunks to store, in ID order.
+        """
+        rows = [(id_, chunk.model_dump_json()) for id_, chunk in zip(ids, chunks, strict=True)]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO chunks (id, chunk) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def get_many(self, ids: Sequence[str]) -> dict[str, Chunk]:
+        """Look up chunks by point ID.
+
+        Args:
+            ids: Point IDs to look up.
+
+        Returns:
+            Mapping from point ID to chunk. IDs missing from the docstore are
+            missing from the mapping.
+        """
+        unique = list(dict.fromkeys(ids))
+        found: dict[str, Chunk] = {}
+        with self._lock:
+            rows = select_in(
+                self._conn, "SELECT id, chunk FROM chunks WHERE id IN ({placeholders})", unique
+            )
+            for id_, data in rows:
+                found[id_] = Chunk.model_validate_json(data)
+        return found
+
+    def delete_many(self, ids: Sequence[str]) -> None:
+        """Delete chunks by point ID. Unknown IDs are ignored.
+
+        Args:
+            ids: Point IDs to delete.
+        """
+        with self._lock:
+            self._conn.executemany("DELETE FROM chunks WHERE id = ?", [(id_,) for id_ in ids])
+            self._conn.commit()
+
+    def prune(self, keep: Collection[str]) -> int:
+        """Delete every chunk whose point ID is not in keep.
+
+        Args:
+            keep: Point IDs still referenced by a collection.
+
+        Returns:
+            Number of chunks deleted.
+        """
+        with self._lock:
+            unreferenced = [
+                (id_,) for (id_,) in self._conn.execute("SELECT id FROM chunks") if id_ not in keep
+            ]
+            self._conn.executemany("DELETE FROM chunks WHERE id = ?", unreferenced)
+            self._conn.commit()
+        return len(unreferenced)
+
+    def clear(self) -> None:
+        """Delete all chunks."""
+        with self._lock:
+            self._conn.execute("DELETE FROM chunks")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -95,6 +95,8 @@ def chunk_document(
                 text=chunk_text,
                 source=document.source,
                 chunk_index=chunk_index,
+                source_type=document.source_type,
+                date_added=document.date_added,
             )
         )
 
@@ -0,0 +1,228 @@
+"""Caches for embedding vectors: persistent chunk cache and in-process query LRU."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from src.sqlite_lookup import select_in
+
+
+def text_hash(text: str) -> str:
+    """Return the content hash used as the cache key for a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk embedding cache keyed by (model name, text hash).
+
+    Vectors are stored as float32 blobs in a single SQLite file. When the
+    number of entries exceeds max_entries, the least recently used entries
+    are evicted. Hit and miss counters are kept for the lifetime of the
+    instance.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 200_000):
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite cache file.
+            max_entries: Maximum number of vectors to keep before evicting.
+        """
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used)"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, model: str, texts: Sequence[str]) -> dict[int, np.ndarray]:
+        """Look up cached vectors for a batch of texts.
+
+        Args:
+            model: Embedding model identifier the vectors were produced with.
+            texts: Texts to look up.
+
+        Returns:
+            Mapping from position in texts to the cached vector. Positions
+            missing from the mapping are cache misses.
+        """
+        hashes = [text_hash(t) for t in texts]
+        unique = list(dict.fromkeys(hashes))
+        found: dict[str, np.ndarray] = {}
+
+        with self._lock:
+            rows = select_in(
+                self._conn,
+                "SELECT text_hash, vector FROM embeddings "
+                "WHERE model = ? AND text_hash IN ({placeholders})",
+                unique,
+                [model],
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+
+            if found:
+                now = time.time_ns()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model = ? AND text_hash = ?",
+                    [(now, model, key) for key in found],
+                )
+                self._conn.commit()
+
+            result = {i: found[h] for i, h in enumerate(hashes) if h in found}
+            self.hits += len(result)
+            self.misses += len(texts) - len(result)
+        return result
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[np.ndarray]) -> None:
+        """Store vectors for a batch of texts, evicting old entries if needed.
+
+        Args:
+            model: Embedding model identifier the vectors were produced with.
+            texts: Texts the vectors were computed from.
+            vectors: Corresponding embedding vectors.
+        """
+        now = time.time_ns()
+        rows = [
+            (model, text_hash(t), np.asarray(v, dtype=np.float32).tobytes(), now)
+            for t, v in zip(texts, vectors)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, vector, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries above max_entries (caller holds the lock)."""
+        overflow = self._count() - self._max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE rowid IN "
+                "(SELECT rowid FROM embeddings ORDER BY last_used LIMIT ?)",
+                (overflow,),
+            )
+
+    def _count(self) -> int:
+        """Return the number of cached vectors (caller holds the lock)."""
+        return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def normalize_query(text: str) -> str:
+    """Normalize a query for cache lookup by trimming and collapsing whitespace."""
+    return " ".join(text.split())
+
+
+class QueryEmbeddingCache:
+    """Bounded in-process LRU of query embeddings, with an optional TTL.
+
+    Keys are normalized query strings, so queries that differ only in
+    whitespace share an entry.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of query embeddings to keep.
+            ttl_seconds: Entries older than this are treated as misses.
+                None keeps entries until they are evicted.
+        """
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, np.ndarray]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: str) -> np.ndarray | None:
+        """Return the cached embedding for a query, or None on a miss."""
+        key = normalize_query(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            expired = (
+                entry is not None
+                and self._ttl is not None
+                and time.monotonic() - entry[0] > self._ttl
+            )
+            if expired:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, query: str, embedding: np.ndarray) -> None:
+        """Store the embedding for a query, evicting the least recently used entry."""
+        key = normalize_query(query)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and current size for reporting."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "size": len(self),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached query embeddings."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,163 @@
+"""Async micro-batching of query embeddings for concurrent API requests."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.embeddings import EmbeddingModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DispatcherMetrics:
+    """Counters describing how queries were grouped into batches."""
+
+    requests: int = 0
+    batches: int = 0
+    max_batch_size: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of queries per encode call."""
+        return self.requests / self.batches if self.batches else 0.0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        """Average time a query spent queued before its batch was dispatched."""
+        return 1000 * self.total_wait_seconds / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the metrics as a flat dict for reporting."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch_size": self.mean_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "mean_wait_ms": self.mean_wait_ms,
+            "max_wait_ms": 1000 * self.max_wait_seconds,
+        }
+
+
+class EmbeddingDispatcher:
+    """Collects concurrent embed requests and encodes them as one batch.
+
+    The first queued query opens a window of max_wait_ms; every query that
+    arrives within the window (up to max_batch_size) joins the batch, which
+    is then encoded in a worker thread so the event loop is never blocked.
+    Each caller awaits its own future.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 64,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            embedding_model: Model used to encode the batched queries.
+            max_wait_ms: How long to wait for more queries after the first one.
+            max_batch_size: Maximum number of queries encoded together.
+        """
+        self._embedding_model = embedding_model
+        self._max_wait = max_wait_ms / 1000
+        self._max_batch_size = max_batch_size
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self.metrics = DispatcherMetrics()
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a single query, batched with other concurrent callers.
+
+        Args:
+            text: Query text to embed.
+
+        Returns:
+            1-D float32 embedding vector.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # Queues and tasks are bound to one event loop; rebuild them if
+            # the dispatcher is used from a new loop (e.g. in tests).
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((text, future, time.perf_counter()))
+        return await future
+
+    async def _run(self) -> None:
+        """Worker loop: gather a batch, encode it off-loop, resolve futures."""
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = self._loop.time() + self._max_wait
+                while len(batch) < self._max_batch_size:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+                await self._dispatch(batch)
+            except asyncio.CancelledError:
+                # Closed while gathering or encoding: release the batch's callers.
+                _fail(batch, RuntimeError("dispatcher closed"))
+                raise
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future, float]]) -> None:
+        """Encode one batch and hand each vector to its waiting caller."""
+        dispatched_at = time.perf_counter()
+        waits = [dispatched_at - enqueued_at for _, _, enqueued_at in batch]
+        self.metrics.requests += len(batch)
+        self.metrics.batches += 1
+        self.metrics.max_batch_size = max(self.metrics.max_batch_size, len(batch))
+        self.metrics.total_wait_seconds += sum(waits)
+        self.metrics.max_wait_seconds = max(self.metrics.max_wait_seconds, max(waits))
+
+        texts = [text for text, _, _ in batch]
+        try:
+            vectors = await asyncio.to_thread(self._embedding_model.embed_queries_array, texts)
+        except Exception as e:
+            logger.warning("Batched query embedding failed", exc_info=True)
+            _fail(batch, e)
+            return
+
+        for (_, future, _), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    async def close(self) -> None:
+        """Stop the worker task and fail every query that was not embedded yet.
+
+        Callers waiting on such a query get RuntimeError("dispatcher closed").
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        pending = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        _fail(pending, RuntimeError("dispatcher closed"))
+
+
+def _fail(batch: list[tuple[str, asyncio.Future, float]], error: BaseException) -> None:
+    """Set error on the futures of a batch that are still waiting."""
+    for _, future, _ in batch:
+        if not future.done():
+            future.set_exception(error)
@@ -1,18 +1,307 @@
-"""Embedding generation using sentence-transformers."""
+"""Embedding generation using sentence-transformers.
 
-from sentence_transformers import SentenceTransformer
+sentence-transformers (and with it torch) is imported only when a model is
+actually loaded, so importing this module stays cheap.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.embedding_cache import EmbeddingCache
+from src.reduction import EmbeddingProjection
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+# Supported inference backends for EmbeddingModel.
+EMBEDDING_BACKENDS = ("torch", "torch-int8", "onnx")
+
+
+def _load_sentence_transformer(
+    model_name: str,
+    backend: str,
+    onnx_file: str | None = None,
+) -> "SentenceTransformer":
+    """Load a SentenceTransformer on CPU with the requested inference backend.
+
+    Args:
+        model_name: HuggingFace model identifier or local model directory.
+        backend: One of EMBEDDING_BACKENDS. "torch-int8" applies PyTorch
+            dynamic int8 quantization to the Linear layers; "onnx" runs the
+            model through ONNX Runtime (requires the ``onnx`` extra).
+        onnx_file: ONNX file inside the model directory, e.g.
+            "onnx/model_qint8_avx512.onnx". Defaults to "onnx/model.onnx".
+
+    Returns:
+        The loaded model.
+
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+    if backend == "torch-int8":
+        import torch
+        from torch.ao.quantization import quantize_dynamic
+
+        model = SentenceTransformer(model_name, device="cpu")
+        return quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if backend == "onnx":
+        model_kwargs = {"file_name": onnx_file} if onnx_file else None
+        return SentenceTransformer(
+            model_name, device="cpu", backend="onnx", model_kwargs=model_kwargs
+        )
+    raise ValueError(
+        f"Unknown embedding backend: {backend!r}. Expected one of {EMBEDDING_BACKENDS}."
+    )
+
+
+@dataclass
+class EncodeStats:
+    """Throughput of the most recent bulk encode."""
+
+    count: int
+    seconds: float
+    batch_size: int
+    workers: int
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Encoded texts per second of wall-clock time."""
+        return self.count / self.seconds if self.seconds > 0 else 0.0
 
 
 class EmbeddingModel:
-    """Wrapper around sentence-transformers for generating embeddings."""
+    """Wrapper around sentence-transformers for generating embeddings.
 
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    The *_array methods return float32 NumPy arrays and are the native API;
+    embed_text and embed_texts are list-returning wrappers kept for callers
+    that need plain Python floats.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        cache: EmbeddingCache | None = None,
+        batch_size: int = 32,
+        workers: int = 0,
+        backend: str = "torch",
+        onnx_file: str | None = None,
+        lazy: bool = False,
+        dimension: int | None = None,
+        projection: EmbeddingProjection | None = None,
+    ):
         """Initialize the embedding model.
 
         Args:
             model_name: HuggingFace model identifier.
+            cache: Optional persistent cache consulted by embed_texts before
+                running the model. Only cache misses are encoded.
+            batch_size: Texts per forward pass when encoding batches.
+            workers: Number of processes for bulk encoding. Values above 1
+                start a SentenceTransformer multi-process pool for large
+                batches; 0 or 1 encodes in the current process.
+            backend: Inference backend, one of EMBEDDING_BACKENDS.
+            onnx_file: ONNX file to load when backend is "onnx".
+            lazy: Defer loading the model until the first text is encoded.
+                Combined with a warm cache, startup then needs no model at all.
+            dimension: Known embedding dimension, used by the dimension
+                property while a lazy model has not been loaded yet.
+            projection: Optional dimensionality reduction applied to every
+                returned embedding. The cache always stores full vectors.
+
+        Raises:
+            ValueError: If the backend is not supported.
+        """
+        if backend not in EMBEDDING_BACKENDS:
+            raise ValueError(
+                f"Unknown embedding backend: {backend!r}. Expected one of {EMBEDDING_BACKENDS}."
+            )
+        self._model_name = model_name
+        self._backend = backend
+        self._onnx_file = onnx_file
+        self._dimension = dimension
+        self._loaded_model: SentenceTransformer | None = None
+        self._load_lock = threading.Lock()
+        if not lazy:
+            self._load_model()
+        # Vectors from different backends differ slightly, so they must not
+        # share cache entries. The fp32 torch key stays the bare model name.
+        self._cache_key = model_name
+        if backend != "torch":
+            self._cache_key = f"{model_name}#{backend}" + (f":{onnx_file}" if onnx_file else "")
+        self._cache = cache
+        self._batch_size = batch_size
+        self._workers = workers
+        self.projection = projection
+        self.last_encode_stats: EncodeStats | None = None
+
+    def _load_model(self) -> "SentenceTransformer":
+        """Load the underlying model once, thread-safely."""
+        with self._load_lock:
+            if self._loaded_model is None:
+                start = time.perf_counter()
+                self._loaded_model = _load_sentence_transformer(
+                    self._model_name, self._backend, self._onnx_file
+                )
+                logger.info(
+                    "Loaded embedding model %s (%s) in %.2fs",
+                    self._model_name,
+                    self._backend,
+                    time.perf_counter() - start,
+                )
+            return self._loaded_model
+
+    @property
+    def _model(self) -> "SentenceTransformer":
+        """The SentenceTransformer, loaded on first access if deferred."""
+        return self._loaded_model or self._load_model()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the underlying model has been loaded."""
+        return self._loaded_model is not None
+
+    @property
+    def backend(self) -> str:
+        """Return the inference backend in use."""
+        return self._backend
+
+    @property
+    def cache(self) -> EmbeddingCache | None:
+        """Access the persistent embedding cache, if any."""
+        return self._cache
+
+    def _project(self, embeddings: np.ndarray) -> np.ndarray:
+        """Apply the configured projection, if any."""
+        if self.projection is None:
+            return embeddings
+        return self.projection.apply(embeddings)
+
+    def embed_text_array(self, text: str) -> np.ndarray:
+        """Generate embedding for a single text string.
+
+        Args:
+            text: Input text to embed.
+
+        Returns:
+            1-D float32 array of shape (dimension,).
+        """
+        return self._project(np.asarray(self._model.encode(text), dtype=np.float32))
+
+    def embed_queries_array(self, texts: list[str]) -> np.ndarray:
+        """Embed a small batch of query strings in one forward pass.
+
+        Unlike embed_texts_array, this skips the chunk cache and the bulk
+        encode path (no sorting, pool or throughput logging).
+
+        Args:
+            texts: Query strings to embed.
+
+        Returns:
+            Float32 array of shape (len(texts), dimension).
+        """
+        return self._project(
+            np.asarray(self._model.encode(texts, batch_size=max(len(texts), 1)), dtype=np.float32)
+        )
+
+    def embed_texts_array(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for multiple text strings.
+
+        When a cache is configured, previously embedded texts are served
+        from it and only the remaining texts are sent to the model.
+
+        Args:
+            texts: List of input texts.
+
+        Returns:
+            C-contiguous float32 array of shape (len(texts), dimension).
         """
-        self._model = SentenceTransformer(model_name)
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return self._project(self.embed_texts_full_array(texts))
+
+    def embed_texts_full_array(self, texts: list[str]) -> np.ndarray:
+        """Like embed_texts_array, but without applying the projection.
+
+        Used to fit a projection on the corpus embeddings.
+
+        Args:
+            texts: List of input texts.
+
+        Returns:
+            C-contiguous float32 array of shape (len(texts), full_dimension).
+        """
+        if not texts:
+            return np.empty((0, self.full_dimension), dtype=np.float32)
+        if self._cache is None:
+            return self._encode_bulk(texts)
+
+        found = self._cache.get_many(self._cache_key, texts)
+        missing = [i for i in range(len(texts)) if i not in found]
+        embeddings = np.empty((len(texts), self.full_dimension), dtype=np.float32)
+        for i, vector in found.items():
+            embeddings[i] = vector
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            encoded = self._encode_bulk(missing_texts)
+            self._cache.put_many(self._cache_key, missing_texts, encoded)
+            embeddings[missing] = encoded
+        return embeddings
+
+    def _encode_bulk(self, texts: list[str]) -> np.ndarray:
+        """Encode a batch of texts, sorted by length, optionally across processes.
+
+        Texts are encoded longest-first so each batch holds texts of similar
+        length (less padding), and the result is returned in input order.
+        Throughput is logged and kept in last_encode_stats.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        sorted_texts = [texts[i] for i in order]
+        use_pool = self._workers > 1 and len(texts) >= self._batch_size * self._workers
+
+        start = time.perf_counter()
+        if use_pool:
+            pool = self._model.start_multi_process_pool(target_devices=["cpu"] * self._workers)
+            try:
+                encoded = self._model.encode(
+                    sorted_texts,
+                    batch_size=self._batch_size,
+                    pool=pool,
+                    chunk_size=self._batch_size * 4,
+                )
+            finally:
+                self._model.stop_multi_process_pool(pool)
+        else:
+            encoded = self._model.encode(sorted_texts, batch_size=self._batch_size)
+        elapsed = time.perf_counter() - start
+
+        embeddings = np.empty((len(texts), encoded.shape[1]), dtype=np.float32)
+        embeddings[order] = encoded
+        self.last_encode_stats = EncodeStats(
+            count=len(texts),
+            seconds=elapsed,
+            batch_size=self._batch_size,
+            workers=self._workers if use_pool else 1,
+        )
+        logger.info(
+            "Encoded %d chunks in %.2fs (%.1f chunks/s, batch_size=%d, workers=%d)",
+            len(texts),
+            elapsed,
+            self.last_encode_stats.chunks_per_second,
+            self._batch_size,
+            self.last_encode_stats.workers,
+        )
+        return embeddings
 
     def embed_text(self, text: str) -> list[float]:
         """Generate embedding for a single text string.
@@ -23,8 +312,7 @@ class EmbeddingModel:
         Returns:
             List of floats representing the embedding vector.
         """
-        embedding = self._model.encode(text)
-        return embedding.tolist()
+        return self.embed_text_array(text).tolist()
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple text strings.
@@ -37,10 +325,18 @@ class EmbeddingModel:
         """
         if not texts:
             return []
-        embeddings = self._model.encode(texts)
-        return [e.tolist() for e in embeddings]
+        return self.embed_texts_array(texts).tolist()
 
     @property
     def dimension(self) -> int:
-        """Return the embedding dimension."""
+        """Return the dimension of returned embeddings, after any projection."""
+        if self.projection is not None:
+            return self.projection.output_dimension
+        return self.full_dimension
+
+    @property
+    def full_dimension(self) -> int:
+        """Return the model's native embedding dimension."""
+        if self._loaded_model is None and self._dimension is not None:
+            return self._dimension
         return self._model.get_sentence_embedding_dimension()
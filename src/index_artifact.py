@@ -0,0 +1,142 @@
+"""Portable prebuilt index: chunks, embeddings and a manifest in one directory.
+
+An artifact is exported once (``main.py --export-index DIR``) on the machine
+that embeds the corpus. Servers load it with INDEX_ARTIFACT_PATH: the vectors
+are memory-mapped and bulk-loaded into the configured vector store, so the
+embedding model is not run at startup.
+
+Layout:
+    manifest.json     embedding model, chunking settings, per-source hashes
+    chunks.jsonl      one chunk per line, in the row order of embeddings.npy
+    embeddings.npy    float32 array of shape (chunks, dimension)
+    projection.npz    dimensionality reduction to apply to queries, if any
+
+The manifest is written last, so an interrupted export cannot be loaded.
+"""
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.index_manifest import source_entries
+from src.models import Chunk
+from src.reduction import EmbeddingProjection
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = 1
+
+
+@dataclass
+class IndexArtifact:
+    """A loaded index artifact."""
+
+    manifest: dict
+    chunks: list[Chunk]
+    embeddings: np.ndarray  # read-only memory map
+    projection: EmbeddingProjection | None
+
+
+def export_artifact(
+    path: str | Path,
+    chunks: list[Chunk],
+    embeddings: np.ndarray,
+    projection: EmbeddingProjection | None,
+    *,
+    embedding_model: str,
+    embedding_key: str,
+    chunk_size: int,
+    chunk_overlap: int,
+) -> dict:
+    """Write an index artifact directory.
+
+    Args:
+        path: Directory to write to (created if missing; files are replaced).
+        chunks: Indexed chunks.
+        embeddings: Vectors as stored in the index (after any projection),
+            one row per chunk.
+        projection: Projection applied to the embeddings, or None.
+        embedding_model: Embedding model name, which queries must also use.
+        embedding_key: Full embedding configuration (model, backend, reduction).
+        chunk_size: Chunk size the corpus was split with.
+        chunk_overlap: Chunk overlap the corpus was split with.
+
+    Returns:
+        The manifest that was written.
+
+    Raises:
+        ValueError: If chunks and embeddings differ in length.
+    """
+    if len(chunks) != len(embeddings):
+        raise ValueError(f"Got {len(chunks)} chunks but {len(embeddings)} embeddings.")
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "manifest.json").unlink(missing_ok=True)
+
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    np.save(path / "embeddings.npy", embeddings)
+    with (path / "chunks.jsonl").open("w") as f:
+        for chunk in chunks:
+            f.write(chunk.model_dump_json() + "\n")
+    projection_path = path / "projection.npz"
+    if projection is not None:
+        projection.save(projection_path)
+    else:
+        projection_path.unlink(missing_ok=True)
+
+    manifest = {
+        "version": ARTIFACT_VERSION,
+        "embedding_model": embedding_model,
+        "embedding_key": embedding_key,
+        "dimension": int(embeddings.shape[1]) if embeddings.ndim == 2 else 0,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "count": len(chunks),
+        "sources": source_entries(chunks),
+    }
+    (path / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    logger.info("Exported %d chunks to %s", len(chunks), path)
+    return manifest
+
+
+def load_artifact(path: str | Path) -> IndexArtifact:
+    """Load an index artifact, memory-mapping the embeddings.
+
+    Args:
+        path: Artifact directory written by export_artifact.
+
+    Returns:
+        The loaded IndexArtifact.
+
+    Raises:
+        FileNotFoundError: If the directory holds no complete artifact.
+        ValueError: If the artifact version is unsupported or its files
+            disagree on the number of chunks.
+    """
+    path = Path(path)
+    manifest_path = path / "manifest.json"
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"No index artifact manifest at {manifest_path}")
+    manifest = json.loads(manifest_path.read_text())
+    if manifest.get("version") != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported index artifact version {manifest.get('version')!r} "
+            f"(expected {ARTIFACT_VERSION})."
+        )
+
+    embeddings = np.load(path / "embeddings.npy", mmap_mode="r")
+    with (path / "chunks.jsonl").open() as f:
+        chunks = [Chunk.model_validate_json(line) for line in f]
+    if not len(chunks) == len(embeddings) == manifest["count"]:
+        raise ValueError(
+            f"Index artifact at {path} is inconsistent: manifest lists {manifest['count']} "
+            f"chunks, found {len(chunks)} chunks and {len(embeddings)} embeddings."
+        )
+    projection_path = path / "projection.npz"
+    projection = EmbeddingProjection.load(projection_path) if projection_path.exists() else None
+    return IndexArtifact(
+        manifest=manifest, chunks=chunks, embeddings=embeddings, projection=projection
+    )
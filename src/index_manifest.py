@@ -0,0 +1,106 @@
+"""Index manifest: records what the persistent vector index was built from.
+
+For every note source the manifest keeps a content hash and the point IDs of
+its chunks. build_pipeline diffs it against the current corpus on startup, so
+only changed sources are re-embedded and upserted, and points of removed or
+edited chunks are deleted.
+"""
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from pathlib import Path
+
+from src.models import Chunk
+from src.vectorstore import point_id
+
+logger = logging.getLogger(__name__)
+
+
+def source_entries(chunks: list[Chunk]) -> dict[str, dict]:
+    """Group chunks by source into manifest entries.
+
+    Args:
+        chunks: Chunks that are (re)loaded on every startup.
+
+    Returns:
+        Mapping of source to ``{"hash": ..., "points": [...]}``, where the hash
+        covers each chunk's index, text and source type and points are the
+        chunks' point IDs in chunk order. date_added is left out: for notes
+        it is the file mtime, which checkouts and copies rewrite without
+        changing the content.
+    """
+    by_source: dict[str, list[Chunk]] = defaultdict(list)
+    for chunk in chunks:
+        by_source[chunk.source].append(chunk)
+
+    entries = {}
+    for source, source_chunks in by_source.items():
+        digest = hashlib.sha256()
+        for chunk in source_chunks:
+            for part in (str(chunk.chunk_index), chunk.text, chunk.source_type):
+                digest.update(part.encode("utf-8"))
+                digest.update(b"\0")
+        entries[source] = {
+            "hash": digest.hexdigest(),
+            "points": [point_id(chunk) for chunk in source_chunks],
+        }
+    return entries
+
+
+def diff_sources(previous: dict[str, dict], current: dict[str, dict]) -> tuple[set[str], list[str]]:
+    """Compare manifest entries of the indexed and the current corpus.
+
+    Args:
+        previous: Source entries recorded when the index was last updated.
+        current: Source entries of the corpus loaded now.
+
+    Returns:
+        The sources that are new or whose content changed, and the point IDs
+        that are no longer part of the corpus (chunks of removed sources, and
+        chunks of changed sources that no longer exist).
+    """
+    changed = {
+        source
+        for source, entry in current.items()
+        if previous.get(source, {}).get("hash") != entry["hash"]
+    }
+    stale = []
+    for source, entry in previous.items():
+        if source in current and source not in changed:
+            continue
+        keep = set(current[source]["points"]) if source in current else set()
+        stale.extend(id_ for id_ in entry.get("points", []) if id_ not in keep)
+    return changed, stale
+
+
+def load_manifest(manifest_path: str | Path) -> dict | None:
+    """Load the index manifest.
+
+    Args:
+        manifest_path: Path to the manifest JSON file.
+
+    Returns:
+        The manifest dict, or None if it is missing or unreadable.
+    """
+    path = Path(manifest_path)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Failed to read index manifest: %s", e)
+        return None
+
+
+def save_manifest(manifest_path: str | Path, manifest: dict) -> None:
+    """Save the index manifest.
+
+    Args:
+        manifest_path: Path to the manifest JSON file.
+        manifest: Manifest contents.
+    """
+    path = Path(manifest_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2))
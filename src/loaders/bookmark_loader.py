@@ -7,6 +7,7 @@ import shutil
 import sqlite3
 import tempfile
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 
 import trafilatura
@@ -218,6 +219,8 @@ def load_bookmarks(
     sync_state_path: str | Path = "data/sync_state.json",
     fetch_timeout: int = 15,
     max_content_length: int = 50000,
+    full_sync: bool = False,
+    save_state: bool = True,
 ) -> list[Document]:
     """Load Firefox bookmarks as Documents, with incremental sync.
 
@@ -229,6 +232,11 @@ def load_bookmarks(
         sync_state_path: Path to the sync state JSON file.
         fetch_timeout: Timeout for fetching each page.
         max_content_length: Max characters per page.
+        full_sync: Ignore the saved sync state and process all bookmarks,
+            e.g. when the index holding earlier bookmarks is empty.
+        save_state: Record the newest bookmark in the sync state. Pass False
+            when the bookmarks are not added to the local index, e.g. when
+            exporting an index artifact.
 
     Returns:
         List of Document objects from newly synced bookmarks.
@@ -249,7 +257,7 @@ def load_bookmarks(
             return []
 
     # Load sync state
-    last_sync = load_sync_state(sync_state_path)
+    last_sync = None if full_sync else load_sync_state(sync_state_path)
 
     # Read bookmarks (incremental if we have a last sync timestamp)
     bookmarks = read_bookmarks(resolved_path, since_timestamp=last_sync)
@@ -274,12 +282,14 @@ def load_bookmarks(
                 Document(
                     content=content,
                     source=bookmark.url,
+                    source_type="bookmark",
+                    date_added=datetime.fromtimestamp(bookmark.date_added / 1_000_000, tz=UTC),
                 )
             )
         max_timestamp = max(max_timestamp, bookmark.date_added)
 
     # Save sync state with the latest timestamp
-    if max_timestamp > (last_sync or 0):
+    if save_state and max_timestamp > (last_sync or 0):
         save_sync_state(sync_state_path, max_timestamp)
 
     logger.info("Loaded %d bookmark documents.", len(documents))
@@ -1,5 +1,6 @@
 """Notes loader — loads .txt files from a directory as Documents."""
 
+from datetime import UTC, datetime
 from pathlib import Path
 
 from src.models import Document
@@ -12,7 +13,8 @@ def load_documents(directory: str | Path) -> list[Document]:
         directory: Path to the directory containing .txt files.
 
     Returns:
-        List of Document objects with content and source metadata.
+        List of Document objects with content and source metadata. Notes
+        have no creation date, so date_added is the file's modification time.
 
     Raises:
         FileNotFoundError: If the directory does not exist.
@@ -28,6 +30,8 @@ def load_documents(directory: str | Path) -> list[Document]:
             Document(
                 content=content,
                 source=str(file_path),
+                source_type="note",
+                date_added=datetime.fromtimestamp(file_path.stat().st_mtime, tz=UTC),
             )
         )
     return documents
@@ -1,13 +1,21 @@
 """Pydantic data models shared across all modules."""
 
+from datetime import datetime
+from typing import Literal, get_args
+
 from pydantic import BaseModel, Field
 
+SourceType = Literal["note", "bookmark"]
+SOURCE_TYPES: tuple[str, ...] = get_args(SourceType)
+
 
 class Document(BaseModel):
     """A loaded document with metadata."""
 
     content: str
     source: str  # file path for notes, URL for bookmarks
+    source_type: SourceType = "note"
+    date_added: datetime | None = None  # file mtime for notes, bookmark date for bookmarks
 
 
 class Chunk(BaseModel):
@@ -17,6 +25,17 @@ class Chunk(BaseModel):
     source: str  # file path or URL
     chunk_index: int
     metadata: dict = Field(default_factory=dict)
+    source_type: SourceType = "note"
+    date_added: datetime | None = None
+
+
+class SearchFilter(BaseModel):
+    """Restricts a search to matching chunks. Unset fields do not filter."""
+
+    source_type: SourceType | None = None
+    sources: list[str] | None = None  # exact file paths or URLs
+    added_after: datetime | None = None  # inclusive
+    added_before: datetime | None = None  # exclusive
 
 
 class SearchResult(BaseModel):
@@ -24,6 +43,8 @@ class SearchResult(BaseModel):
 
     chunk: Chunk
     score: float
+    # Stored vector, only set when a search is made with with_vectors=True.
+    embedding: list[float] | None = Field(default=None, exclude=True, repr=False)
 
 
 class QueryResult(BaseModel):
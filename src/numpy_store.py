@@ -0,0 +1,457 @@
+"""In-process exact-search vector store backed by a NumPy matrix.
+
+For corpora up to a few hundred thousand chunks, one matrix-vector product
+over pre-normalized float32 vectors is faster than going through a Qdrant
+client, and exact. NumpyVectorStore has the same interface as VectorStore
+and is selected with VECTOR_STORE_BACKEND=numpy.
+
+When a path is given, vectors are saved to ``vectors.npy`` (memory-mapped on
+load) and payloads to ``payloads.jsonl`` in that directory. Both files are
+rewritten as a whole, so changes are saved once per indexing pass (by
+commit_rebuild) or on close, not on every add_chunks or delete_points call.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+from src.models import Chunk, SearchFilter, SearchResult
+from src.sparse import BM25Encoder, bm25_idf, reciprocal_rank_fusion
+from src.vectorstore import UpsertStats, chunk_from_payload, chunk_payload, point_id
+
+logger = logging.getLogger(__name__)
+
+
+def _timestamp(value: datetime | str | None) -> float:
+    """POSIX timestamp of a datetime or ISO string; naive values are UTC, None is NaN."""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def _top_rows(scores: np.ndarray, k: int, minimum: float) -> list[int]:
+    """Rows of the k highest scores that are at least minimum, best first."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    return [int(row) for row in top if scores[row] >= minimum]
+
+
+class NumpyVectorStore:
+    """Exact cosine search over a normalized float32 matrix."""
+
+    def __init__(
+        self,
+        path: str | None = None,
+        embedding_dimension: int = 384,
+        hybrid: bool = False,
+        hybrid_prefetch_k: int = 20,
+    ):
+        """Initialize the store, loading persisted data if present.
+
+        Args:
+            path: Directory to persist vectors and payloads to. None keeps
+                everything in memory only.
+            embedding_dimension: Dimension of the embedding vectors.
+            hybrid: For searches given a query text, fuse the dense ranking
+                with a BM25 ranking over an in-process inverted index, built
+                from the stored chunk texts on first use.
+            hybrid_prefetch_k: Candidates taken from each ranking before fusion.
+        """
+        self._path = Path(path) if path else None
+        self._embedding_dimension = embedding_dimension
+        self._vectors = np.empty((0, embedding_dimension), dtype=np.float32)
+        self._size = 0
+        self._ids: dict[str, int] = {}
+        self._payloads: list[dict] = []
+        self._columns: dict[str, np.ndarray] = {}
+        self._sparse_encoder = BM25Encoder() if hybrid else None
+        self._hybrid_prefetch_k = hybrid_prefetch_k
+        self._postings: dict[int, tuple[np.ndarray, np.ndarray]] | None = None
+        self._exists = False
+        # While rebuilding, changes stay in memory until commit_rebuild saves them.
+        self._rebuilding = False
+        # Unsaved changes, written by commit_rebuild or close.
+        self._dirty = False
+        self.persistent = self._path is not None
+        self.last_upsert_stats: UpsertStats | None = None
+        if self._path is not None and (self._path / "vectors.npy").exists():
+            self._load()
+
+    def _load(self) -> None:
+        """Load persisted vectors (memory-mapped) and payloads."""
+        self._vectors = np.load(self._path / "vectors.npy", mmap_mode="r")
+        self._size = len(self._vectors)
+        with (self._path / "payloads.jsonl").open() as f:
+            records = [json.loads(line) for line in f]
+        self._ids = {record["id"]: row for row, record in enumerate(records)}
+        self._payloads = [record["payload"] for record in records]
+        self._exists = True
+        logger.info("Loaded %d vectors from %s", self._size, self._path)
+
+    def _save(self) -> None:
+        """Write vectors and payloads, replacing the previous files atomically."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        ids = sorted(self._ids, key=self._ids.get)
+        tmp_vectors = self._path / "vectors.npy.tmp"
+        with tmp_vectors.open("wb") as f:
+            np.save(f, np.asarray(self._vectors[: self._size]))
+        tmp_payloads = self._path / "payloads.jsonl.tmp"
+        with tmp_payloads.open("w") as f:
+            for id_, payload in zip(ids, self._payloads, strict=True):
+                f.write(json.dumps({"id": id_, "payload": payload}) + "\n")
+        os.replace(tmp_vectors, self._path / "vectors.npy")
+        os.replace(tmp_payloads, self._path / "payloads.jsonl")
+
+    def ensure_collection(self) -> bool:
+        """Create the (empty) index if it doesn't exist.
+
+        Returns:
+            True if the index was created, False if it already existed.
+        """
+        created = not self._exists
+        self._exists = True
+        return created
+
+    def count(self) -> int:
+        """Return the number of stored vectors."""
+        return self._size
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix (by doubling) to hold at least `rows` vectors."""
+        capacity = len(self._vectors)
+        if rows <= capacity and self._vectors.flags.writeable:
+            return
+        grown = np.empty((max(rows, 2 * capacity), self._embedding_dimension), dtype=np.float32)
+        grown[: self._size] = self._vectors[: self._size]
+        self._vectors = grown
+
+    def add_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        embeddings: np.ndarray | Iterable[Sequence[float]],
+    ) -> int:
+        """Add chunks with their embeddings, normalizing the vectors.
+
+        Chunks already in the store (same point_id) are overwritten.
+
+        Args:
+            chunks: Text chunks to store.
+            embeddings: Corresponding embedding vectors, in chunk order.
+
+        Returns:
+            Number of vectors added or overwritten.
+
+        Raises:
+            ValueError: If chunks and embeddings differ in length or the
+                vectors have the wrong dimension.
+        """
+        chunks = list(chunks)
+        if not isinstance(embeddings, np.ndarray):
+            embeddings = list(embeddings)
+        if not chunks and len(embeddings) == 0:
+            return 0
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.shape != (len(chunks), self._embedding_dimension):
+            raise ValueError(
+                f"Expected embeddings of shape ({len(chunks)}, {self._embedding_dimension}), "
+                f"got {vectors.shape}."
+            )
+        start = time.perf_counter()
+        vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        self._reserve(self._size + len(chunks))
+        for chunk, vector in zip(chunks, vectors, strict=True):
+            id_ = point_id(chunk)
+            row = self._ids.get(id_)
+            if row is None:
+                row = self._ids[id_] = self._size
+                self._payloads.append(chunk_payload(chunk))
+                self._size += 1
+            else:
+                self._payloads[row] = chunk_payload(chunk)
+            self._vectors[row] = vector
+        self._columns = {}
+        self._postings = None
+        self._exists = True
+        self._dirty = True
+
+        self.last_upsert_stats = UpsertStats(
+            count=len(chunks),
+            seconds=time.perf_counter() - start,
+            batch_size=len(chunks),
+            parallel=1,
+        )
+        logger.info(
+            "Added %d vectors in %.2fs (%.1f points/s)",
+            len(chunks),
+            self.last_upsert_stats.seconds,
+            self.last_upsert_stats.points_per_second,
+        )
+        return len(chunks)
+
+    async def aadd_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        embeddings: np.ndarray | Iterable[Sequence[float]],
+    ) -> int:
+        """Async variant of add_chunks; runs it in a worker thread since it copies vectors."""
+        return await asyncio.to_thread(self.add_chunks, chunks, embeddings)
+
+    def search(
+        self,
+        query_embedding: np.ndarray | Sequence[float],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_text: str | None = None,
+        with_vectors: bool = False,
+    ) -> list[SearchResult]:
+        """Search for similar chunks by exact cosine similarity.
+
+        Args:
+            query_embedding: The query embedding vector (float32 array or list).
+            top_k: Number of results to return.
+            score_threshold: Minimum relevance score. Results below this are filtered out.
+            hnsw_ef: Ignored; accepted for interface compatibility with VectorStore.
+            search_filter: Only return chunks matching this filter. Non-matching
+                rows are masked out before the top-k selection.
+            query_text: The query text, used for hybrid search (see search_batch).
+            with_vectors: Also return each result's stored (normalized) vector
+                in SearchResult.embedding.
+
+        Returns:
+            List of SearchResult objects sorted by relevance (descending score).
+        """
+        queries = np.asarray(query_embedding, dtype=np.float32)[np.newaxis]
+        (results,) = self.search_batch(
+            queries, top_k, score_threshold, hnsw_ef, search_filter, [query_text], with_vectors
+        )
+        return results
+
+    async def asearch(
+        self,
+        query_embedding: np.ndarray | Sequence[float],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_text: str | None = None,
+        with_vectors: bool = False,
+    ) -> list[SearchResult]:
+        """Async variant of search that does not block the event loop.
+
+        The matrix product, page-ins of a memory-mapped matrix and the BM25
+        index build run in a worker thread. Arguments and return value are
+        the same as for search.
+        """
+        return await asyncio.to_thread(
+            self.search,
+            query_embedding,
+            top_k,
+            score_threshold,
+            hnsw_ef,
+            search_filter,
+            query_text,
+            with_vectors,
+        )
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray | Sequence[Sequence[float]],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_texts: Sequence[str] | None = None,
+        with_vectors: bool = False,
+    ) -> list[list[SearchResult]]:
+        """Search for several query embeddings with one matrix product.
+
+        Args:
+            query_embeddings: Query embedding vectors, one row per query.
+            top_k: Number of results to return per query.
+            score_threshold: Minimum relevance score. Results below this are
+                filtered out; with hybrid search it applies to dense candidates.
+            hnsw_ef: Ignored; accepted for interface compatibility with VectorStore.
+            search_filter: Only return chunks matching this filter.
+            query_texts: Query texts in the same order. With hybrid search
+                enabled, dense and BM25 rankings are fused with reciprocal
+                rank fusion and scores are RRF scores.
+            with_vectors: Also return each result's stored (normalized) vector.
+
+        Returns:
+            One list of SearchResult objects per query, in query order, each
+            sorted by relevance (descending score).
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32).reshape(
+            -1, self._embedding_dimension
+        )
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        if self._size == 0:
+            return [[] for _ in queries]
+        scores = self._vectors[: self._size] @ (queries / np.maximum(norms, 1e-12)).T
+        mask = self._filter_mask(search_filter)
+        if mask is not None:
+            scores[~mask] = -np.inf
+        texts = query_texts if query_texts is not None else [None] * len(queries)
+
+        results = []
+        for column, norm, text in zip(scores.T, norms[:, 0], texts, strict=True):
+            dense = _top_rows(column, top_k, score_threshold) if norm > 0 else []
+            if self._sparse_encoder is None or not text:
+                ranked = [(row, float(column[row])) for row in dense]
+            else:
+                candidates = max(self._hybrid_prefetch_k, top_k)
+                if norm > 0:
+                    dense = _top_rows(column, candidates, score_threshold)
+                bm25 = self._bm25_scores(text)
+                if mask is not None:
+                    bm25[~mask] = 0.0
+                sparse = [row for row in _top_rows(bm25, candidates, 0.0) if bm25[row] > 0]
+                ranked = reciprocal_rank_fusion([dense, sparse])[:top_k]
+            results.append(
+                [
+                    SearchResult(
+                        chunk=chunk_from_payload(self._payloads[row]),
+                        score=score,
+                        embedding=self._vectors[row].tolist() if with_vectors else None,
+                    )
+                    for row, score in ranked
+                ]
+            )
+        return results
+
+    def _bm25_scores(self, query_text: str) -> np.ndarray:
+        """BM25 score of every row for the query, with IDF from the stored chunks."""
+        if self._postings is None:
+            postings: dict[int, tuple[list[int], list[float]]] = {}
+            for row, payload in enumerate(self._payloads):
+                for term, weight in zip(
+                    *self._sparse_encoder.encode_document(payload["text"]), strict=True
+                ):
+                    rows, weights = postings.setdefault(term, ([], []))
+                    rows.append(row)
+                    weights.append(weight)
+            self._postings = {
+                term: (np.array(rows), np.array(weights, dtype=np.float32))
+                for term, (rows, weights) in postings.items()
+            }
+        scores = np.zeros(self._size, dtype=np.float32)
+        for term in self._sparse_encoder.encode_query(query_text)[0]:
+            if term in self._postings:
+                rows, weights = self._postings[term]
+                scores[rows] += bm25_idf(len(rows), self._size) * weights
+        return scores
+
+    def _column(self, field_name: str) -> np.ndarray:
+        """Payload field as an array, cached until the next write."""
+        if field_name not in self._columns:
+            if field_name == "date_added":
+                values = [_timestamp(p.get("date_added")) for p in self._payloads]
+                self._columns[field_name] = np.array(values, dtype=np.float64)
+            else:
+                self._columns[field_name] = np.array([p.get(field_name) for p in self._payloads])
+        return self._columns[field_name]
+
+    def _filter_mask(self, search_filter: SearchFilter | None) -> np.ndarray | None:
+        """Boolean mask of rows matching the filter, or None for no filter."""
+        if search_filter is None:
+            return None
+        mask = np.ones(self._size, dtype=bool)
+        if search_filter.source_type is not None:
+            mask &= self._column("source_type") == search_filter.source_type
+        if search_filter.sources is not None:
+            mask &= np.isin(self._column("source"), search_filter.sources)
+        # Comparisons with NaN are False, so chunks without a date never match a range.
+        if search_filter.added_after is not None:
+            mask &= self._column("date_added") >= _timestamp(search_filter.added_after)
+        if search_filter.added_before is not None:
+            mask &= self._column("date_added") < _timestamp(search_filter.added_before)
+        return mask
+
+    def delete_points(self, ids: Sequence[str]) -> None:
+        """Delete vectors by point ID, compacting the matrix.
+
+        Args:
+            ids: Point IDs (see point_id) to delete. Unknown IDs are ignored.
+        """
+        rows = [self._ids[id_] for id_ in ids if id_ in self._ids]
+        if not rows:
+            return
+        keep = np.ones(self._size, dtype=bool)
+        keep[rows] = False
+        ids_by_row = sorted(self._ids, key=self._ids.get)
+        self._vectors = np.array(self._vectors[: self._size][keep])
+        self._payloads = [p for p, kept in zip(self._payloads, keep, strict=True) if kept]
+        kept_ids = (id_ for id_, kept in zip(ids_by_row, keep, strict=True) if kept)
+        self._ids = {id_: row for row, id_ in enumerate(kept_ids)}
+        self._size = len(self._payloads)
+        self._columns = {}
+        self._postings = None
+        self._dirty = True
+
+    def _clear(self) -> None:
+        """Empty the in-memory index."""
+        self._vectors = np.empty((0, self._embedding_dimension), dtype=np.float32)
+        self._size = 0
+        self._ids = {}
+        self._payloads = []
+        self._columns = {}
+        self._postings = None
+        self._exists = False
+
+    def delete_collection(self) -> None:
+        """Delete all vectors and payloads, including persisted files."""
+        self._clear()
+        self._rebuilding = False
+        self._dirty = False
+        if self._path is not None:
+            for name in ("vectors.npy", "payloads.jsonl"):
+                (self._path / name).unlink(missing_ok=True)
+
+    def begin_rebuild(self) -> None:
+        """Start rebuilding from scratch.
+
+        The index is emptied in memory only. Persisted files keep the
+        previous index until commit_rebuild saves the rebuilt one over them,
+        so a rebuild that fails part way leaves the previous index on disk.
+        Unlike VectorStore with use_alias, searches in this process see the
+        partial index and no previous version is kept for rollback.
+        """
+        self._clear()
+        self._rebuilding = True
+        self._dirty = True
+
+    def commit_rebuild(self) -> None:
+        """Finish an indexing pass: save the rebuilt index, or the changes made since the last save.
+
+        A no-op when nothing changed.
+        """
+        self._rebuilding = False
+        if self._path is not None and self._dirty:
+            self._save()
+        self._dirty = False
+
+    def close(self) -> None:
+        """Save unsaved changes. A rebuild that was never committed is not saved."""
+        if self._path is not None and self._dirty and not self._rebuilding:
+            self._save()
+        self._dirty = False
+
+    async def aclose(self) -> None:
+        """Async variant of close; saves in a worker thread."""
+        await asyncio.to_thread(self.close)
@@ -0,0 +1,256 @@
+"""Vector store split into one collection per source type.
+
+Notes and bookmarks differ in size and update rate. With
+PER_SOURCE_COLLECTIONS=true each source type gets its own collection (or
+NumPy index), which can have its own HNSW and quantization settings and can
+be reindexed on its own. PartitionedVectorStore has the same interface as
+VectorStore: chunks are routed to the partition of their source_type, and
+searches are sent to all partitions concurrently and merged by score.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.models import Chunk, SearchFilter, SearchResult
+from src.numpy_store import NumpyVectorStore
+from src.vectorstore import VectorStore
+
+logger = logging.getLogger(__name__)
+
+
+def _merge(result_lists: Iterable[list[SearchResult]], top_k: int) -> list[SearchResult]:
+    """Merge per-partition results into one top-k list by descending score."""
+    merged = itertools.chain.from_iterable(result_lists)
+    return sorted(merged, key=lambda r: r.score, reverse=True)[:top_k]
+
+
+class PartitionedVectorStore:
+    """Routes chunks to per-source-type stores and scatter-gathers searches."""
+
+    def __init__(self, partitions: Mapping[str, VectorStore | NumpyVectorStore]):
+        """Initialize the store.
+
+        Args:
+            partitions: One vector store per source type ("note",
+                "bookmark", ...). Chunks of other source types are rejected.
+        """
+        self._partitions = dict(partitions)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self._partitions), 1), thread_name_prefix="partition"
+        )
+        self.persistent = all(store.persistent for store in self._partitions.values())
+        self.created: set[str] = set()
+
+    @property
+    def partitions(self) -> dict[str, VectorStore | NumpyVectorStore]:
+        """The per-source-type stores."""
+        return self._partitions
+
+    def partition(self, source_type: str) -> VectorStore | NumpyVectorStore:
+        """Return the store for a source type.
+
+        Raises:
+            ValueError: If there is no partition for the source type.
+        """
+        try:
+            return self._partitions[source_type]
+        except KeyError:
+            raise ValueError(
+                f"No collection for source type {source_type!r}. "
+                f"Expected one of {tuple(self._partitions)}."
+            ) from None
+
+    def _targets(self, search_filter: SearchFilter | None) -> list[VectorStore | NumpyVectorStore]:
+        """Partitions that can hold results matching the filter."""
+        if search_filter is not None and search_filter.source_type is not None:
+            return [self.partition(search_filter.source_type)]
+        return list(self._partitions.values())
+
+    def ensure_collection(self) -> bool:
+        """Create missing partition collections.
+
+        The source types whose collection was created are kept in
+        self.created.
+
+        Returns:
+            True if any collection was created.
+        """
+        self.created = {
+            source_type
+            for source_type, store in self._partitions.items()
+            if store.ensure_collection()
+        }
+        return bool(self.created)
+
+    def count(self) -> int:
+        """Return the total number of points across all partitions."""
+        return sum(store.count() for store in self._partitions.values())
+
+    def _route(
+        self, chunks: Iterable[Chunk], embeddings: np.ndarray | Iterable[Sequence[float]]
+    ) -> list[tuple[VectorStore | NumpyVectorStore, list[Chunk], np.ndarray]]:
+        """Split chunks and embeddings into (partition, chunks, embeddings) groups."""
+        chunks = list(chunks)
+        if not isinstance(embeddings, np.ndarray):
+            embeddings = np.asarray(list(embeddings), dtype=np.float32)
+        if len(chunks) != len(embeddings):
+            raise ValueError(f"Got {len(chunks)} chunks but {len(embeddings)} embeddings.")
+        rows: dict[str, list[int]] = {}
+        for row, chunk in enumerate(chunks):
+            rows.setdefault(chunk.source_type, []).append(row)
+        return [
+            (self.partition(source_type), [chunks[i] for i in group], embeddings[group])
+            for source_type, group in rows.items()
+        ]
+
+    def add_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        embeddings: np.ndarray | Iterable[Sequence[float]],
+    ) -> int:
+        """Add chunks to the partitions of their source types, in parallel.
+
+        Args:
+            chunks: Text chunks to store.
+            embeddings: Corresponding embedding vectors, in chunk order.
+
+        Returns:
+            Number of points upserted.
+
+        Raises:
+            ValueError: If chunks and embeddings differ in length, or a chunk
+                has a source type without a partition.
+        """
+        futures = [
+            self._executor.submit(store.add_chunks, group, vectors)
+            for store, group, vectors in self._route(chunks, embeddings)
+        ]
+        return sum(future.result() for future in futures)
+
+    async def aadd_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        embeddings: np.ndarray | Iterable[Sequence[float]],
+    ) -> int:
+        """Async variant of add_chunks; partitions are written concurrently."""
+        counts = await asyncio.gather(
+            *(
+                store.aadd_chunks(group, vectors)
+                for store, group, vectors in self._route(chunks, embeddings)
+            )
+        )
+        return sum(counts)
+
+    def search(
+        self,
+        query_embedding: np.ndarray | Sequence[float],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_text: str | None = None,
+        with_vectors: bool = False,
+    ) -> list[SearchResult]:
+        """Search all partitions concurrently and merge the results by score.
+
+        Each partition returns its own top_k, so for dense search the
+        merged top_k is the same as searching one collection. With hybrid
+        search, partitions return reciprocal rank fusion scores, which only
+        depend on ranks within the partition: the merge then interleaves
+        the partitions' rankings rather than reproducing a single-collection
+        ranking. A filter on source_type only queries that partition.
+        Arguments are the same as for VectorStore.search.
+
+        Returns:
+            List of SearchResult objects sorted by relevance (descending score).
+        """
+        args = (query_embedding, top_k, score_threshold, hnsw_ef, search_filter)
+        futures = [
+            self._executor.submit(store.search, *args, query_text, with_vectors)
+            for store in self._targets(search_filter)
+        ]
+        return _merge((future.result() for future in futures), top_k)
+
+    async def asearch(
+        self,
+        query_embedding: np.ndarray | Sequence[float],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_text: str | None = None,
+        with_vectors: bool = False,
+    ) -> list[SearchResult]:
+        """Async variant of search; partitions are queried with asyncio.gather."""
+        args = (query_embedding, top_k, score_threshold, hnsw_ef, search_filter)
+        result_lists = await asyncio.gather(
+            *(
+                store.asearch(*args, query_text, with_vectors)
+                for store in self._targets(search_filter)
+            )
+        )
+        return _merge(result_lists, top_k)
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray | Sequence[Sequence[float]],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_texts: Sequence[str] | None = None,
+        with_vectors: bool = False,
+    ) -> list[list[SearchResult]]:
+        """Send the batch to all partitions concurrently and merge per query.
+
+        Returns:
+            One list of SearchResult objects per query, in query order.
+        """
+        args = (query_embeddings, top_k, score_threshold, hnsw_ef, search_filter)
+        futures = [
+            self._executor.submit(store.search_batch, *args, query_texts, with_vectors)
+            for store in self._targets(search_filter)
+        ]
+        per_partition = [future.result() for future in futures]
+        if not per_partition:
+            return []
+        return [_merge(per_query, top_k) for per_query in zip(*per_partition, strict=True)]
+
+    def delete_points(self, ids: Sequence[str]) -> None:
+        """Delete points by ID from every partition. Unknown IDs are ignored."""
+        for store in self._partitions.values():
+            store.delete_points(ids)
+
+    def delete_collection(self) -> None:
+        """Delete every partition's collection."""
+        for store in self._partitions.values():
+            store.delete_collection()
+
+    def begin_rebuild(self) -> None:
+        """Start rebuilding every partition (see VectorStore.begin_rebuild)."""
+        for store in self._partitions.values():
+            store.begin_rebuild()
+
+    def commit_rebuild(self) -> None:
+        """Finish the rebuild of every partition that is being rebuilt."""
+        for store in self._partitions.values():
+            store.commit_rebuild()
+
+    def close(self) -> None:
+        """Close every partition and stop the worker threads."""
+        for store in self._partitions.values():
+            store.close()
+        self._executor.shutdown(wait=False)
+
+    async def aclose(self) -> None:
+        """Close every partition's async client."""
+        await asyncio.gather(*(store.aclose() for store in self._partitions.values()))
+
+
+# Any vector store build_pipeline may create, depending on the settings.
+AnyVectorStore = VectorStore | NumpyVectorStore | PartitionedVectorStore
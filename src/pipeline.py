@@ -5,71 +5,704 @@ duplicated setup code across main.py, tests, and evals.
 """
 
 import logging
+import re
+import shutil
+import time
 from pathlib import Path
 
+import numpy as np
+
 from src.agents.orchestrator import OrchestratorAgent
 from src.config import Settings
+from src.docstore import ChunkDocstore
 from src.document_loader import chunk_document, load_and_chunk
+from src.embedding_cache import EmbeddingCache
 from src.embeddings import EmbeddingModel
+from src.index_artifact import export_artifact, load_artifact
+from src.index_manifest import diff_sources, load_manifest, save_manifest, source_entries
 from src.loaders.bookmark_loader import load_bookmarks
+from src.models import SOURCE_TYPES, Chunk
+from src.numpy_store import NumpyVectorStore
+from src.partitioned_store import AnyVectorStore, PartitionedVectorStore
+from src.reduction import REDUCTION_METHODS, EmbeddingProjection
 from src.vectorstore import VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Supported values for settings.vector_store_backend.
+VECTOR_STORE_BACKENDS = ("qdrant", "numpy")
 
-def build_pipeline(settings: Settings, *, reindex: bool = False) -> OrchestratorAgent:
-    """Build the full RAG pipeline: load, chunk, embed, index, and create orchestrator.
+# Settings that source_collection_settings may override per source type.
+SOURCE_COLLECTION_FIELDS = (
+    "qdrant_upsert_batch_size",
+    "qdrant_upsert_parallel",
+    "qdrant_quantization",
+    "qdrant_quantization_always_ram",
+    "qdrant_search_oversampling",
+    "qdrant_search_rescore",
+    "qdrant_hnsw_m",
+    "qdrant_hnsw_ef_construct",
+    "qdrant_hnsw_ef",
+    "qdrant_on_disk_vectors",
+    "qdrant_on_disk_hnsw",
+    "qdrant_on_disk_payload",
+)
 
-    Loads notes from the notes directory, and optionally syncs Firefox bookmarks
-    if bookmark_sync_enabled is True.
 
-    Args:
-        settings: Application settings.
-        reindex: If True, clear existing data and reindex everything from scratch.
+def _load_projection(settings: Settings) -> EmbeddingProjection | None:
+    """Load the saved projection if it matches the configured reduction."""
+    path = Path(settings.embedding_projection_path)
+    if not path.exists():
+        return None
+    projection = EmbeddingProjection.load(path)
+    # A "pca" index may hold a truncation fallback (see _fit_projection).
+    methods = {settings.embedding_reduction}
+    if settings.embedding_reduction == "pca":
+        methods.add("truncate")
+    if not any(
+        projection.matches(method, settings.embedding_reduced_dimension, settings.embedding_model)
+        for method in methods
+    ):
+        return None
+    return projection
 
-    Returns:
-        A fully initialized OrchestratorAgent ready to answer questions.
-        The underlying vectorstore and embedding_model are accessible
-        via orchestrator.vectorstore and orchestrator.embedding_model.
+
+def _stores(vectorstore: AnyVectorStore) -> list[VectorStore | NumpyVectorStore]:
+    """The single stores behind a vector store (its partitions, or itself)."""
+    if isinstance(vectorstore, PartitionedVectorStore):
+        return list(vectorstore.partitions.values())
+    return [vectorstore]
+
+
+def _projection_copy(settings: Settings, collection: str) -> Path:
+    """Copy of the projection a collection version was built with, kept for rollback."""
+    path = Path(settings.embedding_projection_path)
+    return path.with_name(f"{path.stem}.{collection}{path.suffix}")
+
+
+def _keep_projection_copies(settings: Settings, vectorstore: AnyVectorStore) -> None:
+    """Copy the projection for each serving collection version and drop copies of deleted ones.
+
+    rollback_index restores the copy of the version it switches back to, so
+    queries are projected the way that version's vectors were.
     """
+    projection_path = Path(settings.embedding_projection_path)
+    for store in _stores(vectorstore):
+        versions = store.versions()
+        serving = store.serving_collection()
+        if projection_path.exists() and serving in versions:
+            copy = _projection_copy(settings, serving)
+            if not copy.exists():
+                shutil.copyfile(projection_path, copy)
+        pattern = re.compile(rf"{re.escape(store.collection_name)}_v\d+")
+        prefix, suffix = f"{projection_path.stem}.", projection_path.suffix
+        for copy in projection_path.parent.glob(f"{prefix}*{suffix}"):
+            collection = copy.name[len(prefix) : len(copy.name) - len(suffix)]
+            if pattern.fullmatch(collection) and collection not in versions:
+                copy.unlink()
+
 
-    embedding_model = EmbeddingModel(model_name=settings.embedding_model)
-    vectorstore = VectorStore(
+def _collection_key(settings: Settings) -> str:
+    """Identify the collection layout recorded in the index manifest.
+
+    With a docstore, Qdrant payloads hold no chunk text, so the docstore file
+    is part of the layout: toggling or moving it rebuilds the index.
+    """
+    key = settings.qdrant_collection
+    if settings.per_source_collections:
+        key += "_*"
+    if settings.vector_store_backend == "qdrant" and settings.docstore_path:
+        key += f"+docstore:{settings.docstore_path}"
+    return key
+
+
+def _delete_previous_layout(settings: Settings, manifest: dict, embedding_dimension: int) -> None:
+    """Delete the index of the other collection layout, if the manifest was written for it.
+
+    Switching PER_SOURCE_COLLECTIONS rebuilds the index into new collections
+    (or directories); without this, the ones of the previous layout would
+    stay in storage forever.
+    """
+    layout = manifest.get("collection", "").split("+docstore:")[0]
+    if layout == f"{settings.qdrant_collection}_*":
+        per_source = True
+    elif layout == settings.qdrant_collection:
+        per_source = False
+    else:
+        return
+    if per_source == settings.per_source_collections:
+        return
+    previous = _create_vectorstore(
+        settings.model_copy(update={"per_source_collections": per_source}), embedding_dimension
+    )
+    try:
+        if settings.vector_store_backend == "qdrant":
+            names = [store.collection_name for store in _stores(previous)]
+            logger.info("Deleting collections of the previous layout: %s", ", ".join(names))
+        else:
+            logger.info("Deleting the index of the previous layout")
+        previous.delete_collection()
+    finally:
+        previous.close()
+
+
+def _source_settings(settings: Settings, source_type: str) -> Settings:
+    """Settings for the collection of one source type, with its overrides applied."""
+    update = {
+        **settings.source_collection_settings.get(source_type, {}),
+        "qdrant_collection": f"{settings.qdrant_collection}_{source_type}",
+    }
+    # Embedded storage is locked by the client that opens it, so every
+    # partition gets its own directory (and its own docstore file).
+    if settings.qdrant_path:
+        update["qdrant_path"] = str(Path(settings.qdrant_path) / source_type)
+    if settings.numpy_store_path:
+        update["numpy_store_path"] = str(Path(settings.numpy_store_path) / source_type)
+    if settings.docstore_path:
+        docstore_path = Path(settings.docstore_path)
+        update["docstore_path"] = str(
+            docstore_path.with_stem(f"{docstore_path.stem}_{source_type}")
+        )
+    return settings.model_copy(update=update)
+
+
+def _create_vectorstore(settings: Settings, embedding_dimension: int) -> AnyVectorStore:
+    """Create the vector store, with one partition per source type if configured."""
+    if settings.per_source_collections:
+        return PartitionedVectorStore(
+            {
+                source_type: _create_single_vectorstore(
+                    _source_settings(settings, source_type), embedding_dimension
+                )
+                for source_type in SOURCE_TYPES
+            }
+        )
+    return _create_single_vectorstore(settings, embedding_dimension)
+
+
+def _create_single_vectorstore(
+    settings: Settings, embedding_dimension: int
+) -> VectorStore | NumpyVectorStore:
+    """Create the vector store selected by settings.vector_store_backend."""
+    if settings.vector_store_backend == "numpy":
+        return NumpyVectorStore(
+            path=settings.numpy_store_path or None,
+            embedding_dimension=embedding_dimension,
+            hybrid=settings.hybrid_search_enabled,
+            hybrid_prefetch_k=settings.hybrid_prefetch_k,
+        )
+    return VectorStore(
         collection_name=settings.qdrant_collection,
         url=settings.qdrant_url,
         use_memory=settings.qdrant_use_memory,
-        embedding_dimension=settings.embedding_dimension,
+        embedding_dimension=embedding_dimension,
+        upsert_batch_size=settings.qdrant_upsert_batch_size,
+        upsert_parallel=settings.qdrant_upsert_parallel,
+        path=settings.qdrant_path or None,
+        quantization=settings.qdrant_quantization,
+        quantization_always_ram=settings.qdrant_quantization_always_ram,
+        oversampling=settings.qdrant_search_oversampling,
+        rescore=settings.qdrant_search_rescore,
+        hnsw_m=settings.qdrant_hnsw_m,
+        hnsw_ef_construct=settings.qdrant_hnsw_ef_construct,
+        hnsw_ef=settings.qdrant_hnsw_ef or None,
+        on_disk_vectors=settings.qdrant_on_disk_vectors,
+        on_disk_hnsw=settings.qdrant_on_disk_hnsw,
+        on_disk_payload=settings.qdrant_on_disk_payload,
+        use_alias=settings.qdrant_use_alias,
+        keep_previous=settings.qdrant_keep_previous_collections,
+        docstore=ChunkDocstore(settings.docstore_path) if settings.docstore_path else None,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+        grpc_port=settings.qdrant_grpc_port,
+        timeout=settings.qdrant_timeout or None,
+        pool_size=settings.qdrant_pool_size or None,
+        hybrid=settings.hybrid_search_enabled,
+        hybrid_prefetch_k=settings.hybrid_prefetch_k,
     )
 
+
+def _embedding_key(settings: Settings) -> str:
+    """Describe the settings that determine the indexed vectors.
+
+    The ONNX file only counts for the onnx backend; other backends ignore it.
+    """
+    onnx_file = settings.embedding_onnx_file if settings.embedding_backend == "onnx" else ""
+    key = f"{settings.embedding_model}#{settings.embedding_backend}:{onnx_file}"
+    if settings.embedding_reduction != "none":
+        key += f"|{settings.embedding_reduction}:{settings.embedding_reduced_dimension}"
+    return key
+
+
+def _fit_projection(settings: Settings, embeddings: np.ndarray) -> EmbeddingProjection:
+    """Fit the configured projection on the full-dimension corpus embeddings.
+
+    PCA needs at least as many chunks as target dimensions; smaller corpora
+    fall back to truncation, which is kept until the next --reindex.
+    """
+    dimension = settings.embedding_reduced_dimension
+    if settings.embedding_reduction == "pca" and len(embeddings) >= dimension:
+        return EmbeddingProjection.fit_pca(embeddings, dimension, settings.embedding_model)
+    if settings.embedding_reduction == "pca":
+        logger.warning(
+            "Only %d chunks to fit PCA to %d dimensions — truncating instead",
+            len(embeddings),
+            dimension,
+        )
+    return EmbeddingProjection.truncation(embeddings.shape[1], dimension, settings.embedding_model)
+
+
+def _validate_settings(settings: Settings) -> None:
+    """Reject unsupported reduction, vector store, per-source collection and MMR settings."""
+    if settings.embedding_reduction not in REDUCTION_METHODS:
+        raise ValueError(
+            f"Unknown embedding reduction: {settings.embedding_reduction!r}. "
+            f"Expected one of {REDUCTION_METHODS}."
+        )
+    if settings.vector_store_backend not in VECTOR_STORE_BACKENDS:
+        raise ValueError(
+            f"Unknown vector store backend: {settings.vector_store_backend!r}. "
+            f"Expected one of {VECTOR_STORE_BACKENDS}."
+        )
+    for source_type, overrides in settings.source_collection_settings.items():
+        if source_type not in SOURCE_TYPES:
+            raise ValueError(
+                f"Unknown source type in source_collection_settings: {source_type!r}. "
+                f"Expected one of {SOURCE_TYPES}."
+            )
+        unknown = set(overrides) - set(SOURCE_COLLECTION_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Settings {sorted(unknown)} cannot be set per source type. "
+                f"Expected any of {SOURCE_COLLECTION_FIELDS}."
+            )
+    if not 0.0 <= settings.mmr_lambda <= 1.0:
+        raise ValueError(f"MMR lambda must be between 0 and 1, got {settings.mmr_lambda}.")
+
+
+def _create_embedding_model(settings: Settings, lazy: bool) -> EmbeddingModel:
+    """Create the embedding model, with the persistent chunk cache if enabled."""
+    cache = None
+    if settings.embedding_cache_enabled:
+        cache = EmbeddingCache(
+            settings.embedding_cache_path,
+            max_entries=settings.embedding_cache_max_entries,
+        )
+    return EmbeddingModel(
+        model_name=settings.embedding_model,
+        cache=cache,
+        batch_size=settings.embedding_batch_size,
+        workers=settings.embedding_workers,
+        backend=settings.embedding_backend,
+        onnx_file=settings.embedding_onnx_file or None,
+        lazy=lazy,
+        dimension=settings.embedding_dimension,
+    )
+
+
+def _embed_chunks(embedding_model: EmbeddingModel, chunks: list[Chunk]) -> np.ndarray:
+    """Embed chunks at full dimension and log embedding cache statistics."""
+    embeddings = embedding_model.embed_texts_full_array([c.text for c in chunks])
+    cache = embedding_model.cache
+    if cache is not None:
+        logger.info(
+            "Embedding cache: %d hits, %d misses (%d entries)",
+            cache.hits,
+            cache.misses,
+            len(cache),
+        )
+    return embeddings
+
+
+def _bookmark_chunks(settings: Settings, *, full_sync: bool, save_state: bool) -> list[Chunk]:
+    """Load Firefox bookmarks and split them into chunks.
+
+    Args:
+        settings: Application settings.
+        full_sync: Load every bookmark, not only those added since the last sync.
+        save_state: Record the synced bookmarks in the sync state file.
+
+    Returns:
+        Chunks of the loaded bookmarks.
+    """
+    logger.info("Loading bookmarks (full sync: %s)...", full_sync)
+    bookmark_docs = load_bookmarks(
+        profile_path=settings.firefox_profile_path,
+        sync_state_path=settings.bookmark_sync_state_path,
+        fetch_timeout=settings.bookmark_fetch_timeout,
+        max_content_length=settings.bookmark_max_content_length,
+        full_sync=full_sync,
+        save_state=save_state,
+    )
+    return [
+        chunk
+        for doc in bookmark_docs
+        for chunk in chunk_document(doc, settings.chunk_size, settings.chunk_overlap)
+    ]
+
+
+def _index_corpus(
+    settings: Settings,
+    embedding_model: EmbeddingModel,
+    reindex: bool,
+    reindex_source: str | None = None,
+) -> AnyVectorStore:
+    """Load notes and bookmarks, embed what the index lacks, and return the store."""
+    if reindex_source is not None and not settings.per_source_collections:
+        raise ValueError("Reindexing a single source type needs PER_SOURCE_COLLECTIONS=true.")
+    reduce = settings.embedding_reduction != "none"
+    projection_path = Path(settings.embedding_projection_path)
+    projection = None
+    if reduce and not reindex:
+        projection = _load_projection(settings)
+        if projection is None:
+            logger.info("No saved projection matches the reduction settings, reindexing")
+            reindex = True
+    elif not reduce and projection_path.exists():
+        # The existing index holds reduced vectors; rebuild it at full dimension.
+        logger.info("Embedding reduction disabled, reindexing at full dimension")
+        reindex = True
+
+    vectorstore_dimension = (
+        settings.embedding_reduced_dimension if reduce else settings.embedding_dimension
+    )
+    vectorstore = _create_vectorstore(settings, vectorstore_dimension)
+
+    # An index built with another model, backend or collection layout cannot
+    # be updated in place: its vectors live in a different embedding space.
+    embedding_key = _embedding_key(settings)
+    manifest_path = Path(settings.index_manifest_path)
+    previous_manifest = load_manifest(manifest_path) if vectorstore.persistent else None
+    manifest = None if reindex else previous_manifest
+    if manifest is not None and (
+        manifest.get("collection") != _collection_key(settings)
+        or manifest.get("embedding_key") != embedding_key
+    ):
+        logger.info("Index was built with different embedding or collection settings, reindexing")
+        reindex = True
+        manifest = None
+
     if reindex:
-        logger.info("Reindex requested — clearing existing data...")
-        vectorstore.delete_collection()
+        logger.info("Reindex requested — rebuilding the index from scratch...")
+        vectorstore.begin_rebuild()
+        if projection_path.exists():
+            projection_path.unlink()
+            logger.info("Removed embedding projection: %s", projection_path)
         sync_state = Path(settings.bookmark_sync_state_path)
         if sync_state.exists():
             sync_state.unlink()
             logger.info("Removed bookmark sync state: %s", sync_state)
+    elif reindex_source is not None:
+        logger.info("Reindex of %s collection requested — rebuilding it...", reindex_source)
+        vectorstore.partition(reindex_source).begin_rebuild()
+        sync_state = Path(settings.bookmark_sync_state_path)
+        if reindex_source == "bookmark" and sync_state.exists():
+            sync_state.unlink()
+            logger.info("Removed bookmark sync state: %s", sync_state)
+
+    created = vectorstore.ensure_collection()
+    notes_store, notes_created, bookmarks_created = vectorstore, created, created
+    if isinstance(vectorstore, PartitionedVectorStore):
+        notes_store = vectorstore.partition("note")
+        notes_created = "note" in vectorstore.created
+        bookmarks_created = "bookmark" in vectorstore.created
 
-    # Load and chunk notes
+    # Load and chunk notes, then diff them against the manifest of the
+    # persistent index so only changed sources are embedded and upserted.
     chunks = load_and_chunk(settings.notes_dir, settings.chunk_size, settings.chunk_overlap)
+    sources = source_entries(chunks)
+    if manifest is not None and not notes_created:
+        changed, stale = diff_sources(manifest.get("sources", {}), sources)
+        if manifest.get("points") != notes_store.count():
+            # The index was modified outside this process; upsert every note.
+            changed = set(sources)
+        notes_store.delete_points(stale)
+        chunks = [c for c in chunks if c.source in changed]
+        logger.info(
+            "Index update: %d of %d note sources changed, %d stale points deleted",
+            len(changed),
+            len(sources),
+            len(stale),
+        )
 
-    # Load and chunk bookmarks (if enabled)
+    # Load and chunk bookmarks (if enabled). A new (bookmark) collection holds
+    # none of the previously synced bookmarks, so sync them all again.
     if settings.bookmark_sync_enabled:
-        logger.info("Bookmark sync enabled, loading bookmarks...")
-        bookmark_docs = load_bookmarks(
-            profile_path=settings.firefox_profile_path,
-            sync_state_path=settings.bookmark_sync_state_path,
-            fetch_timeout=settings.bookmark_fetch_timeout,
-            max_content_length=settings.bookmark_max_content_length,
-        )
-        for doc in bookmark_docs:
-            chunks.extend(chunk_document(doc, settings.chunk_size, settings.chunk_overlap))
+        chunks.extend(_bookmark_chunks(settings, full_sync=bookmarks_created, save_state=True))
         logger.info("Total chunks after bookmark sync: %d", len(chunks))
 
-    embeddings = embedding_model.embed_texts([c.text for c in chunks])
+    embeddings = (
+        _embed_chunks(embedding_model, chunks)
+        if chunks
+        else np.empty((0, settings.embedding_dimension), dtype=np.float32)
+    )
+    if reduce and projection is None:
+        # Also for an empty corpus (as a truncation): the collection was created
+        # at the reduced dimension, so queries must be projected to it.
+        projection = _fit_projection(settings, embeddings)
+        projection.save(projection_path)
+        logger.info(
+            "Saved %s projection (%d -> %d dims): %s",
+            projection.method,
+            projection.input_dimension,
+            projection.output_dimension,
+            projection_path,
+        )
+    if chunks:
+        if projection is not None:
+            embeddings = projection.apply(embeddings)
+        vectorstore.add_chunks(chunks, embeddings)
+    # A rebuilt index starts serving only now that it is complete.
+    vectorstore.commit_rebuild()
+    if previous_manifest is not None:
+        _delete_previous_layout(settings, previous_manifest, vectorstore_dimension)
+    if settings.vector_store_backend == "qdrant" and settings.qdrant_use_alias:
+        _keep_projection_copies(settings, vectorstore)
+    embedding_model.projection = projection
+    if vectorstore.persistent:
+        save_manifest(
+            manifest_path,
+            {
+                "collection": _collection_key(settings),
+                "embedding_key": embedding_key,
+                "points": notes_store.count(),
+                "sources": sources,
+            },
+        )
+    return vectorstore
+
+
+def _load_index_artifact(
+    settings: Settings, embedding_model: EmbeddingModel, reindex: bool
+) -> AnyVectorStore:
+    """Bulk-load the prebuilt index at settings.index_artifact_path into the vector store.
+
+    Unless reindex is set, a persistent store that already holds the
+    artifact (same embedding configuration, sources and point count per
+    the index manifest) is used as is. The artifact's projection and the
+    index manifest are saved like _index_corpus saves them, so a later
+    startup without the artifact updates the index incrementally.
+    """
+    artifact = load_artifact(settings.index_artifact_path)
+    manifest = artifact.manifest
+    embedding_key = _embedding_key(settings)
+    if manifest["embedding_key"] != embedding_key:
+        raise ValueError(
+            f"Index artifact was embedded with {manifest['embedding_key']!r}, but the "
+            f"EMBEDDING_* settings give {embedding_key!r}; queries would be embedded "
+            "in another space."
+        )
+    embedding_model.projection = artifact.projection
+    vectorstore = _create_vectorstore(settings, manifest["dimension"])
+    notes_store = vectorstore
+    if isinstance(vectorstore, PartitionedVectorStore):
+        notes_store = vectorstore.partition("note")
+    manifest_path = Path(settings.index_manifest_path)
+    index_manifest = load_manifest(manifest_path) if vectorstore.persistent else None
+    if (
+        not reindex
+        and index_manifest is not None
+        and index_manifest.get("collection") == _collection_key(settings)
+        and index_manifest.get("embedding_key") == embedding_key
+        and index_manifest.get("artifact_sources") == manifest["sources"]
+        and index_manifest.get("points") == notes_store.count()
+    ):
+        logger.info("Index already holds the artifact at %s", settings.index_artifact_path)
+        return vectorstore
+
+    vectorstore.begin_rebuild()
     vectorstore.ensure_collection()
-    vectorstore.add_chunks(chunks, embeddings)
+    vectorstore.add_chunks(artifact.chunks, artifact.embeddings)
+    vectorstore.commit_rebuild()
+    if index_manifest is not None:
+        _delete_previous_layout(settings, index_manifest, manifest["dimension"])
+    logger.info(
+        "Loaded %d chunks from index artifact %s",
+        len(artifact.chunks),
+        settings.index_artifact_path,
+    )
+    projection_path = Path(settings.embedding_projection_path)
+    if artifact.projection is not None:
+        artifact.projection.save(projection_path)
+    else:
+        projection_path.unlink(missing_ok=True)
+    if settings.vector_store_backend == "qdrant" and settings.qdrant_use_alias:
+        _keep_projection_copies(settings, vectorstore)
+    if vectorstore.persistent:
+        save_manifest(
+            manifest_path,
+            {
+                "collection": _collection_key(settings),
+                "embedding_key": embedding_key,
+                "points": notes_store.count(),
+                # Notes only, as in _index_corpus: bookmark sources listed here
+                # would be deleted as stale by a startup without the artifact.
+                "sources": source_entries(
+                    [chunk for chunk in artifact.chunks if chunk.source_type == "note"]
+                ),
+                "artifact_sources": manifest["sources"],
+            },
+        )
+    return vectorstore
+
+
+def rollback_index(settings: Settings) -> dict[str, str]:
+    """Serve the previous version of the Qdrant collection(s) again.
+
+    Points each collection alias back at the version that was replaced by
+    the last rebuild, and restores the embedding projection that version
+    was built with. The index manifest is removed, so the next startup
+    re-upserts every note into the restored collection.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Mapping from alias to the collection it now points at.
+
+    Raises:
+        ValueError: If the Qdrant backend with aliases is not configured,
+            there is no previous version to roll back to, or, with embedding
+            reduction, the projection of the previous version is unknown.
+    """
+    _validate_settings(settings)
+    if settings.vector_store_backend != "qdrant" or not settings.qdrant_use_alias:
+        raise ValueError("Rollback needs VECTOR_STORE_BACKEND=qdrant and QDRANT_USE_ALIAS=true.")
+    vectorstore = _create_vectorstore(settings, settings.embedding_dimension)
+    try:
+        stores = _stores(vectorstore)
+        copies = [_projection_copy(settings, store.rollback_target()) for store in stores]
+        saved = {copy.read_bytes() for copy in copies if copy.exists()}
+        if len(saved) > 1 or (saved and not all(copy.exists() for copy in copies)):
+            raise ValueError("The previous collections were built with different projections.")
+        if not saved and settings.embedding_reduction != "none":
+            raise ValueError(
+                "No embedding projection was saved for the previous collection; "
+                "use --reindex instead."
+            )
+        restored = {store.collection_name: store.rollback() for store in stores}
+    finally:
+        vectorstore.close()
+    projection_path = Path(settings.embedding_projection_path)
+    if saved:
+        projection_path.write_bytes(saved.pop())
+    else:
+        projection_path.unlink(missing_ok=True)
+    Path(settings.index_manifest_path).unlink(missing_ok=True)
+    return restored
+
+
+def export_index(settings: Settings, path: str | Path) -> dict:
+    """Embed the whole corpus and write it as a portable index artifact.
+
+    All notes and, if bookmark sync is enabled, all bookmarks are loaded and
+    embedded (reusing the embedding cache). With a reduction configured, a
+    projection is fitted on the full corpus and exported with it. Servers
+    load the artifact through INDEX_ARTIFACT_PATH.
 
-    return OrchestratorAgent(
+    Args:
+        settings: Application settings.
+        path: Directory to write the artifact to.
+
+    Returns:
+        The artifact manifest.
+
+    Raises:
+        ValueError: If embedding_reduction or vector_store_backend is not supported.
+    """
+    _validate_settings(settings)
+    embedding_model = _create_embedding_model(settings, lazy=settings.embedding_lazy_load)
+    chunks = load_and_chunk(settings.notes_dir, settings.chunk_size, settings.chunk_overlap)
+    if settings.bookmark_sync_enabled:
+        # The local index does not get these bookmarks, so keep its sync state.
+        chunks.extend(_bookmark_chunks(settings, full_sync=True, save_state=False))
+
+    embeddings = _embed_chunks(embedding_model, chunks)
+    projection = None
+    if settings.embedding_reduction != "none" and chunks:
+        projection = _fit_projection(settings, embeddings)
+        embeddings = projection.apply(embeddings)
+    return export_artifact(
+        path,
+        chunks,
+        embeddings,
+        projection,
+        embedding_model=settings.embedding_model,
+        embedding_key=_embedding_key(settings),
+        chunk_size=settings.chunk_size,
+        chunk_overlap=settings.chunk_overlap,
+    )
+
+
+def build_pipeline(
+    settings: Settings,
+    *,
+    reindex: bool = False,
+    reindex_source: str | None = None,
+    timings: dict[str, float] | None = None,
+) -> OrchestratorAgent:
+    """Build the full RAG pipeline: load, chunk, embed, index, and create orchestrator.
+
+    Loads notes from the notes directory, and optionally syncs Firefox bookmarks
+    if bookmark_sync_enabled is True. With a persistent index (QDRANT_PATH or a
+    remote server), only notes that changed since the index manifest was saved
+    are re-embedded and upserted, and points of edited or removed chunks are
+    deleted; bookmarks are indexed as they are synced. With
+    index_artifact_path set, the prebuilt index exported by export_index is
+    bulk-loaded instead and the embedding model is only loaded for queries.
+
+    Args:
+        settings: Application settings.
+        reindex: If True, clear existing data and reindex everything from scratch.
+            With index_artifact_path set, the artifact is loaded again even
+            if the store already holds it.
+        reindex_source: Clear and reindex only the collection of this source
+            type ("note" or "bookmark"); needs per_source_collections.
+        timings: Optional dict that receives the wall-clock seconds spent in
+            each startup phase ("model_load", "indexing", "agents").
+
+    Returns:
+        A fully initialized OrchestratorAgent ready to answer questions.
+        The underlying vectorstore and embedding_model are accessible
+        via orchestrator.vectorstore and orchestrator.embedding_model.
+
+    Raises:
+        ValueError: If embedding_reduction, vector_store_backend or a per-source
+            collection setting is not supported, reindex_source is given
+            without per_source_collections or with index_artifact_path, or
+            the index artifact was built with other embedding settings.
+    """
+    _validate_settings(settings)
+    if reindex_source is not None and settings.index_artifact_path:
+        raise ValueError(
+            "Reindexing a single source type is not supported with INDEX_ARTIFACT_PATH; "
+            "use --reindex to load the artifact again."
+        )
+    timings = timings if timings is not None else {}
+    phase_start = time.perf_counter()
+
+    # A prebuilt artifact needs the model only for queries, so load it lazily.
+    embedding_model = _create_embedding_model(
+        settings, lazy=settings.embedding_lazy_load or bool(settings.index_artifact_path)
+    )
+    timings["model_load"] = time.perf_counter() - phase_start
+    phase_start = time.perf_counter()
+
+    if settings.index_artifact_path:
+        vectorstore = _load_index_artifact(settings, embedding_model, reindex)
+    else:
+        vectorstore = _index_corpus(settings, embedding_model, reindex, reindex_source)
+    timings["indexing"] = time.perf_counter() - phase_start
+    phase_start = time.perf_counter()
+
+    orchestrator = OrchestratorAgent(
         vectorstore=vectorstore,
         embedding_model=embedding_model,
     )
+    timings["agents"] = time.perf_counter() - phase_start
+    logger.info(
+        "Startup: model load %.2fs, indexing %.2fs, agents %.2fs",
+        timings["model_load"],
+        timings["indexing"],
+        timings["agents"],
+    )
+    return orchestrator
@@ -0,0 +1,147 @@
+"""Embedding dimensionality reduction between EmbeddingModel and VectorStore.
+
+Two methods are supported:
+
+- "pca": a PCA projection fitted on the corpus embeddings.
+- "truncate": keep the first N dimensions (Matryoshka-style truncation).
+
+Both renormalize the reduced vectors to unit length, so cosine scores stay
+comparable. The same projection must be applied to corpus chunks and to
+queries, so it is saved next to the index and reloaded on restart.
+"""
+
+from pathlib import Path
+
+import numpy as np
+
+REDUCTION_METHODS = ("none", "pca", "truncate")
+
+
+class EmbeddingProjection:
+    """A fitted linear projection to a smaller embedding dimension."""
+
+    def __init__(
+        self,
+        method: str,
+        input_dimension: int,
+        output_dimension: int,
+        mean: np.ndarray | None = None,
+        components: np.ndarray | None = None,
+        source_model: str = "",
+    ):
+        """Initialize a projection. Prefer the fit_pca/truncation constructors.
+
+        Args:
+            method: "pca" or "truncate".
+            input_dimension: Dimension of the model embeddings.
+            output_dimension: Dimension after reduction.
+            mean: Corpus mean subtracted before projecting (PCA only).
+            components: Projection matrix of shape (input, output) (PCA only).
+            source_model: Identifier of the embedding model the projection
+                was fitted for, used to detect stale projections.
+        """
+        self.method = method
+        self.input_dimension = input_dimension
+        self.output_dimension = output_dimension
+        self.source_model = source_model
+        self._mean = mean
+        self._components = components
+
+    @classmethod
+    def fit_pca(
+        cls, embeddings: np.ndarray, dimension: int, source_model: str = ""
+    ) -> "EmbeddingProjection":
+        """Fit a PCA projection on corpus embeddings.
+
+        Args:
+            embeddings: Corpus embeddings of shape (n, input_dimension).
+            dimension: Target dimension.
+            source_model: Identifier of the embedding model.
+
+        Returns:
+            The fitted projection.
+
+        Raises:
+            ValueError: If the corpus has fewer vectors than the target dimension.
+        """
+        n, input_dimension = embeddings.shape
+        if n < dimension:
+            raise ValueError(
+                f"PCA to {dimension} dimensions needs at least {dimension} embeddings, got {n}."
+            )
+        data = embeddings.astype(np.float64)
+        mean = data.mean(axis=0)
+        # Rows of vt are principal axes, sorted by explained variance.
+        _, _, vt = np.linalg.svd(data - mean, full_matrices=False)
+        components = vt[:dimension].T.astype(np.float32)
+        return cls(
+            "pca",
+            input_dimension,
+            dimension,
+            mean=mean.astype(np.float32),
+            components=components,
+            source_model=source_model,
+        )
+
+    @classmethod
+    def truncation(
+        cls, input_dimension: int, dimension: int, source_model: str = ""
+    ) -> "EmbeddingProjection":
+        """Create a projection that keeps the first `dimension` components."""
+        return cls("truncate", input_dimension, dimension, source_model=source_model)
+
+    def apply(self, embeddings: np.ndarray) -> np.ndarray:
+        """Project and renormalize one vector (1-D) or a batch (2-D).
+
+        Args:
+            embeddings: Float array whose last axis is input_dimension.
+
+        Returns:
+            Float32 array whose last axis is output_dimension, unit-normalized.
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if self.method == "pca":
+            reduced = (embeddings - self._mean) @ self._components
+        else:
+            reduced = embeddings[..., : self.output_dimension]
+        norms = np.linalg.norm(reduced, axis=-1, keepdims=True)
+        return np.ascontiguousarray(reduced / np.maximum(norms, 1e-12), dtype=np.float32)
+
+    def matches(self, method: str, dimension: int, source_model: str) -> bool:
+        """Whether this projection was built with the given configuration."""
+        return (
+            self.method == method
+            and self.output_dimension == dimension
+            and self.source_model == source_model
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Save the projection to an .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {}
+        if self.method == "pca":
+            arrays = {"mean": self._mean, "components": self._components}
+        with path.open("wb") as f:
+            np.savez(
+                f,
+                method=self.method,
+                input_dimension=self.input_dimension,
+                output_dimension=self.output_dimension,
+                source_model=self.source_model,
+                **arrays,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EmbeddingProjection":
+        """Load a projection saved with save()."""
+        with np.load(Path(path)) as data:
+            method = str(data["method"])
+            return cls(
+                method,
+                int(data["input_dimension"]),
+                int(data["output_dimension"]),
+                mean=data["mean"] if method == "pca" else None,
+                components=data["components"] if method == "pca" else None,
+                source_model=str(data["source_model"]),
+            )
@@ -0,0 +1,89 @@
+"""BM25 sparse vectors and reciprocal rank fusion for hybrid retrieval.
+
+Dense embeddings miss exact-term queries (names, dates, error codes). With
+hybrid search enabled, every chunk also gets a sparse BM25 vector: term IDs
+with saturated term-frequency weights. The IDF factor is applied at search
+time from the indexed corpus (by Qdrant's IDF modifier, or by
+NumpyVectorStore), so it stays correct as chunks are added and deleted.
+Dense and sparse rankings are combined with reciprocal rank fusion.
+"""
+
+import re
+import zlib
+from collections import Counter
+from collections.abc import Hashable, Sequence
+
+import numpy as np
+
+# Name of the sparse vector in Qdrant collections with hybrid search.
+SPARSE_VECTOR = "bm25"
+
+# Rank offset for reciprocal rank fusion; 60 is the value from the original paper.
+RRF_K = 60
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens (letters, digits and underscores)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def term_id(token: str) -> int:
+    """Stable non-negative 31-bit ID for a token."""
+    return zlib.crc32(token.encode("utf-8")) & 0x7FFFFFFF
+
+
+def bm25_idf(document_frequency: np.ndarray | int, corpus_size: int) -> np.ndarray | float:
+    """BM25 inverse document frequency (the form Qdrant's IDF modifier uses)."""
+    return np.log1p((corpus_size - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+class BM25Encoder:
+    """Encode texts as BM25 sparse vectors (without the IDF factor)."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_length: float = 80.0):
+        """Initialize the encoder.
+
+        Args:
+            k1: Term-frequency saturation.
+            b: Document length normalization strength.
+            avg_length: Expected document length in tokens. Chunks are
+                capped by chunk_size, so a fixed value stands in for the
+                corpus average and keeps vectors stable under updates.
+        """
+        self._k1 = k1
+        self._b = b
+        self._avg_length = avg_length
+
+    def encode_document(self, text: str) -> tuple[list[int], list[float]]:
+        """Encode a chunk as (term IDs, saturated term frequencies)."""
+        tokens = tokenize(text)
+        norm = self._k1 * (1 - self._b + self._b * len(tokens) / self._avg_length)
+        counts = Counter(term_id(token) for token in tokens)
+        ids = sorted(counts)
+        return ids, [counts[i] * (self._k1 + 1) / (counts[i] + norm) for i in ids]
+
+    def encode_query(self, text: str) -> tuple[list[int], list[float]]:
+        """Encode a query as (unique term IDs, unit weights)."""
+        ids = sorted({term_id(token) for token in tokenize(text)})
+        return ids, [1.0] * len(ids)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Hashable]], k: int = RRF_K
+) -> list[tuple[Hashable, float]]:
+    """Fuse ranked lists: each item scores the sum of 1 / (k + rank) over the lists.
+
+    Args:
+        rankings: Ranked lists of item keys, best first.
+        k: Rank offset that damps the influence of the top ranks.
+
+    Returns:
+        (key, fused score) pairs sorted by descending score.
+    """
+    scores: dict[Hashable, float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
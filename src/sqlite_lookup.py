@@ -0,0 +1,28 @@
+"""Batched ``IN (...)`` lookups for the SQLite-backed caches and stores."""
+
+import sqlite3
+from collections.abc import Iterator, Sequence
+
+# SQLite limits the number of bound parameters per statement.
+_LOOKUP_BATCH_SIZE = 500
+
+
+def select_in(
+    conn: sqlite3.Connection, query: str, keys: Sequence, params: Sequence = ()
+) -> Iterator[tuple]:
+    """Run a SELECT whose ``IN`` list holds keys, in batches under the parameter limit.
+
+    Args:
+        conn: Open SQLite connection.
+        query: SELECT statement with a ``{placeholders}`` field inside its
+            ``IN (...)`` clause.
+        keys: Values for the ``IN`` list.
+        params: Parameters bound before the ``IN`` list in every batch.
+
+    Yields:
+        The result rows of all batches.
+    """
+    for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+        batch = keys[start : start + _LOOKUP_BATCH_SIZE]
+        placeholders = ",".join("?" * len(batch))
+        yield from conn.execute(query.format(placeholders=placeholders), [*params, *batch])
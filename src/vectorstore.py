@@ -1,11 +1,174 @@
 """Qdrant vector store operations."""
 
+import asyncio
+import itertools
+import logging
+import re
+import time
 import uuid
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
 
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, PointStruct, VectorParams
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.models import (
+    Batch,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    CollectionParams,
+    CreateAlias,
+    CreateAliasOperation,
+    DatetimeRange,
+    DeleteAlias,
+    DeleteAliasOperation,
+    Distance,
+    FieldCondition,
+    Filter,
+    Fusion,
+    FusionQuery,
+    HnswConfigDiff,
+    MatchAny,
+    MatchValue,
+    Modifier,
+    PayloadSchemaType,
+    PointIdsList,
+    Prefetch,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    ScoredPoint,
+    SearchParams,
+    SparseVector,
+    SparseVectorParams,
+    VectorParams,
+)
 
-from src.models import Chunk, SearchResult
+from src.docstore import ChunkDocstore
+from src.models import Chunk, SearchFilter, SearchResult
+from src.sparse import SPARSE_VECTOR, BM25Encoder
+
+logger = logging.getLogger(__name__)
+
+# Supported vector quantization methods for the collection.
+QUANTIZATION_METHODS = ("none", "scalar", "binary")
+
+# Payload fields indexed for filtered search.
+PAYLOAD_INDEXES = {
+    "source_type": PayloadSchemaType.KEYWORD,
+    "source": PayloadSchemaType.KEYWORD,
+    "date_added": PayloadSchemaType.DATETIME,
+}
+
+
+def point_id(chunk: Chunk) -> str:
+    """Deterministic point ID, so re-adding an unchanged chunk overwrites it."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{chunk.source}:{chunk.chunk_index}:{chunk.text}"))
+
+
+def chunk_payload(chunk: Chunk) -> dict:
+    """Payload stored alongside a chunk's vector."""
+    return {
+        "text": chunk.text,
+        "source": chunk.source,
+        "chunk_index": chunk.chunk_index,
+        "metadata": chunk.metadata,
+        "source_type": chunk.source_type,
+        "date_added": chunk.date_added.isoformat() if chunk.date_added else None,
+    }
+
+
+def index_payload(chunk: Chunk) -> dict:
+    """Payload stored in Qdrant when chunks live in a docstore: filter fields only."""
+    return {
+        "source": chunk.source,
+        "source_type": chunk.source_type,
+        "date_added": chunk.date_added.isoformat() if chunk.date_added else None,
+    }
+
+
+def chunk_from_payload(payload: dict) -> Chunk:
+    """Rebuild a Chunk from its stored payload.
+
+    Raises:
+        ValueError: If the payload holds only index fields, i.e. the
+            collection was built with a docstore that is not configured.
+    """
+    if "text" not in payload:
+        raise ValueError(
+            "Point payload has no chunk text: the collection was indexed with a docstore. "
+            "Set DOCSTORE_PATH to it, or rebuild the index with --reindex."
+        )
+    return Chunk(
+        text=payload["text"],
+        source=payload["source"],
+        chunk_index=payload["chunk_index"],
+        metadata=payload.get("metadata", {}),
+        source_type=payload.get("source_type", "note"),
+        date_added=payload.get("date_added"),
+    )
+
+
+def _dense_vector(point: ScoredPoint) -> list[float] | None:
+    """The dense vector of a point returned with with_vector, or None."""
+    if isinstance(point.vector, dict):
+        # Hybrid collections return named vectors; the dense one is unnamed.
+        return point.vector.get("")
+    return point.vector
+
+
+def _qdrant_filter(search_filter: SearchFilter | None) -> Filter | None:
+    """Translate a SearchFilter into a Qdrant payload filter."""
+    if search_filter is None:
+        return None
+    conditions = []
+    if search_filter.source_type is not None:
+        conditions.append(
+            FieldCondition(key="source_type", match=MatchValue(value=search_filter.source_type))
+        )
+    if search_filter.sources is not None:
+        conditions.append(FieldCondition(key="source", match=MatchAny(any=search_filter.sources)))
+    if search_filter.added_after is not None or search_filter.added_before is not None:
+        conditions.append(
+            FieldCondition(
+                key="date_added",
+                range=DatetimeRange(gte=search_filter.added_after, lt=search_filter.added_before),
+            )
+        )
+    return Filter(must=conditions) if conditions else None
+
+
+def _quantization_config(
+    method: str, always_ram: bool
+) -> ScalarQuantization | BinaryQuantization | None:
+    """Build the Qdrant quantization config for a method in QUANTIZATION_METHODS."""
+    if method == "scalar":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8, quantile=0.99, always_ram=always_ram
+            )
+        )
+    if method == "binary":
+        return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=always_ram))
+    return None
+
+
+@dataclass
+class UpsertStats:
+    """Throughput of the most recent add_chunks call."""
+
+    count: int
+    seconds: float
+    batch_size: int
+    parallel: int
+
+    @property
+    def points_per_second(self) -> float:
+        """Upserted points per second of wall-clock time."""
+        return self.count / self.seconds if self.seconds > 0 else 0.0
 
 
 class VectorStore:
@@ -17,6 +180,28 @@ class VectorStore:
         url: str | None = None,
         use_memory: bool = True,
         embedding_dimension: int = 384,
+        upsert_batch_size: int = 256,
+        upsert_parallel: int = 1,
+        path: str | None = None,
+        quantization: str = "none",
+        quantization_always_ram: bool = True,
+        oversampling: float = 2.0,
+        rescore: bool = True,
+        hnsw_m: int | None = None,
+        hnsw_ef_construct: int | None = None,
+        hnsw_ef: int | None = None,
+        docstore: ChunkDocstore | None = None,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        timeout: int | None = None,
+        pool_size: int | None = None,
+        hybrid: bool = False,
+        hybrid_prefetch_k: int = 20,
+        on_disk_vectors: bool = False,
+        on_disk_hnsw: bool = False,
+        on_disk_payload: bool = False,
+        use_alias: bool = False,
+        keep_previous: int = 1,
     ):
         """Initialize the vector store client.
 
@@ -25,90 +210,801 @@ class VectorStore:
             url: Qdrant server URL (ignored if use_memory is True).
             use_memory: Use in-memory storage for development/testing.
             embedding_dimension: Dimension of the embedding vectors.
+            upsert_batch_size: Points per upsert request in add_chunks.
+            upsert_parallel: Upsert requests kept in flight at once against
+                a remote server. Embedded storage always uploads serially.
+            path: Directory for embedded on-disk storage. Takes precedence
+                over use_memory and url; the index survives restarts.
+            quantization: Vector quantization for new collections, one of
+                QUANTIZATION_METHODS. "scalar" stores int8 (4x less RAM),
+                "binary" one bit per dimension (32x). Original vectors are
+                then kept on disk and only used for rescoring.
+            quantization_always_ram: Keep the quantized vectors in RAM.
+            oversampling: With quantization, fetch top_k * oversampling
+                candidates using the quantized vectors before rescoring.
+            rescore: With quantization, rescore candidates with the original
+                vectors.
+            hnsw_m: HNSW graph degree for new collections (Qdrant default 16).
+                Higher improves recall at the cost of memory and build time.
+            hnsw_ef_construct: HNSW build-time beam width for new collections
+                (Qdrant default 100).
+            hnsw_ef: Default query-time beam width. None uses Qdrant's
+                default; search() can override it per query.
+            docstore: Store chunk text and metadata here instead of in the
+                point payload, which then only holds the filter fields.
+                Search results are hydrated from it by point ID.
+            prefer_grpc: Talk to a remote server over gRPC instead of REST,
+                sending vectors as packed floats rather than JSON.
+            grpc_port: gRPC port of the remote server.
+            timeout: Request timeout in seconds for a remote server. None
+                uses the client default.
+            pool_size: Connections (REST) or channels (gRPC) kept open to a
+                remote server. None uses the client default.
+            hybrid: Also index a BM25 sparse vector per chunk (new
+                collections only) and, for searches given a query text, fuse
+                dense and sparse results with reciprocal rank fusion. An
+                existing collection without sparse vectors is searched and
+                written dense-only until it is rebuilt.
+            hybrid_prefetch_k: Candidates fetched from each of the dense and
+                sparse indexes before fusion.
+            on_disk_vectors: Keep the original vectors of new collections in
+                memory-mapped files instead of RAM (always the case with
+                quantization). The OS page cache holds the hot part.
+            on_disk_hnsw: Keep the HNSW graph of new collections on disk
+                (memory-mapped).
+            on_disk_payload: Keep point payloads on disk, read only for the
+                returned results.
+            use_alias: Treat collection_name as an alias of a versioned
+                collection (``<name>_v1``, ``<name>_v2``, ...). Rebuilds
+                (see begin_rebuild) fill a new version and switch the alias
+                atomically, so searches never see a partial index.
+            keep_previous: With use_alias, how many superseded versions to
+                keep for rollback after a rebuild.
+
+        Raises:
+            ValueError: If the quantization method is not supported.
         """
+        if quantization not in QUANTIZATION_METHODS:
+            raise ValueError(
+                f"Unknown quantization: {quantization!r}. Expected one of {QUANTIZATION_METHODS}."
+            )
         self._collection_name = collection_name
+        self._use_alias = use_alias
+        self._keep_previous = keep_previous
+        self._rebuilding = False
+        # Collection that writes go to during a rebuild, before the alias switch.
+        self._staging: str | None = None
         self._embedding_dimension = embedding_dimension
+        self._upsert_batch_size = upsert_batch_size
+        self._embedded = bool(path) or use_memory
+        self._upsert_parallel = 1 if self._embedded else max(upsert_parallel, 1)
+        self.last_upsert_stats: UpsertStats | None = None
+        self.persistent = not use_memory or bool(path)
+        self._quantization = quantization
+        self._quantization_always_ram = quantization_always_ram
+        self._quantization_search = None
+        if quantization != "none":
+            self._quantization_search = QuantizationSearchParams(
+                rescore=rescore, oversampling=oversampling
+            )
+        self._on_disk_vectors = on_disk_vectors or quantization != "none"
+        self._on_disk_payload = on_disk_payload
+        self._hnsw_config = None
+        if hnsw_m is not None or hnsw_ef_construct is not None or on_disk_hnsw:
+            self._hnsw_config = HnswConfigDiff(
+                m=hnsw_m, ef_construct=hnsw_ef_construct, on_disk=on_disk_hnsw or None
+            )
+        self._hnsw_ef = hnsw_ef
+        self._docstore = docstore
+        self._sparse_encoder = BM25Encoder() if hybrid else None
+        self._hybrid_prefetch_k = hybrid_prefetch_k
+        # Whether each collection (or alias) has the sparse vector, looked up once.
+        self._sparse_collections: dict[str, bool] = {}
 
-        if use_memory:
+        # Embedded storage can only be opened by one client, so the async
+        # methods run the sync ones in a worker thread instead.
+        self._async_client: AsyncQdrantClient | None = None
+        if path:
+            self._client = QdrantClient(path=path)
+        elif use_memory:
             self._client = QdrantClient(location=":memory:")
         else:
-            self._client = QdrantClient(url=url)
-
-    def ensure_collection(self) -> None:
-        """Create collection if it doesn't exist."""
-        collections = self._client.get_collections().collections
-        if not any(c.name == self._collection_name for c in collections):
-            self._client.create_collection(
-                collection_name=self._collection_name,
-                vectors_config=VectorParams(
-                    size=self._embedding_dimension,
-                    distance=Distance.COSINE,
-                ),
+            remote = {
+                "url": url,
+                "prefer_grpc": prefer_grpc,
+                "grpc_port": grpc_port,
+                "timeout": timeout,
+                "pool_size": pool_size,
+            }
+            self._client = QdrantClient(**remote)
+            self._async_client = AsyncQdrantClient(**remote)
+
+    @property
+    def collection_name(self) -> str:
+        """Name searches use: the collection, or with use_alias the alias."""
+        return self._collection_name
+
+    @property
+    def _write_collection(self) -> str:
+        """Collection that upserts, deletes and counts go to."""
+        return self._staging or self._collection_name
+
+    def ensure_collection(self) -> bool:
+        """Create collection if it doesn't exist.
+
+        With use_alias, a new collection is created as the next version and
+        the alias is pointed at it. During a rebuild, the first call creates
+        the staging version instead.
+
+        Returns:
+            True if the collection was created, False if it already existed.
+        """
+        if self._rebuilding and self._staging is None:
+            self._staging = self._next_version()
+            self._create_collection(self._staging)
+            logger.info("Rebuilding %s into %s", self._collection_name, self._staging)
+            return True
+        if self._client.collection_exists(self._collection_name):
+            return False
+        if self._docstore is not None:
+            self._docstore.clear()
+        if not self._use_alias:
+            self._create_collection(self._collection_name)
+            return True
+        version = self._next_version()
+        self._create_collection(version)
+        self._point_alias(version)
+        return True
+
+    def _has_sparse(self, collection: str) -> bool:
+        """Whether hybrid search is on and the collection (or alias) has the sparse vector."""
+        if self._sparse_encoder is None:
+            return False
+        if collection not in self._sparse_collections:
+            info = self._client.get_collection(collection)
+            self._record_sparse(collection, info.config.params)
+        return self._sparse_collections[collection]
+
+    async def _ahas_sparse(self, collection: str) -> bool:
+        """Async variant of _has_sparse that reads the collection info with the async client."""
+        if self._sparse_encoder is None:
+            return False
+        if collection not in self._sparse_collections:
+            info = await self._async_client.get_collection(collection)
+            self._record_sparse(collection, info.config.params)
+        return self._sparse_collections[collection]
+
+    def _record_sparse(self, collection: str, params: CollectionParams) -> None:
+        """Cache whether a collection has the sparse vector, warning if it does not."""
+        has_sparse = SPARSE_VECTOR in (params.sparse_vectors or {})
+        if not has_sparse:
+            logger.warning(
+                "Collection %s has no %s sparse vectors; using dense search only "
+                "until it is reindexed",
+                collection,
+                SPARSE_VECTOR,
+            )
+        self._sparse_collections[collection] = has_sparse
+
+    def _create_collection(self, name: str) -> None:
+        """Create a collection with the configured vector, index and quantization settings."""
+        self._sparse_collections.clear()
+        self._client.create_collection(
+            collection_name=name,
+            vectors_config=VectorParams(
+                size=self._embedding_dimension,
+                distance=Distance.COSINE,
+                on_disk=self._on_disk_vectors,
+            ),
+            sparse_vectors_config=(
+                {SPARSE_VECTOR: SparseVectorParams(modifier=Modifier.IDF)}
+                if self._sparse_encoder is not None
+                else None
+            ),
+            hnsw_config=self._hnsw_config,
+            on_disk_payload=self._on_disk_payload,
+            quantization_config=_quantization_config(
+                self._quantization, self._quantization_always_ram
+            ),
+        )
+        # Embedded Qdrant ignores payload indexes (and warns about them).
+        if not self._embedded:
+            for field_name, schema in PAYLOAD_INDEXES.items():
+                self._client.create_payload_index(
+                    collection_name=name,
+                    field_name=field_name,
+                    field_schema=schema,
+                )
+
+    def versions(self) -> list[str]:
+        """Versioned collections behind the alias, oldest first."""
+        pattern = re.compile(rf"{re.escape(self._collection_name)}_v(\d+)")
+        versions = {}
+        for collection in self._client.get_collections().collections:
+            match = pattern.fullmatch(collection.name)
+            if match:
+                versions[int(match.group(1))] = collection.name
+        return [versions[number] for number in sorted(versions)]
+
+    def _next_version(self) -> str:
+        """Name for a new versioned collection."""
+        versions = self.versions()
+        number = int(versions[-1].rsplit("_v", 1)[1]) + 1 if versions else 1
+        return f"{self._collection_name}_v{number}"
+
+    def serving_collection(self) -> str | None:
+        """The collection searches currently go to (the alias target with use_alias)."""
+        for alias in self._client.get_aliases().aliases:
+            if alias.alias_name == self._collection_name:
+                return alias.collection_name
+        if self._client.collection_exists(self._collection_name):
+            return self._collection_name
+        return None
+
+    def _point_alias(self, collection: str) -> None:
+        """Point the alias at a collection, atomically replacing the previous target."""
+        self._sparse_collections.clear()
+        current = self.serving_collection()
+        operations = []
+        if current == self._collection_name:
+            # A plain collection from before aliases were used; it has to go
+            # before an alias can take its name.
+            logger.warning("Replacing collection %s with an alias", self._collection_name)
+            self._client.delete_collection(collection_name=self._collection_name)
+        elif current is not None:
+            operations.append(
+                DeleteAliasOperation(delete_alias=DeleteAlias(alias_name=self._collection_name))
+            )
+        operations.append(
+            CreateAliasOperation(
+                create_alias=CreateAlias(
+                    collection_name=collection, alias_name=self._collection_name
+                )
             )
+        )
+        self._client.update_collection_aliases(change_aliases_operations=operations)
+
+    def begin_rebuild(self) -> None:
+        """Start rebuilding the index from scratch.
 
-    def add_chunks(self, chunks: list[Chunk], embeddings: list[list[float]]) -> None:
+        With use_alias, the next ensure_collection creates a new version that
+        add_chunks, delete_points and count use, while searches keep using
+        the current version until commit_rebuild. Without it, the collection
+        is deleted right away.
+        """
+        if not self._use_alias:
+            self.delete_collection()
+            return
+        self._rebuilding = True
+        self._staging = None
+
+    def commit_rebuild(self) -> None:
+        """Finish a rebuild: switch the alias to the new version in one atomic operation.
+
+        The replaced version is kept for rollback, along with other earlier
+        versions up to keep_previous in total; the rest are deleted, along
+        with docstore entries no remaining version references. A no-op when
+        no rebuild is running.
+        """
+        self._rebuilding = False
+        staging, self._staging = self._staging, None
+        if staging is None:
+            return
+        previous = self.serving_collection()
+        self._point_alias(staging)
+        logger.info("Alias %s switched from %s to %s", self._collection_name, previous, staging)
+        # Oldest first, with the version just replaced counted as the newest.
+        superseded = [name for name in self.versions() if name not in (staging, previous)]
+        if previous is not None and previous != self._collection_name:
+            superseded.append(previous)
+        deleted = superseded[: max(len(superseded) - self._keep_previous, 0)]
+        for name in deleted:
+            self._client.delete_collection(collection_name=name)
+            logger.info("Deleted superseded collection %s", name)
+        if deleted and self._docstore is not None:
+            # Versions share the docstore; drop the chunks only deleted versions held.
+            live = set().union(*(self._point_ids(name) for name in self.versions()))
+            pruned = self._docstore.prune(live)
+            logger.info("Pruned %d docstore entries of deleted collections", pruned)
+
+    def rollback_target(self) -> str:
+        """The version rollback would serve: the newest one older than the current one.
+
+        Raises:
+            ValueError: If aliases are not used or no older version exists.
+        """
+        current = self.serving_collection()
+        versions = self.versions()
+        if not self._use_alias or current not in versions:
+            raise ValueError(f"{self._collection_name} is not served through a versioned alias.")
+        older = versions[: versions.index(current)]
+        if not older:
+            raise ValueError(f"No collection older than {current} to roll back to.")
+        return older[-1]
+
+    def rollback(self) -> str:
+        """Point the alias back at the newest version older than the current one.
+
+        Returns:
+            Name of the collection now served.
+
+        Raises:
+            ValueError: If aliases are not used or no older version exists.
+        """
+        current = self.serving_collection()
+        target = self.rollback_target()
+        self._point_alias(target)
+        logger.info("Alias %s rolled back from %s to %s", self._collection_name, current, target)
+        return target
+
+    def count(self) -> int:
+        """Return the exact number of points in the collection (0 if missing)."""
+        if not self._client.collection_exists(self._write_collection):
+            return 0
+        return self._client.count(collection_name=self._write_collection, exact=True).count
+
+    def add_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        embeddings: np.ndarray | Iterable[Sequence[float]],
+    ) -> int:
         """Add chunks with their embeddings to the vector store.
 
+        Points are sent in batches of upsert_batch_size, so neither side
+        needs the whole corpus in one request. With upsert_parallel > 1,
+        batches are sent with wait=False from a thread pool, and the last
+        batch is sent with wait=True once all others were acknowledged;
+        Qdrant applies updates in order, so it returns only when every
+        batch is searchable.
+
         Args:
-            chunks: List of text chunks to store.
-            embeddings: Corresponding embedding vectors.
+            chunks: Text chunks to store (any iterable, consumed once).
+            embeddings: Corresponding embedding vectors, either a 2-D float32
+                array or any iterable of float sequences, in chunk order.
+
+        Returns:
+            Number of points upserted.
+
+        Raises:
+            ValueError: If chunks and embeddings differ in length.
         """
-        points = []
-        for chunk, embedding in zip(chunks, embeddings):
-            point_id = str(
-                uuid.uuid5(uuid.NAMESPACE_DNS, f"{chunk.source}:{chunk.chunk_index}:{chunk.text}")
-            )
-            points.append(
-                PointStruct(
-                    id=point_id,
-                    vector=embedding,
-                    payload={
-                        "text": chunk.text,
-                        "source": chunk.source,
-                        "chunk_index": chunk.chunk_index,
-                        "metadata": chunk.metadata,
-                    },
-                )
+        count = 0
+        in_flight: set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self._upsert_parallel) as executor:
+            for batch, wait in self._upsert_batches(chunks, embeddings):
+                count += len(batch)
+                if wait:
+                    for future in wait_futures(in_flight).done:
+                        future.result()
+                    self._upsert_batch(batch, wait=True)
+                    continue
+                if len(in_flight) >= self._upsert_parallel:
+                    done, in_flight = wait_futures(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                in_flight.add(executor.submit(self._upsert_batch, batch, wait=False))
+        return count
+
+    async def aadd_chunks(
+        self,
+        chunks: Iterable[Chunk],
+        embeddings: np.ndarray | Iterable[Sequence[float]],
+    ) -> int:
+        """Async variant of add_chunks that does not block the event loop.
+
+        Against a remote server, batches are uploaded with the async client,
+        keeping up to upsert_parallel requests in flight. Embedded storage
+        runs add_chunks in a worker thread.
+
+        Args:
+            chunks: Text chunks to store (any iterable, consumed once).
+            embeddings: Corresponding embedding vectors, in chunk order.
+
+        Returns:
+            Number of points upserted.
+
+        Raises:
+            ValueError: If chunks and embeddings differ in length.
+        """
+        if self._async_client is None:
+            return await asyncio.to_thread(self.add_chunks, chunks, embeddings)
+
+        count = 0
+        in_flight: set[asyncio.Task] = set()
+        for batch, wait in self._upsert_batches(chunks, embeddings):
+            count += len(batch)
+            if wait:
+                for task in in_flight:
+                    await task
+                in_flight.clear()
+                await self._aupsert_batch(batch, wait=True)
+                continue
+            if len(in_flight) >= self._upsert_parallel:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            in_flight.add(asyncio.create_task(self._aupsert_batch(batch, wait=False)))
+        return count
+
+    def _upsert_batches(
+        self,
+        chunks: Iterable[Chunk],
+        embeddings: np.ndarray | Iterable[Sequence[float]],
+    ) -> Iterator[tuple[tuple[tuple[Chunk, Sequence[float]], ...], bool]]:
+        """Split (chunk, embedding) pairs into upsert batches, each with its wait flag.
+
+        Batches are sent with wait=True one by one when upsert_parallel is 1.
+        Otherwise only the last batch waits, and it must be sent once every
+        earlier batch was acknowledged. last_upsert_stats is recorded when
+        the caller has sent the last batch and asks for the next one.
+        """
+        batches = itertools.batched(zip(chunks, embeddings, strict=True), self._upsert_batch_size)
+        start = time.perf_counter()
+        count = 0
+        batch = next(batches, None)
+        while batch is not None:
+            following = next(batches, None)
+            count += len(batch)
+            yield batch, following is None or self._upsert_parallel == 1
+            batch = following
+        if count:
+            self._record_upsert(count, start)
+
+    def _record_upsert(self, count: int, start: float) -> None:
+        """Set last_upsert_stats and log the upload throughput."""
+        self.last_upsert_stats = UpsertStats(
+            count=count,
+            seconds=time.perf_counter() - start,
+            batch_size=self._upsert_batch_size,
+            parallel=self._upsert_parallel,
+        )
+        logger.info(
+            "Upserted %d points in %.2fs (%.1f points/s, batch_size=%d, parallel=%d)",
+            count,
+            self.last_upsert_stats.seconds,
+            self.last_upsert_stats.points_per_second,
+            self._upsert_batch_size,
+            self._upsert_parallel,
+        )
+
+    def _batch_points(self, batch: tuple[tuple[Chunk, Sequence[float]], ...]) -> Batch:
+        """Build the upsert Batch for (chunk, embedding) pairs, writing to the docstore."""
+        chunks = [chunk for chunk, _ in batch]
+        ids = [point_id(chunk) for chunk in chunks]
+        vectors = np.asarray([vector for _, vector in batch], dtype=np.float32)
+        if self._docstore is not None:
+            self._docstore.put_many(ids, chunks)
+            payloads = [index_payload(chunk) for chunk in chunks]
+        else:
+            payloads = [chunk_payload(chunk) for chunk in chunks]
+        if not self._has_sparse(self._write_collection):
+            return Batch(ids=ids, vectors=vectors.tolist(), payloads=payloads)
+        sparse = [
+            SparseVector(indices=indices, values=values)
+            for indices, values in map(
+                self._sparse_encoder.encode_document, (c.text for c in chunks)
             )
-        self._client.upsert(collection_name=self._collection_name, points=points)
+        ]
+        return Batch(
+            ids=ids, vectors={"": vectors.tolist(), SPARSE_VECTOR: sparse}, payloads=payloads
+        )
+
+    def _upsert_batch(self, batch: tuple[tuple[Chunk, Sequence[float]], ...], wait: bool) -> None:
+        """Upsert one batch of (chunk, embedding) pairs."""
+        self._client.upsert(
+            collection_name=self._write_collection, points=self._batch_points(batch), wait=wait
+        )
+
+    async def _aupsert_batch(
+        self, batch: tuple[tuple[Chunk, Sequence[float]], ...], wait: bool
+    ) -> None:
+        """Upsert one batch of (chunk, embedding) pairs with the async client.
+
+        The batch is built in a worker thread: it writes to the docstore,
+        may read the collection info and encodes BM25 vectors, which would
+        otherwise block the event loop.
+        """
+        points = await asyncio.to_thread(self._batch_points, batch)
+        await self._async_client.upsert(
+            collection_name=self._write_collection, points=points, wait=wait
+        )
 
     def search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray | Sequence[float],
         top_k: int = 5,
         score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_text: str | None = None,
+        with_vectors: bool = False,
     ) -> list[SearchResult]:
         """Search for similar chunks by embedding.
 
         Args:
-            query_embedding: The query embedding vector.
+            query_embedding: The query embedding vector (float32 array or list).
             top_k: Number of results to return.
-            score_threshold: Minimum relevance score. Results below this are filtered out.
+            score_threshold: Minimum relevance score. Applied by Qdrant, so
+                points below it never count towards top_k. With hybrid
+                search it applies to the dense candidates.
+            hnsw_ef: Query-time HNSW beam width, overriding the store default.
+            search_filter: Only return chunks matching this filter. Applied by
+                Qdrant during the search, so top_k results are still returned.
+            query_text: The query text. With hybrid search enabled, dense and
+                BM25 candidates are fetched in one request and fused with
+                reciprocal rank fusion; scores are then RRF scores.
+            with_vectors: Also return each result's stored dense vector in
+                SearchResult.embedding (used for MMR re-selection).
 
         Returns:
             List of SearchResult objects sorted by relevance (descending score).
         """
-        results = self._client.query_points(
-            collection_name=self._collection_name,
-            query=query_embedding,
+        request = self._query_request(
+            query_embedding,
+            query_text,
+            top_k,
+            score_threshold,
+            hnsw_ef,
+            search_filter,
+            with_vectors,
+        )
+        (response,) = self._client.query_batch_points(
+            collection_name=self._collection_name, requests=[request]
+        )
+        return self._search_results([response.points])[0]
+
+    async def asearch(
+        self,
+        query_embedding: np.ndarray | Sequence[float],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_text: str | None = None,
+        with_vectors: bool = False,
+    ) -> list[SearchResult]:
+        """Async variant of search that does not block the event loop.
+
+        Against a remote server the query is sent with the async client,
+        and results are hydrated from the docstore in a worker thread;
+        embedded storage runs search in a worker thread. Arguments and
+        return value are the same as for search.
+        """
+        if self._async_client is None:
+            return await asyncio.to_thread(
+                self.search,
+                query_embedding,
+                top_k,
+                score_threshold,
+                hnsw_ef,
+                search_filter,
+                query_text,
+                with_vectors,
+            )
+        if query_text:
+            # Cache whether the collection has sparse vectors for _query_request.
+            await self._ahas_sparse(self._collection_name)
+        request = self._query_request(
+            query_embedding,
+            query_text,
+            top_k,
+            score_threshold,
+            hnsw_ef,
+            search_filter,
+            with_vectors,
+        )
+        (response,) = await self._async_client.query_batch_points(
+            collection_name=self._collection_name, requests=[request]
+        )
+        if self._docstore is not None:
+            return (await asyncio.to_thread(self._search_results, [response.points]))[0]
+        return self._search_results([response.points])[0]
+
+    def search_batch(
+        self,
+        query_embeddings: np.ndarray | Sequence[Sequence[float]],
+        top_k: int = 5,
+        score_threshold: float = 0.0,
+        hnsw_ef: int | None = None,
+        search_filter: SearchFilter | None = None,
+        query_texts: Sequence[str] | None = None,
+        with_vectors: bool = False,
+    ) -> list[list[SearchResult]]:
+        """Search for several query embeddings in one round trip.
+
+        All queries share top_k, score threshold, HNSW beam width and filter,
+        and are sent to Qdrant as a single query_batch_points request.
+
+        Args:
+            query_embeddings: Query embedding vectors, one row per query.
+            top_k: Number of results to return per query.
+            score_threshold: Minimum relevance score, applied by Qdrant.
+            hnsw_ef: Query-time HNSW beam width, overriding the store default.
+            search_filter: Only return chunks matching this filter.
+            query_texts: Query texts in the same order, used for hybrid search.
+            with_vectors: Also return each result's stored dense vector.
+
+        Returns:
+            One list of SearchResult objects per query, in query order, each
+            sorted by relevance (descending score).
+        """
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        if len(queries) == 0:
+            return []
+        texts = query_texts if query_texts is not None else [None] * len(queries)
+        requests = [
+            self._query_request(
+                query, text, top_k, score_threshold, hnsw_ef, search_filter, with_vectors
+            )
+            for query, text in zip(queries, texts, strict=True)
+        ]
+        responses = self._client.query_batch_points(
+            collection_name=self._collection_name, requests=requests
+        )
+        return self._search_results([response.points for response in responses])
+
+    def _query_request(
+        self,
+        query_embedding: np.ndarray | Sequence[float],
+        query_text: str | None,
+        top_k: int,
+        score_threshold: float,
+        hnsw_ef: int | None,
+        search_filter: SearchFilter | None,
+        with_vectors: bool,
+    ) -> QueryRequest:
+        """Build a dense or, with hybrid search and a query text, a fused dense + BM25 query."""
+        dense = np.asarray(query_embedding, dtype=np.float32).tolist()
+        query_filter = _qdrant_filter(search_filter)
+        search_params = self._search_params(hnsw_ef)
+        indices, values = [], []
+        if query_text and self._has_sparse(self._collection_name):
+            indices, values = self._sparse_encoder.encode_query(query_text)
+        if not indices:
+            return QueryRequest(
+                query=dense,
+                filter=query_filter,
+                limit=top_k,
+                score_threshold=score_threshold,
+                params=search_params,
+                with_payload=self._docstore is None,
+                with_vector=with_vectors,
+            )
+        candidates = max(self._hybrid_prefetch_k, top_k)
+        return QueryRequest(
+            prefetch=[
+                Prefetch(
+                    query=dense,
+                    filter=query_filter,
+                    limit=candidates,
+                    score_threshold=score_threshold,
+                    params=search_params,
+                ),
+                Prefetch(
+                    query=SparseVector(indices=indices, values=values),
+                    using=SPARSE_VECTOR,
+                    filter=query_filter,
+                    limit=candidates,
+                ),
+            ],
+            query=FusionQuery(fusion=Fusion.RRF),
             limit=top_k,
-        ).points
+            with_payload=self._docstore is None,
+            with_vector=with_vectors,
+        )
 
-        search_results = []
-        for point in results:
-            if point.score < score_threshold:
-                continue
-            payload = point.payload
-            chunk = Chunk(
-                text=payload["text"],
-                source=payload["source"],
-                chunk_index=payload["chunk_index"],
-                metadata=payload.get("metadata", {}),
+    def _search_results(self, responses: list[list[ScoredPoint]]) -> list[list[SearchResult]]:
+        """Turn scored points into SearchResults, hydrating from the docstore in one lookup."""
+        if self._docstore is None:
+            return [
+                [
+                    SearchResult(
+                        chunk=chunk_from_payload(point.payload),
+                        score=point.score,
+                        embedding=_dense_vector(point),
+                    )
+                    for point in points
+                ]
+                for points in responses
+            ]
+        chunks = self._docstore.get_many(
+            [str(point.id) for points in responses for point in points]
+        )
+        missing = sum(str(point.id) not in chunks for points in responses for point in points)
+        if missing:
+            logger.warning("%d search results are missing from the docstore", missing)
+        return [
+            [
+                SearchResult(
+                    chunk=chunks[str(point.id)], score=point.score, embedding=_dense_vector(point)
+                )
+                for point in points
+                if str(point.id) in chunks
+            ]
+            for points in responses
+        ]
+
+    def _search_params(self, hnsw_ef: int | None) -> SearchParams | None:
+        """Build search params from the HNSW and quantization settings."""
+        hnsw_ef = hnsw_ef or self._hnsw_ef
+        if hnsw_ef is None and self._quantization_search is None:
+            return None
+        return SearchParams(hnsw_ef=hnsw_ef, quantization=self._quantization_search)
+
+    def delete_points(self, ids: Sequence[str]) -> None:
+        """Delete points by ID.
+
+        Docstore entries are kept while another kept version still holds the
+        point, so it can be rolled back to.
+
+        Args:
+            ids: Point IDs (see point_id) to delete. Unknown IDs are ignored.
+        """
+        if not ids:
+            return
+        self._client.delete(
+            collection_name=self._write_collection,
+            points_selector=PointIdsList(points=list(ids)),
+        )
+        if self._docstore is not None:
+            self._docstore.delete_many(self._unreferenced(ids))
+
+    def _point_ids(self, collection: str) -> set[str]:
+        """IDs of all points in a collection."""
+        ids: set[str] = set()
+        offset = None
+        while True:
+            points, offset = self._client.scroll(
+                collection_name=collection,
+                limit=10_000,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
             )
-            search_results.append(SearchResult(chunk=chunk, score=point.score))
+            ids.update(str(point.id) for point in points)
+            if offset is None:
+                return ids
 
-        return search_results
+    def _unreferenced(self, ids: Sequence[str]) -> list[str]:
+        """IDs no other kept version holds, whose docstore entries can go."""
+        if not self._use_alias:
+            return list(ids)
+        written = self._staging or self.serving_collection()
+        referenced: set[str] = set()
+        for name in self.versions():
+            if name != written:
+                points = self._client.retrieve(
+                    collection_name=name, ids=list(ids), with_payload=False, with_vectors=False
+                )
+                referenced.update(str(point.id) for point in points)
+        return [id_ for id_ in ids if id_ not in referenced]
 
     def delete_collection(self) -> None:
-        """Delete the collection (for cleanup in tests)."""
+        """Delete the collection and, with use_alias, the alias and every version."""
+        self._sparse_collections.clear()
+        if self._use_alias:
+            if self.serving_collection() not in (None, self._collection_name):
+                self._client.update_collection_aliases(
+                    change_aliases_operations=[
+                        DeleteAliasOperation(
+                            delete_alias=DeleteAlias(alias_name=self._collection_name)
+                        )
+                    ]
+                )
+            for name in self.versions():
+                self._client.delete_collection(collection_name=name)
+            self._rebuilding, self._staging = False, None
         self._client.delete_collection(collection_name=self._collection_name)
+        if self._docstore is not None:
+            self._docstore.clear()
+
+    def close(self) -> None:
+        """Close the client, releasing the lock on embedded on-disk storage."""
+        self._client.close()
+        if self._docstore is not None:
+            self._docstore.close()
+
+    async def aclose(self) -> None:
+        """Close the async client, if one was opened for a remote server."""
+        if self._async_client is not None:
+            await self._async_client.close()
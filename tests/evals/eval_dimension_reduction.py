@@ -0,0 +1,121 @@
+"""Evaluation: Recall vs Embedding Dimension
+
+Reports how much retrieval quality is lost when embeddings are reduced
+before indexing (EMBEDDING_REDUCTION). For each method and target dimension
+the notes corpus is indexed in a separate in-memory collection and:
+
+- recall@k against exact search on the full-dimension vectors is measured, and
+- the retrieval accuracy eval cases are re-run against the reduced index.
+
+Results are saved to eval_results/dimension_reduction.json.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from src.config import get_settings
+from src.document_loader import load_and_chunk
+from src.embeddings import EmbeddingModel
+from src.reduction import EmbeddingProjection
+from src.vectorstore import VectorStore
+from tests.evals.eval_retrieval_accuracy import retrieval_accuracy_dataset
+
+DIMENSIONS = [8, 16, 32, 64, 128, 192, 256]
+TOP_K = 3
+
+
+def _index(chunks, embeddings: np.ndarray, name: str) -> VectorStore:
+    """Index embeddings in a fresh in-memory collection."""
+    store = VectorStore(
+        collection_name=name, use_memory=True, embedding_dimension=embeddings.shape[1]
+    )
+    store.ensure_collection()
+    store.add_chunks(chunks, embeddings)
+    return store
+
+
+def _top_k_keys(store: VectorStore, queries: np.ndarray) -> list[set[tuple[str, int]]]:
+    """Return (source, chunk_index) of each query's top-k results, with no score threshold."""
+    return [
+        {(r.chunk.source, r.chunk.chunk_index) for r in results}
+        for results in store.search_batch(queries, top_k=TOP_K, score_threshold=-1.0)
+    ]
+
+
+def _evaluate(model, chunks, full, queries, full_store, method, dimension) -> dict:
+    """Measure recall@k and eval-case accuracy for one projection."""
+    if method == "pca":
+        projection = EmbeddingProjection.fit_pca(full, dimension)
+    else:
+        # "none" is truncation to the full dimension, i.e. renormalization only.
+        projection = EmbeddingProjection.truncation(full.shape[1], dimension)
+    store = _index(chunks, projection.apply(full), f"reduced_{method}_{dimension}")
+
+    query_embeddings = model.embed_queries_array(queries)
+    recalls = [
+        len(expected & found) / len(expected)
+        for expected, found in zip(
+            _top_k_keys(full_store, query_embeddings),
+            _top_k_keys(store, projection.apply(query_embeddings)),
+            strict=True,
+        )
+    ]
+
+    def retrieve_for_query(query: str) -> str:
+        query_embedding = projection.apply(model.embed_text_array(query))
+        results = store.search(query_embedding, top_k=TOP_K)
+        return "\n".join(f"[Source: {r.chunk.source}] {r.chunk.text}" for r in results)
+
+    report = retrieval_accuracy_dataset.evaluate_sync(retrieve_for_query)
+    passed = sum(
+        1
+        for case in report.cases
+        if case.assertions and all(r.value for r in case.assertions.values())
+    )
+    return {
+        "method": method,
+        "dimension": dimension,
+        f"recall_at_{TOP_K}": float(np.mean(recalls)),
+        "cases_passed": passed,
+        "cases_total": len(retrieval_accuracy_dataset.cases),
+        "index_bytes_per_vector": dimension * 4,
+    }
+
+
+def test_recall_vs_dimension():
+    """Report recall@k and retrieval accuracy across reduction methods and dimensions."""
+    settings = get_settings()
+    model = EmbeddingModel(model_name=settings.embedding_model)
+    chunks = load_and_chunk(settings.notes_dir, settings.chunk_size, settings.chunk_overlap)
+    full = model.embed_texts_full_array([c.text for c in chunks])
+    queries = [case.inputs for case in retrieval_accuracy_dataset.cases]
+    full_store = _index(chunks, full, "reduced_none")
+
+    results = [_evaluate(model, chunks, full, queries, full_store, "none", full.shape[1])]
+    for method in ("truncate", "pca"):
+        for dimension in DIMENSIONS:
+            # PCA cannot produce more components than there are chunks.
+            if method == "pca" and dimension > len(chunks):
+                continue
+            results.append(_evaluate(model, chunks, full, queries, full_store, method, dimension))
+
+    print(f"\n{len(chunks)} chunks, recall@{TOP_K} vs full-dimension exact search")
+    print(f"{'method':<10} {'dim':>5} {'recall':>7} {'cases':>7} {'bytes/vec':>10}")
+    for r in results:
+        print(
+            f"{r['method']:<10} {r['dimension']:>5} {r[f'recall_at_{TOP_K}']:>7.3f} "
+            f"{r['cases_passed']:>3}/{r['cases_total']:<3} {r['index_bytes_per_vector']:>10}"
+        )
+
+    output_path = Path("eval_results/dimension_reduction.json")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2))
+    print(f"Results saved to {output_path}")
+
+    baseline = results[0]
+    assert baseline[f"recall_at_{TOP_K}"] == 1.0, "Full-dimension index should match itself"
+    assert baseline["cases_passed"] == baseline["cases_total"], (
+        "Retrieval accuracy cases should pass at full dimension"
+    )
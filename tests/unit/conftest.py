@@ -0,0 +1,85 @@
+"""Shared fixtures for the unit tests."""
+
+import shutil
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.numpy_store import NumpyVectorStore
+from src.vectorstore import VectorStore
+
+
+@pytest.fixture(params=["qdrant", "numpy"])
+def make_store(request) -> Callable[..., VectorStore | NumpyVectorStore]:
+    """Factory for empty in-memory vector stores, run once per backend.
+
+    Keyword arguments are passed to the store's constructor.
+    """
+
+    def make(**kwargs) -> VectorStore | NumpyVectorStore:
+        if request.param == "qdrant":
+            return VectorStore(use_memory=True, **kwargs)
+        return NumpyVectorStore(**kwargs)
+
+    return make
+
+
+@pytest.fixture
+def firefox_db(tmp_path: Path) -> Path:
+    """Create a test Firefox places.sqlite with sample bookmarks."""
+    db_path = tmp_path / "places.sqlite"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("""
+        CREATE TABLE moz_places (
+            id INTEGER PRIMARY KEY,
+            url TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE moz_bookmarks (
+            id INTEGER PRIMARY KEY,
+            type INTEGER NOT NULL,
+            fk INTEGER,
+            title TEXT,
+            dateAdded INTEGER,
+            FOREIGN KEY (fk) REFERENCES moz_places(id)
+        )
+    """)
+    # Insert test data
+    conn.execute("INSERT INTO moz_places (id, url) VALUES (1, 'https://example.com/article1')")
+    conn.execute("INSERT INTO moz_places (id, url) VALUES (2, 'https://example.com/article2')")
+    conn.execute("INSERT INTO moz_places (id, url) VALUES (3, 'place:sort=8')")  # folder/separator
+    conn.execute("INSERT INTO moz_places (id, url) VALUES (4, 'about:config')")
+
+    # type=1 is bookmarks, type=2 is folders
+    conn.execute(
+        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
+        "VALUES (1, 1, 1, 'Article One', 1700000000000000)"
+    )
+    conn.execute(
+        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
+        "VALUES (2, 1, 2, 'Article Two', 1700100000000000)"
+    )
+    conn.execute(
+        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
+        "VALUES (3, 2, 3, 'Folder', 1700000000000000)"  # folder, not bookmark
+    )
+    conn.execute(
+        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
+        "VALUES (4, 1, 4, 'About Config', 1700000000000000)"  # about: URL
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+@pytest.fixture
+def firefox_profile(tmp_path: Path, firefox_db: Path) -> Path:
+    """Create a test Firefox profile directory."""
+    profile_dir = tmp_path / "profile"
+    profile_dir.mkdir()
+    # Copy the test DB to the profile
+    shutil.copy2(firefox_db, profile_dir / "places.sqlite")
+    return profile_dir
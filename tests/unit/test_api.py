@@ -1,6 +1,6 @@
 """Tests for the REST API."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -18,6 +18,9 @@ def mock_agent():
         answer="Project Alpha uses microservices.",
         sources=["data/notes/project_alpha.txt"],
     )
+    agent.metrics = MagicMock(
+        return_value={"embedding_dispatcher": {"requests": 4, "batches": 2}},
+    )
     return agent
 
 
@@ -40,6 +43,20 @@ class TestHealthEndpoint:
         assert response.json() == {"status": "ok"}
 
 
+class TestLifespan:
+    def test_shutdown_closes_agent(self, mock_agent):
+        with patch("api.build_pipeline", return_value=mock_agent), TestClient(api_module.app):
+            pass
+        mock_agent.aclose.assert_awaited_once()
+
+
+class TestMetricsEndpoint:
+    def test_metrics_returns_dispatcher_metrics(self, client):
+        response = client.get("/api/v1/metrics")
+        assert response.status_code == 200
+        assert response.json()["embedding_dispatcher"]["batches"] == 2
+
+
 class TestQueryEndpoint:
     def test_successful_query(self, client, mock_agent):
         response = client.post("/api/v1/query", json={"question": "What is project Alpha?"})
@@ -83,3 +100,23 @@ class TestQueryEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert data["sources"] == []
+
+    def test_query_filter_forwarded(self, client, mock_agent):
+        response = client.post(
+            "/api/v1/query",
+            json={
+                "question": "Recent bookmarks?",
+                "filter": {"source_type": "bookmark", "added_after": "2024-01-01T00:00:00Z"},
+            },
+        )
+        assert response.status_code == 200
+        search_filter = mock_agent.ask_async.call_args.kwargs["search_filter"]
+        assert search_filter.source_type == "bookmark"
+        assert search_filter.added_after.year == 2024
+
+    def test_query_invalid_filter_rejected(self, client):
+        response = client.post(
+            "/api/v1/query",
+            json={"question": "Anything?", "filter": {"source_type": "email"}},
+        )
+        assert response.status_code == 422
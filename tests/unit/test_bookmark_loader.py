@@ -1,6 +1,5 @@
 """Tests for the Firefox bookmark loader."""
 
-import sqlite3
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,73 +9,13 @@ from src.loaders.bookmark_loader import (
     BookmarkRecord,
     _query_bookmarks,
     fetch_page_content,
+    load_bookmarks,
     load_sync_state,
     read_bookmarks,
     save_sync_state,
 )
 
 
-@pytest.fixture
-def firefox_db(tmp_path: Path) -> Path:
-    """Create a test Firefox places.sqlite with sample bookmarks."""
-    db_path = tmp_path / "places.sqlite"
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("""
-        CREATE TABLE moz_places (
-            id INTEGER PRIMARY KEY,
-            url TEXT NOT NULL
-        )
-    """)
-    conn.execute("""
-        CREATE TABLE moz_bookmarks (
-            id INTEGER PRIMARY KEY,
-            type INTEGER NOT NULL,
-            fk INTEGER,
-            title TEXT,
-            dateAdded INTEGER,
-            FOREIGN KEY (fk) REFERENCES moz_places(id)
-        )
-    """)
-    # Insert test data
-    conn.execute("INSERT INTO moz_places (id, url) VALUES (1, 'https://example.com/article1')")
-    conn.execute("INSERT INTO moz_places (id, url) VALUES (2, 'https://example.com/article2')")
-    conn.execute("INSERT INTO moz_places (id, url) VALUES (3, 'place:sort=8')")  # folder/separator
-    conn.execute("INSERT INTO moz_places (id, url) VALUES (4, 'about:config')")
-
-    # type=1 is bookmarks, type=2 is folders
-    conn.execute(
-        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
-        "VALUES (1, 1, 1, 'Article One', 1700000000000000)"
-    )
-    conn.execute(
-        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
-        "VALUES (2, 1, 2, 'Article Two', 1700100000000000)"
-    )
-    conn.execute(
-        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
-        "VALUES (3, 2, 3, 'Folder', 1700000000000000)"  # folder, not bookmark
-    )
-    conn.execute(
-        "INSERT INTO moz_bookmarks (id, type, fk, title, dateAdded) "
-        "VALUES (4, 1, 4, 'About Config', 1700000000000000)"  # about: URL
-    )
-    conn.commit()
-    conn.close()
-    return db_path
-
-
-@pytest.fixture
-def firefox_profile(tmp_path: Path, firefox_db: Path) -> Path:
-    """Create a test Firefox profile directory."""
-    profile_dir = tmp_path / "profile"
-    profile_dir.mkdir()
-    # Copy the test DB to the profile
-    import shutil
-
-    shutil.copy2(firefox_db, profile_dir / "places.sqlite")
-    return profile_dir
-
-
 class TestQueryBookmarks:
     """Tests for the _query_bookmarks function."""
 
@@ -186,3 +125,31 @@ class TestFetchPageContent:
         result = fetch_page_content("https://example.com", max_length=50)
         assert result is not None
         assert len(result) == 50
+
+
+class TestLoadBookmarks:
+    """Tests for load_bookmarks sync behaviour."""
+
+    @patch("src.loaders.bookmark_loader.fetch_page_content", return_value="Page text")
+    def test_incremental_sync_skips_synced_bookmarks(self, _mock_fetch, firefox_profile, tmp_path):
+        """A second sync should return nothing once all bookmarks are synced."""
+        state_path = tmp_path / "sync_state.json"
+        assert len(load_bookmarks(firefox_profile, sync_state_path=state_path)) == 2
+        assert load_bookmarks(firefox_profile, sync_state_path=state_path) == []
+
+    @patch("src.loaders.bookmark_loader.fetch_page_content", return_value="Page text")
+    def test_full_sync_ignores_state(self, _mock_fetch, firefox_profile, tmp_path):
+        """full_sync should reload all bookmarks despite a saved sync state."""
+        state_path = tmp_path / "sync_state.json"
+        load_bookmarks(firefox_profile, sync_state_path=state_path)
+        docs = load_bookmarks(firefox_profile, sync_state_path=state_path, full_sync=True)
+        assert len(docs) == 2
+
+    @patch("src.loaders.bookmark_loader.fetch_page_content", return_value="Page text")
+    def test_save_state_false_keeps_state(self, _mock_fetch, firefox_profile, tmp_path):
+        """save_state=False should not create or update the sync state."""
+        state_path = tmp_path / "sync_state.json"
+        assert (
+            len(load_bookmarks(firefox_profile, sync_state_path=state_path, save_state=False)) == 2
+        )
+        assert not state_path.exists()
@@ -0,0 +1,60 @@
+"""Tests for MMR re-selection of search results."""
+
+import pytest
+
+from src.diversity import mmr_select
+from src.models import Chunk, SearchResult
+
+QUERY = [1.0, 0.0, 0.3]
+
+
+def _result(source: str, index: int, embedding: list[float], score: float) -> SearchResult:
+    """A search result for chunk `index` of `source` with a stored vector."""
+    chunk = Chunk(text=f"{source} #{index}", source=source, chunk_index=index)
+    return SearchResult(chunk=chunk, score=score, embedding=embedding)
+
+
+@pytest.fixture
+def candidates() -> list[SearchResult]:
+    """Two near-duplicate neighbouring chunks of a.txt, then one chunk of b.txt."""
+    return [
+        _result("a.txt", 0, [1.0, 0.0, 0.0], 0.95),
+        _result("a.txt", 1, [0.99, 0.1, 0.0], 0.94),
+        _result("b.txt", 0, [0.7, 0.0, 0.7], 0.70),
+    ]
+
+
+class TestMMRSelect:
+    """Tests for mmr_select."""
+
+    def test_lambda_one_keeps_relevance_order(self, candidates: list[SearchResult]):
+        """With lambda 1.0, MMR should rank by relevance only."""
+        picked = mmr_select(QUERY, candidates, top_k=2, lambda_mult=1.0)
+        assert [(r.chunk.source, r.chunk.chunk_index) for r in picked] == [
+            ("a.txt", 0),
+            ("a.txt", 1),
+        ]
+
+    def test_near_duplicate_is_skipped(self, candidates: list[SearchResult]):
+        """A chunk almost identical to one already picked should lose to a different one."""
+        picked = mmr_select(QUERY, candidates, top_k=2, lambda_mult=0.5)
+        assert [(r.chunk.source, r.chunk.chunk_index) for r in picked] == [
+            ("a.txt", 0),
+            ("b.txt", 0),
+        ]
+
+    def test_max_per_source(self, candidates: list[SearchResult]):
+        """The per-source cap should hold even when relevance alone is used."""
+        picked = mmr_select(QUERY, candidates, top_k=3, lambda_mult=1.0, max_per_source=1)
+        assert [r.chunk.source for r in picked] == ["a.txt", "b.txt"]
+
+    def test_keeps_search_scores(self, candidates: list[SearchResult]):
+        """Selected results should keep the scores the vector store returned."""
+        picked = mmr_select(QUERY, candidates, top_k=3)
+        assert sorted(r.score for r in picked) == [0.70, 0.94, 0.95]
+
+    def test_requires_vectors(self):
+        """Results without stored vectors should be rejected."""
+        result = SearchResult(chunk=Chunk(text="x", source="a.txt", chunk_index=0), score=1.0)
+        with pytest.raises(ValueError, match="with_vectors"):
+            mmr_select([1.0], [result], top_k=1)
@@ -0,0 +1,57 @@
+"""Tests for the SQLite chunk docstore."""
+
+from src.docstore import ChunkDocstore
+from src.models import Chunk
+
+
+class TestChunkDocstore:
+    """Tests for ChunkDocstore."""
+
+    def test_put_and_get(self, tmp_path, sample_chunks: list[Chunk]):
+        """Stored chunks should come back unchanged, keyed by ID."""
+        store = ChunkDocstore(tmp_path / "docstore.sqlite")
+        store.put_many(["a", "b", "c"], sample_chunks)
+        assert store.get_many(["c", "a", "missing"]) == {
+            "c": sample_chunks[2],
+            "a": sample_chunks[0],
+        }
+        assert len(store) == 3
+
+    def test_put_replaces_existing(self, tmp_path, sample_chunks: list[Chunk]):
+        """Storing under an existing ID should replace the chunk."""
+        store = ChunkDocstore(tmp_path / "docstore.sqlite")
+        store.put_many(["a"], sample_chunks[:1])
+        store.put_many(["a"], sample_chunks[1:2])
+        assert store.get_many(["a"]) == {"a": sample_chunks[1]}
+
+    def test_delete_and_clear(self, tmp_path, sample_chunks: list[Chunk]):
+        """delete_many should remove the given IDs and clear everything."""
+        store = ChunkDocstore(tmp_path / "docstore.sqlite")
+        store.put_many(["a", "b", "c"], sample_chunks)
+        store.delete_many(["a", "missing"])
+        assert set(store.get_many(["a", "b", "c"])) == {"b", "c"}
+        store.clear()
+        assert len(store) == 0
+
+    def test_prune(self, tmp_path, sample_chunks: list[Chunk]):
+        """prune should delete only the chunks whose IDs are not kept."""
+        store = ChunkDocstore(tmp_path / "docstore.sqlite")
+        store.put_many(["a", "b", "c"], sample_chunks)
+        assert store.prune({"b", "missing"}) == 2
+        assert set(store.get_many(["a", "b", "c"])) == {"b"}
+
+    def test_get_many_over_parameter_limit(self, tmp_path, sample_chunks: list[Chunk]):
+        """Lookups of more IDs than SQLite binds per statement should be batched."""
+        store = ChunkDocstore(tmp_path / "docstore.sqlite")
+        ids = [f"id{i}" for i in range(1200)]
+        store.put_many(ids, sample_chunks[:1] * len(ids))
+        assert len(store.get_many(ids)) == 1200
+
+    def test_persists_across_instances(self, tmp_path, sample_chunks: list[Chunk]):
+        """Chunks should survive reopening the database."""
+        store = ChunkDocstore(tmp_path / "docstore.sqlite")
+        store.put_many(["a"], sample_chunks[:1])
+        store.close()
+        assert ChunkDocstore(tmp_path / "docstore.sqlite").get_many(["a"]) == {
+            "a": sample_chunks[0]
+        }
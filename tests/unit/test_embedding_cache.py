@@ -0,0 +1,111 @@
+"""Tests for the embedding caches."""
+
+import numpy as np
+
+from src.embedding_cache import EmbeddingCache, QueryEmbeddingCache
+
+
+def _vectors(n: int, dim: int = 8) -> list[np.ndarray]:
+    return [np.full(dim, i, dtype=np.float32) for i in range(n)]
+
+
+class TestEmbeddingCache:
+    """Tests for the EmbeddingCache class."""
+
+    def test_miss_on_empty_cache(self, tmp_path):
+        """Lookups on an empty cache should all be misses."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        assert cache.get_many("model", ["a", "b"]) == {}
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+    def test_put_then_get(self, tmp_path):
+        """Stored vectors should be returned by position on lookup."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        cache.put_many("model", ["a", "b"], _vectors(2))
+        found = cache.get_many("model", ["b", "x", "a"])
+        assert set(found) == {0, 2}
+        np.testing.assert_array_equal(found[0], np.full(8, 1, dtype=np.float32))
+        np.testing.assert_array_equal(found[2], np.full(8, 0, dtype=np.float32))
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    def test_keyed_by_model(self, tmp_path):
+        """Vectors from one model should not be served for another."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        cache.put_many("model-a", ["text"], _vectors(1))
+        assert cache.get_many("model-b", ["text"]) == {}
+
+    def test_persists_across_instances(self, tmp_path):
+        """A reopened cache should still contain previously stored vectors."""
+        path = tmp_path / "cache.sqlite"
+        cache = EmbeddingCache(path)
+        cache.put_many("model", ["a"], _vectors(1))
+        cache.close()
+
+        reopened = EmbeddingCache(path)
+        assert len(reopened) == 1
+        assert 0 in reopened.get_many("model", ["a"])
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Exceeding max_entries should evict the least recently used vectors."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite", max_entries=2)
+        cache.put_many("model", ["a"], _vectors(1))
+        cache.put_many("model", ["b"], _vectors(1))
+        cache.get_many("model", ["a"])  # "a" is now more recent than "b"
+        cache.put_many("model", ["c"], _vectors(1))
+
+        assert len(cache) == 2
+        found = cache.get_many("model", ["a", "b", "c"])
+        assert set(found) == {0, 2}
+
+    def test_hit_ratio(self, tmp_path):
+        """hit_ratio should reflect the fraction of lookups served from cache."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        assert cache.hit_ratio == 0.0
+        cache.put_many("model", ["a"], _vectors(1))
+        cache.get_many("model", ["a", "b"])
+        assert cache.hit_ratio == 0.5
+
+
+class TestQueryEmbeddingCache:
+    """Tests for the QueryEmbeddingCache class."""
+
+    def test_miss_then_hit(self):
+        """A stored query should be returned on the next lookup."""
+        cache = QueryEmbeddingCache()
+        assert cache.get("What is X?") is None
+        cache.put("What is X?", np.ones(4, dtype=np.float32))
+        np.testing.assert_array_equal(cache.get("What is X?"), np.ones(4))
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_ratio == 0.5
+
+    def test_whitespace_normalized(self):
+        """Queries differing only in whitespace should share an entry."""
+        cache = QueryEmbeddingCache()
+        cache.put("What  is X? ", np.ones(4, dtype=np.float32))
+        assert cache.get(" What is\tX?") is not None
+
+    def test_evicts_least_recently_used(self):
+        """The least recently used query should be evicted at max_size."""
+        cache = QueryEmbeddingCache(max_size=2)
+        cache.put("a", np.zeros(2))
+        cache.put("b", np.zeros(2))
+        cache.get("a")
+        cache.put("c", np.zeros(2))
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_ttl_expires_entries(self, monkeypatch):
+        """Entries older than the TTL should be treated as misses."""
+        now = [100.0]
+        monkeypatch.setattr("src.embedding_cache.time.monotonic", lambda: now[0])
+        cache = QueryEmbeddingCache(ttl_seconds=10)
+        cache.put("a", np.zeros(2))
+        now[0] += 5
+        assert cache.get("a") is not None
+        now[0] += 6
+        assert cache.get("a") is None
+        assert len(cache) == 0
@@ -0,0 +1,97 @@
+"""Tests for the async micro-batching embedding dispatcher."""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from src.embedding_dispatcher import EmbeddingDispatcher
+
+
+class RecordingModel:
+    """Stand-in embedding model that records each batch it encodes."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def embed_queries_array(self, texts: list[str]) -> np.ndarray:
+        self.batches.append(list(texts))
+        return np.array([[len(t), 0.0] for t in texts], dtype=np.float32)
+
+
+class FailingModel:
+    def embed_queries_array(self, texts: list[str]) -> np.ndarray:
+        raise RuntimeError("encode failed")
+
+
+class BlockingModel:
+    """Stand-in embedding model whose encode blocks until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def embed_queries_array(self, texts: list[str]) -> np.ndarray:
+        self.started.set()
+        self.release.wait(5)
+        return np.zeros((len(texts), 2), dtype=np.float32)
+
+
+class TestEmbeddingDispatcher:
+    """Tests for the EmbeddingDispatcher class."""
+
+    async def test_concurrent_queries_share_one_batch(self):
+        """Queries arriving within the wait window should be encoded together."""
+        model = RecordingModel()
+        dispatcher = EmbeddingDispatcher(model, max_wait_ms=50)
+        results = await asyncio.gather(*(dispatcher.embed(q) for q in ["a", "bb", "ccc"]))
+        await dispatcher.close()
+
+        assert len(model.batches) == 1
+        assert sorted(model.batches[0]) == ["a", "bb", "ccc"]
+        assert [r[0] for r in results] == [1.0, 2.0, 3.0]
+
+    async def test_max_batch_size_splits_batches(self):
+        """No batch should exceed max_batch_size."""
+        model = RecordingModel()
+        dispatcher = EmbeddingDispatcher(model, max_wait_ms=50, max_batch_size=2)
+        await asyncio.gather(*(dispatcher.embed(q) for q in ["a", "b", "c", "d", "e"]))
+        await dispatcher.close()
+
+        assert all(len(batch) <= 2 for batch in model.batches)
+        assert sum(len(batch) for batch in model.batches) == 5
+
+    async def test_metrics_recorded(self):
+        """Metrics should report batch sizes and queue wait times."""
+        model = RecordingModel()
+        dispatcher = EmbeddingDispatcher(model, max_wait_ms=20)
+        await asyncio.gather(dispatcher.embed("a"), dispatcher.embed("b"))
+        await dispatcher.close()
+
+        metrics = dispatcher.metrics.as_dict()
+        assert metrics["requests"] == 2
+        assert metrics["batches"] == 1
+        assert metrics["mean_batch_size"] == 2
+        assert metrics["max_wait_ms"] > 0
+
+    async def test_encode_error_propagates_to_callers(self):
+        """An encode failure should be raised in every waiting caller."""
+        dispatcher = EmbeddingDispatcher(FailingModel(), max_wait_ms=10)
+        with pytest.raises(RuntimeError, match="encode failed"):
+            await dispatcher.embed("a")
+        await dispatcher.close()
+
+    async def test_close_fails_pending_queries(self):
+        """Closing should fail the query being encoded and the ones still queued."""
+        model = BlockingModel()
+        dispatcher = EmbeddingDispatcher(model, max_wait_ms=0, max_batch_size=1)
+        encoding = asyncio.create_task(dispatcher.embed("a"))
+        queued = asyncio.create_task(dispatcher.embed("b"))
+        await asyncio.to_thread(model.started.wait, 5)
+
+        await dispatcher.close()
+        model.release.set()
+        for task in (encoding, queued):
+            with pytest.raises(RuntimeError, match="dispatcher closed"):
+                await asyncio.wait_for(task, 1)
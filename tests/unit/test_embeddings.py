@@ -1,6 +1,11 @@
 """Tests for embedding generation."""
 
+import numpy as np
+import pytest
+
+from src.embedding_cache import EmbeddingCache
 from src.embeddings import EmbeddingModel
+from src.reduction import EmbeddingProjection
 
 
 class TestEmbeddingModel:
@@ -38,6 +43,48 @@ class TestEmbeddingModel:
         embeddings = model.embed_texts([])
         assert embeddings == []
 
+    def test_embed_texts_array_is_contiguous_float32(self):
+        """embed_texts_array should return one contiguous float32 matrix."""
+        model = EmbeddingModel()
+        embeddings = model.embed_texts_array(["Hello", "World", "Test"])
+        assert isinstance(embeddings, np.ndarray)
+        assert embeddings.dtype == np.float32
+        assert embeddings.shape == (3, 384)
+        assert embeddings.flags["C_CONTIGUOUS"]
+
+    def test_embed_texts_array_empty_list(self):
+        """embed_texts_array with empty list should return a (0, dimension) array."""
+        model = EmbeddingModel()
+        assert model.embed_texts_array([]).shape == (0, 384)
+
+    def test_embed_text_array_matches_list_wrapper(self):
+        """embed_text should be a list view of embed_text_array."""
+        model = EmbeddingModel()
+        vector = model.embed_text_array("Hello world")
+        assert vector.dtype == np.float32
+        assert vector.shape == (384,)
+        assert model.embed_text("Hello world") == vector.tolist()
+
+    def test_bulk_encode_preserves_input_order(self):
+        """Length-sorted bulk encoding should return vectors in input order."""
+        model = EmbeddingModel(batch_size=2)
+        texts = ["short", "a much longer sentence about machine learning", "mid length"]
+        batched = model.embed_texts_array(texts)
+        for text, vector in zip(texts, batched):
+            np.testing.assert_allclose(vector, model.embed_text_array(text), atol=1e-5)
+        assert model.last_encode_stats.count == 3
+        assert model.last_encode_stats.chunks_per_second > 0
+
+    def test_embed_texts_uses_cache(self, tmp_path):
+        """embed_texts should serve repeated texts from the cache with identical vectors."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        model = EmbeddingModel(cache=cache)
+        first = model.embed_texts(["Hello", "World"])
+        second = model.embed_texts(["World", "Hello"])
+        assert cache.misses == 2
+        assert cache.hits == 2
+        assert second == [first[1], first[0]]
+
     def test_similar_texts_higher_similarity(self):
         """Semantically similar texts should have higher cosine similarity."""
         model = EmbeddingModel()
@@ -59,3 +106,54 @@ class TestEmbeddingModel:
         """The dimension property should return 384."""
         model = EmbeddingModel()
         assert model.dimension == 384
+
+    def test_unknown_backend_raises(self):
+        """An unsupported backend name should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown embedding backend"):
+            EmbeddingModel(backend="tpu")
+
+    def test_int8_backend_agrees_with_fp32(self):
+        """The dynamically quantized backend should closely match fp32 vectors."""
+        texts = ["machine learning algorithms", "sourdough bread recipe"]
+        fp32 = EmbeddingModel().embed_texts_array(texts)
+        int8 = EmbeddingModel(backend="torch-int8").embed_texts_array(texts)
+        cosine = np.sum(fp32 * int8, axis=1) / (
+            np.linalg.norm(fp32, axis=1) * np.linalg.norm(int8, axis=1)
+        )
+        assert np.all(cosine > 0.95)
+
+    def test_lazy_model_not_loaded_until_used(self):
+        """A lazy model should not load until the first encode."""
+        model = EmbeddingModel(lazy=True, dimension=384)
+        assert not model.is_loaded
+        assert model.dimension == 384
+        assert model.embed_texts_array([]).shape == (0, 384)
+        assert not model.is_loaded
+
+    def test_lazy_model_with_warm_cache_never_loads(self, tmp_path):
+        """Fully cached chunks should be served without loading a lazy model."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        name = "sentence-transformers/all-MiniLM-L6-v2"
+        cache.put_many(name, ["a", "b"], [np.ones(384), np.zeros(384)])
+        model = EmbeddingModel(model_name=name, cache=cache, lazy=True, dimension=384)
+        embeddings = model.embed_texts_array(["b", "a"])
+        assert embeddings.shape == (2, 384)
+        assert embeddings[1, 0] == 1.0
+        assert not model.is_loaded
+
+    def test_projection_applied_after_cache(self, tmp_path):
+        """Cached full vectors should be projected, and dimension should follow."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite")
+        name = "sentence-transformers/all-MiniLM-L6-v2"
+        cache.put_many(name, ["a"], [np.arange(384, dtype=np.float32)])
+        model = EmbeddingModel(
+            model_name=name,
+            cache=cache,
+            lazy=True,
+            dimension=384,
+            projection=EmbeddingProjection.truncation(384, 2),
+        )
+        assert model.dimension == 2
+        assert model.full_dimension == 384
+        np.testing.assert_allclose(model.embed_texts_array(["a"]), [[0.0, 1.0]])
+        assert model.embed_texts_full_array(["a"]).shape == (1, 384)
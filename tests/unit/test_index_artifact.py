@@ -0,0 +1,77 @@
+"""Tests for the portable index artifact."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.index_artifact import export_artifact, load_artifact
+from src.index_manifest import source_entries
+from src.models import Chunk
+from src.reduction import EmbeddingProjection
+
+
+def _export(path, chunks, embeddings, projection=None) -> dict:
+    return export_artifact(
+        path,
+        chunks,
+        embeddings,
+        projection,
+        embedding_model="model",
+        embedding_key="model#torch:",
+        chunk_size=500,
+        chunk_overlap=50,
+    )
+
+
+class TestIndexArtifact:
+    """Tests for export_artifact and load_artifact."""
+
+    def test_round_trip(self, tmp_path, sample_chunks: list[Chunk]):
+        """Chunks, embeddings and manifest should load back unchanged."""
+        embeddings = np.random.default_rng(0).normal(size=(3, 8)).astype(np.float32)
+        manifest = _export(tmp_path, sample_chunks, embeddings)
+        assert manifest["count"] == 3
+        assert manifest["dimension"] == 8
+        assert manifest["sources"] == source_entries(sample_chunks)
+
+        artifact = load_artifact(tmp_path)
+        assert artifact.manifest == manifest
+        assert artifact.chunks == sample_chunks
+        np.testing.assert_array_equal(artifact.embeddings, embeddings)
+        assert artifact.projection is None
+
+    def test_embeddings_are_memory_mapped(self, tmp_path, sample_chunks: list[Chunk]):
+        """Embeddings should be loaded as a read-only memory map."""
+        _export(tmp_path, sample_chunks, np.ones((3, 8), dtype=np.float32))
+        embeddings = load_artifact(tmp_path).embeddings
+        assert isinstance(embeddings, np.memmap)
+        assert not embeddings.flags.writeable
+
+    def test_projection_exported(self, tmp_path, sample_chunks: list[Chunk]):
+        """A projection should be exported alongside and removed when no longer used."""
+        projection = EmbeddingProjection.truncation(8, 4, "model")
+        _export(tmp_path, sample_chunks, np.ones((3, 4), dtype=np.float32), projection)
+        loaded = load_artifact(tmp_path).projection
+        assert loaded.matches("truncate", 4, "model")
+
+        _export(tmp_path, sample_chunks, np.ones((3, 8), dtype=np.float32))
+        assert load_artifact(tmp_path).projection is None
+
+    def test_length_mismatch_rejected(self, tmp_path, sample_chunks: list[Chunk]):
+        """Exporting a different number of chunks and embeddings should fail."""
+        with pytest.raises(ValueError):
+            _export(tmp_path, sample_chunks, np.ones((2, 8), dtype=np.float32))
+
+    def test_missing_artifact(self, tmp_path):
+        """Loading a directory without a manifest should fail."""
+        with pytest.raises(FileNotFoundError):
+            load_artifact(tmp_path)
+
+    def test_inconsistent_artifact(self, tmp_path, sample_chunks: list[Chunk]):
+        """A manifest that disagrees with the files should be rejected."""
+        _export(tmp_path, sample_chunks, np.ones((3, 8), dtype=np.float32))
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        (tmp_path / "manifest.json").write_text(json.dumps({**manifest, "count": 4}))
+        with pytest.raises(ValueError, match="inconsistent"):
+            load_artifact(tmp_path)
@@ -0,0 +1,87 @@
+"""Tests for the index manifest."""
+
+from datetime import UTC, datetime
+
+from src.index_manifest import diff_sources, load_manifest, save_manifest, source_entries
+from src.models import Chunk
+
+
+class TestSourceEntries:
+    """Tests for source_entries."""
+
+    def test_groups_by_source(self, sample_chunks: list[Chunk]):
+        """Each source should get one entry with its chunks' point IDs."""
+        entries = source_entries(sample_chunks)
+        assert set(entries) == {"doc1.txt", "doc2.txt"}
+        assert len(entries["doc1.txt"]["points"]) == 2
+        assert len(entries["doc2.txt"]["points"]) == 1
+
+    def test_stable_for_same_corpus(self, sample_chunks: list[Chunk]):
+        """The same chunks should give the same entries."""
+        assert source_entries(sample_chunks) == source_entries(list(sample_chunks))
+
+    def test_hash_changes_only_for_edited_source(self, sample_chunks: list[Chunk]):
+        """Editing a chunk should change its source's hash and no other."""
+        edited = [*sample_chunks[:-1], sample_chunks[-1].model_copy(update={"text": "Edited."})]
+        before, after = source_entries(sample_chunks), source_entries(edited)
+        assert before["doc1.txt"] == after["doc1.txt"]
+        assert before["doc2.txt"]["hash"] != after["doc2.txt"]["hash"]
+
+    def test_hash_ignores_date_added(self, sample_chunks: list[Chunk]):
+        """A new mtime without a content change should not change the hash."""
+        touched = [
+            c.model_copy(update={"date_added": datetime(2025, 1, 1, tzinfo=UTC)})
+            for c in sample_chunks
+        ]
+        assert source_entries(touched) == source_entries(sample_chunks)
+
+
+class TestDiffSources:
+    """Tests for diff_sources."""
+
+    def test_unchanged_corpus(self, sample_chunks: list[Chunk]):
+        """An unchanged corpus should have nothing to update or delete."""
+        entries = source_entries(sample_chunks)
+        assert diff_sources(entries, entries) == (set(), [])
+
+    def test_new_source(self, sample_chunks: list[Chunk]):
+        """A source missing from the manifest should be reported as changed."""
+        previous = source_entries(sample_chunks[:2])
+        changed, stale = diff_sources(previous, source_entries(sample_chunks))
+        assert changed == {"doc2.txt"}
+        assert stale == []
+
+    def test_removed_source(self, sample_chunks: list[Chunk]):
+        """All points of a removed source should be stale."""
+        previous = source_entries(sample_chunks)
+        changed, stale = diff_sources(previous, source_entries(sample_chunks[:2]))
+        assert changed == set()
+        assert stale == previous["doc2.txt"]["points"]
+
+    def test_edited_chunk(self, sample_chunks: list[Chunk]):
+        """Only the edited chunk's old point should be stale."""
+        edited = [sample_chunks[0].model_copy(update={"text": "Edited."}), *sample_chunks[1:]]
+        previous, current = source_entries(sample_chunks), source_entries(edited)
+        changed, stale = diff_sources(previous, current)
+        assert changed == {"doc1.txt"}
+        assert stale == [previous["doc1.txt"]["points"][0]]
+
+
+class TestManifestFile:
+    """Tests for load_manifest and save_manifest."""
+
+    def test_load_missing_manifest(self, tmp_path):
+        """A missing manifest should load as None."""
+        assert load_manifest(tmp_path / "manifest.json") is None
+
+    def test_save_and_load(self, tmp_path):
+        """A saved manifest should load back unchanged."""
+        path = tmp_path / "nested" / "manifest.json"
+        save_manifest(path, {"fingerprint": "abc", "points": 3})
+        assert load_manifest(path) == {"fingerprint": "abc", "points": 3}
+
+    def test_invalid_json(self, tmp_path):
+        """An unreadable manifest should load as None."""
+        path = tmp_path / "manifest.json"
+        path.write_text("not json")
+        assert load_manifest(path) is None
@@ -0,0 +1,138 @@
+"""Tests for the NumPy vector store."""
+
+import numpy as np
+import pytest
+
+from src.models import Chunk, SearchResult
+from src.numpy_store import NumpyVectorStore
+from src.vectorstore import VectorStore, point_id
+
+
+class TestNumpyVectorStore:
+    """Tests for the NumpyVectorStore class."""
+
+    def test_ensure_collection_reports_creation(self):
+        """ensure_collection should return True only the first time."""
+        store = NumpyVectorStore()
+        assert store.ensure_collection() is True
+        assert store.ensure_collection() is False
+
+    def test_add_and_search(self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]):
+        """Searching with a stored vector should return its chunk first."""
+        store = NumpyVectorStore()
+        store.ensure_collection()
+        assert store.add_chunks(sample_chunks, sample_embeddings) == 3
+        results = store.search(sample_embeddings[1], top_k=2)
+        assert all(isinstance(r, SearchResult) for r in results)
+        assert results[0].chunk.text == sample_chunks[1].text
+        assert results[0].score == pytest.approx(1.0)
+
+    def test_matches_qdrant_ranking(self, sample_chunks: list[Chunk]):
+        """Results and scores should match the Qdrant store for the same data."""
+        rng = np.random.default_rng(0)
+        embeddings = rng.standard_normal((3, 384)).astype(np.float32)
+        query = rng.standard_normal(384).astype(np.float32)
+        stores = [NumpyVectorStore(), VectorStore(use_memory=True)]
+        for store in stores:
+            store.ensure_collection()
+            store.add_chunks(sample_chunks, embeddings)
+        numpy_results, qdrant_results = (s.search(query, 3, score_threshold=-1) for s in stores)
+        assert [r.chunk.text for r in numpy_results] == [r.chunk.text for r in qdrant_results]
+        np.testing.assert_allclose(
+            [r.score for r in numpy_results], [r.score for r in qdrant_results], atol=1e-5
+        )
+
+    def test_readding_chunk_overwrites(
+        self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """Adding the same chunks twice should not duplicate them."""
+        store = NumpyVectorStore()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        store.add_chunks(sample_chunks, sample_embeddings)
+        assert store.count() == 3
+
+    def test_score_threshold_and_empty_store(self, sample_chunks, sample_embeddings):
+        """Low scores should be filtered, and an empty store should return nothing."""
+        store = NumpyVectorStore()
+        assert store.search(sample_embeddings[0]) == []
+        store.add_chunks(sample_chunks, sample_embeddings)
+        results = store.search(sample_embeddings[0], top_k=3, score_threshold=0.5)
+        assert [r.chunk.text for r in results] == [sample_chunks[0].text]
+
+    def test_wrong_dimension_raises(self, sample_chunks: list[Chunk]):
+        """Vectors of the wrong dimension should be rejected."""
+        store = NumpyVectorStore(embedding_dimension=384)
+        with pytest.raises(ValueError, match="shape"):
+            store.add_chunks(sample_chunks, np.ones((3, 8)))
+
+    def test_persists_and_memory_maps(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """A store reopened from disk should serve the same results and accept new chunks."""
+        store = NumpyVectorStore(path=str(tmp_path / "index"))
+        store.ensure_collection()
+        store.add_chunks(sample_chunks[:2], sample_embeddings[:2])
+        store.close()
+
+        reopened = NumpyVectorStore(path=str(tmp_path / "index"))
+        assert reopened.ensure_collection() is False
+        assert reopened.count() == 2
+        assert reopened.search(sample_embeddings[1], top_k=1)[0].chunk.text == sample_chunks[1].text
+        reopened.add_chunks(sample_chunks[2:], sample_embeddings[2:])
+        reopened.close()
+        assert NumpyVectorStore(path=str(tmp_path / "index")).count() == 3
+
+    def test_saves_once_per_indexing_pass(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """add_chunks and delete_points should not rewrite the files; commit_rebuild should."""
+        store = NumpyVectorStore(path=str(tmp_path / "index"))
+        for chunk, embedding in zip(sample_chunks, sample_embeddings, strict=True):
+            store.add_chunks([chunk], [embedding])
+        store.delete_points([point_id(sample_chunks[0])])
+        assert not (tmp_path / "index" / "vectors.npy").exists()
+
+        store.commit_rebuild()
+        assert NumpyVectorStore(path=str(tmp_path / "index")).count() == 2
+
+    def test_delete_collection(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """delete_collection should remove all data, including files on disk."""
+        store = NumpyVectorStore(path=str(tmp_path / "index"))
+        store.add_chunks(sample_chunks, sample_embeddings)
+        store.delete_collection()
+        assert store.search(sample_embeddings[0]) == []
+        assert NumpyVectorStore(path=str(tmp_path / "index")).count() == 0
+
+    def test_rebuild_replaces_files_on_commit(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """A rebuild should leave the persisted index alone until commit_rebuild."""
+        store = NumpyVectorStore(path=str(tmp_path / "index"))
+        store.add_chunks(sample_chunks, sample_embeddings)
+        store.commit_rebuild()
+        store.begin_rebuild()
+        assert store.ensure_collection() is True
+        store.add_chunks(sample_chunks[:1], sample_embeddings[:1])
+        assert NumpyVectorStore(path=str(tmp_path / "index")).count() == 3
+
+        store.commit_rebuild()
+        assert NumpyVectorStore(path=str(tmp_path / "index")).count() == 1
+
+    def test_delete_points(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """delete_points should remove only the given chunks, also on disk."""
+        store = NumpyVectorStore(path=str(tmp_path / "index"))
+        store.add_chunks(sample_chunks, sample_embeddings)
+        store.delete_points([point_id(sample_chunks[0]), "unknown"])
+        assert store.count() == 2
+        assert store.search(sample_embeddings[2], top_k=1)[0].chunk == sample_chunks[2]
+        store.close()
+
+        reopened = NumpyVectorStore(path=str(tmp_path / "index"))
+        assert {r.chunk.text for r in reopened.search(sample_embeddings[0], top_k=5)} == {
+            sample_chunks[1].text,
+            sample_chunks[2].text,
+        }
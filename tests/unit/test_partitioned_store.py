@@ -0,0 +1,81 @@
+"""Tests for the per-source-type partitioned vector store."""
+
+import numpy as np
+import pytest
+
+from src.models import Chunk, SearchFilter
+from src.numpy_store import NumpyVectorStore
+from src.partitioned_store import PartitionedVectorStore
+from src.vectorstore import point_id
+
+
+def _chunks() -> list[Chunk]:
+    """Two notes and a bookmark, with one-hot 4-dim vectors in chunk order."""
+    return [
+        Chunk(text="Note one", source="a.txt", chunk_index=0),
+        Chunk(text="Note two", source="b.txt", chunk_index=0),
+        Chunk(text="Bookmark", source="https://example.com", chunk_index=0, source_type="bookmark"),
+    ]
+
+
+@pytest.fixture
+def store(make_store) -> PartitionedVectorStore:
+    """A partitioned store over both source types, seeded with _chunks()."""
+    store = PartitionedVectorStore(
+        {"note": make_store(embedding_dimension=4), "bookmark": make_store(embedding_dimension=4)}
+    )
+    store.ensure_collection()
+    store.add_chunks(_chunks(), np.eye(3, 4, dtype=np.float32))
+    return store
+
+
+class TestPartitionedVectorStore:
+    """Tests for PartitionedVectorStore."""
+
+    def test_chunks_routed_by_source_type(self, store: PartitionedVectorStore):
+        """Each chunk should land in the partition of its source type."""
+        assert store.partitions["note"].count() == 2
+        assert store.partitions["bookmark"].count() == 1
+        assert store.count() == 3
+
+    def test_ensure_collection_reports_created_partitions(self, store: PartitionedVectorStore):
+        """Only newly created partitions should be listed in created."""
+        store.partitions["bookmark"].delete_collection()
+        assert store.ensure_collection() is True
+        assert store.created == {"bookmark"}
+
+    def test_search_merges_partitions_by_score(self, store: PartitionedVectorStore):
+        """Results from all partitions should be merged into one top-k by score."""
+        results = store.search([0.1, 0.2, 1.0, 0.0], top_k=2)
+        assert [r.chunk.text for r in results] == ["Bookmark", "Note two"]
+        assert results[0].score > results[1].score
+
+    def test_source_type_filter_queries_one_partition(self, store: PartitionedVectorStore):
+        """A source_type filter should only return that partition's chunks."""
+        results = store.search(
+            [0.1, 0.2, 1.0, 0.0], top_k=3, search_filter=SearchFilter(source_type="note")
+        )
+        assert [r.chunk.text for r in results] == ["Note two", "Note one"]
+
+    def test_search_batch_matches_search(self, store: PartitionedVectorStore):
+        """search_batch should merge per query like search does."""
+        queries = np.array([[1.0, 0.0, 0.5, 0.0], [0.0, 1.0, 0.0, 0.0]], dtype=np.float32)
+        batch = store.search_batch(queries, top_k=2)
+        assert batch == [store.search(query, top_k=2) for query in queries]
+
+    async def test_asearch(self, store: PartitionedVectorStore):
+        """asearch should gather the partitions like search does."""
+        query = [0.1, 0.2, 1.0, 0.0]
+        assert await store.asearch(query, top_k=3) == store.search(query, top_k=3)
+
+    def test_delete_points(self, store: PartitionedVectorStore):
+        """delete_points should remove points from whichever partition holds them."""
+        store.delete_points([point_id(chunk) for chunk in _chunks()[1:]])
+        assert store.partitions["note"].count() == 1
+        assert store.partitions["bookmark"].count() == 0
+
+    def test_unknown_source_type_raises(self):
+        """Chunks of a source type without a partition should be rejected."""
+        store = PartitionedVectorStore({"note": NumpyVectorStore(embedding_dimension=4)})
+        with pytest.raises(ValueError, match="bookmark"):
+            store.add_chunks(_chunks(), np.eye(3, 4, dtype=np.float32))
@@ -0,0 +1,310 @@
+"""Tests for building, updating and rolling back the index in the pipeline."""
+
+import hashlib
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.config import Settings
+from src.document_loader import load_and_chunk
+from src.pipeline import _create_vectorstore, build_pipeline, export_index, rollback_index
+
+
+class FakeSentenceTransformer:
+    """Deterministic bag-of-words stand-in for a SentenceTransformer.
+
+    Counts the texts it encodes, so tests can check what was re-embedded.
+    """
+
+    def __init__(self, dimension: int = 384):
+        self.dimension = dimension
+        self.encoded = 0
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(self, texts, batch_size: int = 32, **kwargs) -> np.ndarray:
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        self.encoded += len(batch)
+        vectors = np.zeros((len(batch), self.dimension), dtype=np.float32)
+        for row, text in enumerate(batch):
+            for word in text.lower().split():
+                vectors[row, int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dimension] += 1
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+        return vectors[0] if single else vectors
+
+
+@pytest.fixture
+def model(monkeypatch) -> FakeSentenceTransformer:
+    """A fake model returned wherever the pipeline loads the sentence transformer."""
+    model = FakeSentenceTransformer()
+    monkeypatch.setattr("src.embeddings._load_sentence_transformer", lambda *args: model)
+    return model
+
+
+@pytest.fixture(params=["qdrant", "numpy"])
+def settings(request, tmp_path: Path, firefox_profile: Path) -> Settings:
+    """Settings for a persistent index in tmp_path over a copy of the sample notes."""
+    notes_dir = tmp_path / "notes"
+    shutil.copytree(Path(__file__).parent.parent.parent / "data" / "notes", notes_dir)
+    return Settings(
+        vector_store_backend=request.param,
+        qdrant_path=str(tmp_path / "qdrant"),
+        numpy_store_path=str(tmp_path / "numpy"),
+        notes_dir=str(notes_dir),
+        index_manifest_path=str(tmp_path / "index_manifest.json"),
+        embedding_projection_path=str(tmp_path / "projection.npz"),
+        embedding_cache_enabled=False,
+        embedding_lazy_load=True,
+        bookmark_sync_enabled=False,
+        firefox_profile_path=str(firefox_profile),
+        bookmark_sync_state_path=str(tmp_path / "sync_state.json"),
+    )
+
+
+def _count(settings: Settings, **kwargs) -> int:
+    """Build the pipeline, and return the index size after closing the store."""
+    vectorstore = build_pipeline(settings, **kwargs).vectorstore
+    try:
+        return vectorstore.count()
+    finally:
+        vectorstore.close()
+
+
+def _search(settings: Settings, query: str) -> list[str]:
+    """Build the pipeline, and return the sources of the top results for query."""
+    orchestrator = build_pipeline(settings)
+    try:
+        embedding = orchestrator.embedding_model.embed_text(query)
+        return [r.chunk.source for r in orchestrator.vectorstore.search(embedding, top_k=3)]
+    finally:
+        orchestrator.vectorstore.close()
+
+
+def _index_exists(settings: Settings) -> bool:
+    """Whether the collections (or NumPy index) of the settings' layout are stored."""
+    vectorstore = _create_vectorstore(settings, settings.embedding_dimension)
+    try:
+        return not vectorstore.ensure_collection()
+    finally:
+        vectorstore.close()
+
+
+def _note_chunks(settings: Settings) -> int:
+    return len(load_and_chunk(settings.notes_dir, settings.chunk_size, settings.chunk_overlap))
+
+
+class TestIncrementalIndex:
+    """A persistent index should only embed what changed since the last run."""
+
+    def test_restart_embeds_nothing(self, model, settings: Settings):
+        """A second build over the same notes should reuse the index."""
+        assert _count(settings) == _note_chunks(settings)
+        encoded = model.encoded
+        assert _count(settings) == _note_chunks(settings)
+        assert model.encoded == encoded
+
+    def test_edited_and_deleted_notes(self, model, settings: Settings):
+        """Only the edited note is embedded; points of edited and deleted chunks go."""
+        _count(settings)
+        notes = sorted(Path(settings.notes_dir).glob("*.txt"))
+        notes[0].write_text(notes[0].read_text() + "\nA new closing sentence about zebras.\n")
+        notes[1].unlink()
+        edited = load_and_chunk(settings.notes_dir, settings.chunk_size, settings.chunk_overlap)
+        encoded = model.encoded
+
+        assert _count(settings) == len(edited)
+        assert model.encoded - encoded == sum(c.source == str(notes[0]) for c in edited)
+
+    def test_touched_note_is_not_reembedded(self, model, settings: Settings):
+        """A new mtime without a content change should not re-embed the note."""
+        _count(settings)
+        note = min(Path(settings.notes_dir).glob("*.txt"))
+        note.touch()
+        encoded = model.encoded
+        _count(settings)
+        assert model.encoded == encoded
+
+    def test_model_change_rebuilds(self, model, settings: Settings):
+        """An index from another model is rebuilt, not updated in place."""
+        _count(settings)
+        model.dimension = 256
+        changed = settings.model_copy(
+            update={"embedding_model": "other-model", "embedding_dimension": 256}
+        )
+        encoded = model.encoded
+        assert _count(changed) == _note_chunks(settings)
+        assert model.encoded - encoded == _note_chunks(settings)
+
+    def test_docstore_change_rebuilds(self, model, settings: Settings, tmp_path: Path):
+        """Turning the docstore on or off should rebuild, so searches still find chunks."""
+        assert _search(settings, "sourdough starter")
+        with_docstore = settings.model_copy(
+            update={"docstore_path": str(tmp_path / "docstore.sqlite")}
+        )
+        assert _search(with_docstore, "sourdough starter")
+        assert _search(settings, "sourdough starter")
+
+    def test_onnx_file_ignored_by_torch_backend(self, model, settings: Settings):
+        """EMBEDDING_ONNX_FILE should not trigger a rebuild when the backend ignores it."""
+        _count(settings)
+        encoded = model.encoded
+        _count(settings.model_copy(update={"embedding_onnx_file": "onnx/model_qint8.onnx"}))
+        assert model.encoded == encoded
+
+    @patch("src.loaders.bookmark_loader.fetch_page_content", return_value="Bookmarked page")
+    def test_new_collection_resyncs_bookmarks(self, _mock_fetch, model, settings: Settings):
+        """Bookmarks synced into a lost index should be synced again in full."""
+        settings = settings.model_copy(update={"bookmark_sync_enabled": True})
+        assert _count(settings) == _note_chunks(settings) + 2
+        shutil.rmtree(settings.qdrant_path, ignore_errors=True)
+        shutil.rmtree(settings.numpy_store_path, ignore_errors=True)
+        assert _count(settings) == _note_chunks(settings) + 2
+
+    def test_layout_change_deletes_previous_collections(self, model, settings: Settings):
+        """Switching PER_SOURCE_COLLECTIONS should not leave the old collections behind."""
+        per_source = settings.model_copy(update={"per_source_collections": True})
+        _count(settings)
+        assert _count(per_source) == _note_chunks(settings)
+        assert not _index_exists(settings)
+        assert _count(settings) == _note_chunks(settings)
+        assert not _index_exists(per_source)
+
+    @patch("src.loaders.bookmark_loader.fetch_page_content", return_value="Bookmarked page")
+    def test_reindex_source(self, _mock_fetch, model, settings: Settings):
+        """reindex_source should re-embed only that source type's collection."""
+        settings = settings.model_copy(
+            update={"bookmark_sync_enabled": True, "per_source_collections": True}
+        )
+        assert _count(settings) == _note_chunks(settings) + 2
+        encoded = model.encoded
+        assert _count(settings, reindex_source="bookmark") == _note_chunks(settings) + 2
+        assert model.encoded - encoded == 2
+
+
+class TestReduction:
+    """Embedding reduction applied to the indexed and query vectors."""
+
+    def test_empty_corpus_queries_match_collection(self, model, settings: Settings):
+        """Without chunks to fit on, queries should still be reduced like the collection."""
+        for note in Path(settings.notes_dir).glob("*.txt"):
+            note.unlink()
+        settings = settings.model_copy(
+            update={"embedding_reduction": "pca", "embedding_reduced_dimension": 8}
+        )
+        assert _search(settings, "sourdough starter") == []
+        assert Path(settings.embedding_projection_path).exists()
+
+
+class TestIndexArtifact:
+    """Exporting and loading a prebuilt index artifact."""
+
+    def test_load_without_embedding(self, model, settings: Settings, tmp_path: Path):
+        """A server should load the artifact without encoding any chunk."""
+        export_index(settings, tmp_path / "artifact")
+        served = settings.model_copy(update={"index_artifact_path": str(tmp_path / "artifact")})
+        encoded = model.encoded
+        assert _count(served) == _note_chunks(settings)
+        assert _count(served) == _note_chunks(settings)
+        assert model.encoded == encoded
+
+    @pytest.mark.parametrize("reduction", ["none", "pca"])
+    def test_later_startup_without_artifact_is_incremental(
+        self, model, settings: Settings, tmp_path: Path, reduction: str
+    ):
+        """Dropping INDEX_ARTIFACT_PATH should keep the loaded index, not rebuild it."""
+        settings = settings.model_copy(
+            update={"embedding_reduction": reduction, "embedding_reduced_dimension": 8}
+        )
+        export_index(settings, tmp_path / "artifact")
+        served = settings.model_copy(update={"index_artifact_path": str(tmp_path / "artifact")})
+        _count(served)
+        encoded = model.encoded
+
+        vectorstore = build_pipeline(settings).vectorstore
+        try:
+            assert vectorstore.count() == _note_chunks(settings)
+            assert vectorstore.last_upsert_stats is None
+        finally:
+            vectorstore.close()
+        assert model.encoded == encoded
+
+    def test_reindex_loads_again(self, model, settings: Settings, tmp_path: Path):
+        """--reindex should reload the artifact into a store that already holds it."""
+        export_index(settings, tmp_path / "artifact")
+        served = settings.model_copy(update={"index_artifact_path": str(tmp_path / "artifact")})
+        _count(served)
+        vectorstore = build_pipeline(served, reindex=True).vectorstore
+        try:
+            assert vectorstore.last_upsert_stats.count == _note_chunks(settings)
+        finally:
+            vectorstore.close()
+
+    def test_rejects_reindex_source(self, settings: Settings, tmp_path: Path):
+        """Reindexing one source type cannot be combined with an artifact."""
+        served = settings.model_copy(
+            update={
+                "index_artifact_path": str(tmp_path / "artifact"),
+                "per_source_collections": True,
+            }
+        )
+        with pytest.raises(ValueError, match="INDEX_ARTIFACT_PATH"):
+            build_pipeline(served, reindex_source="note")
+
+    def test_rejects_other_embedding_settings(self, model, settings: Settings, tmp_path: Path):
+        """An artifact from another embedding backend should not be served."""
+        export_index(settings, tmp_path / "artifact")
+        served = settings.model_copy(
+            update={
+                "index_artifact_path": str(tmp_path / "artifact"),
+                "embedding_backend": "torch-int8",
+            }
+        )
+        with pytest.raises(ValueError, match="torch-int8"):
+            build_pipeline(served)
+
+    @patch("src.loaders.bookmark_loader.fetch_page_content", return_value="Bookmarked page")
+    def test_export_keeps_sync_state(self, _mock_fetch, model, settings: Settings, tmp_path):
+        """Exporting should not mark bookmarks as synced into the local index."""
+        settings = settings.model_copy(update={"bookmark_sync_enabled": True})
+        state_path = Path(settings.bookmark_sync_state_path)
+        state_path.write_text('{"last_sync_timestamp": 1}')
+        export_index(settings, tmp_path / "artifact")
+        assert state_path.read_text() == '{"last_sync_timestamp": 1}'
+
+
+class TestRollback:
+    """Rolling back to the collection version replaced by the last rebuild."""
+
+    def test_restores_previous_version_and_projection(self, model, settings: Settings):
+        """rollback_index should serve the old version with its projection again."""
+        if settings.vector_store_backend != "qdrant":
+            pytest.skip("Rollback needs Qdrant collection aliases.")
+        settings = settings.model_copy(
+            update={
+                "qdrant_use_alias": True,
+                "embedding_reduction": "pca",
+                "embedding_reduced_dimension": 8,
+            }
+        )
+        first = _count(settings)
+        projection = Path(settings.embedding_projection_path)
+        original = projection.read_bytes()
+        (Path(settings.notes_dir) / "extra.txt").write_text("Zebras roam the savanna. " * 40)
+        assert _count(settings, reindex=True) > first
+        assert projection.read_bytes() != original
+
+        assert rollback_index(settings) == {"personal_kb": "personal_kb_v1"}
+        assert projection.read_bytes() == original
+        assert not Path(settings.index_manifest_path).exists()
+        assert _count(settings) == _note_chunks(settings)
+        assert projection.read_bytes() == original
+
+    def test_without_aliases(self, settings: Settings):
+        """rollback_index should refuse when collections are not versioned."""
+        with pytest.raises(ValueError, match="QDRANT_USE_ALIAS"):
+            rollback_index(settings)
@@ -1,7 +1,41 @@
 """Tests for Qdrant vector store operations."""
 
-from src.models import Chunk, SearchResult
-from src.vectorstore import VectorStore
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.models import Chunk, SearchFilter, SearchResult
+from src.vectorstore import VectorStore, point_id
+
+
+def _mixed_chunks() -> list[Chunk]:
+    """A note and two bookmarks added at different dates."""
+    return [
+        Chunk(
+            text="Note",
+            source="data/notes/a.txt",
+            chunk_index=0,
+            source_type="note",
+            date_added=datetime(2024, 1, 1, tzinfo=UTC),
+        ),
+        Chunk(
+            text="Old bookmark",
+            source="https://example.com/old",
+            chunk_index=0,
+            source_type="bookmark",
+            date_added=datetime(2023, 1, 1, tzinfo=UTC),
+        ),
+        Chunk(
+            text="New bookmark",
+            source="https://example.com/new",
+            chunk_index=0,
+            source_type="bookmark",
+            date_added=datetime(2025, 1, 1, tzinfo=UTC),
+        ),
+    ]
 
 
 class TestVectorStore:
@@ -17,6 +51,95 @@ class TestVectorStore:
         store = VectorStore(use_memory=True)
         store.ensure_collection()
 
+    def test_ensure_collection_reports_creation(self):
+        """ensure_collection should return True only when it creates the collection."""
+        store = VectorStore(use_memory=True)
+        assert store.ensure_collection() is True
+        assert store.ensure_collection() is False
+
+    def test_on_disk_storage_survives_reopen(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """Points stored with path= should still be there after reopening."""
+        store = VectorStore(path=str(tmp_path / "qdrant"))
+        store.ensure_collection()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        store.close()
+
+        reopened = VectorStore(path=str(tmp_path / "qdrant"))
+        assert reopened.persistent
+        assert reopened.ensure_collection() is False
+        assert reopened.count() == 3
+        reopened.close()
+
+    def test_unknown_quantization_raises(self):
+        """An unsupported quantization method should be rejected."""
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            VectorStore(use_memory=True, quantization="int4")
+
+    @pytest.mark.parametrize("quantization", ["scalar", "binary"])
+    def test_quantized_collection_search(
+        self, quantization, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """Quantized collections should be created and searchable with rescoring."""
+        store = VectorStore(use_memory=True, quantization=quantization)
+        store.ensure_collection()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        results = store.search(sample_embeddings[1], top_k=1)
+        assert results[0].chunk.text == sample_chunks[1].text
+
+    def test_hnsw_parameters(
+        self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """HNSW build and query parameters should be accepted and searches still work."""
+        store = VectorStore(use_memory=True, hnsw_m=8, hnsw_ef_construct=64, hnsw_ef=32)
+        store.ensure_collection()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        results = store.search(sample_embeddings[2], top_k=1, hnsw_ef=128)
+        assert results[0].chunk.text == sample_chunks[2].text
+
+    def test_on_disk_collection(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """Disk-resident collections should be created with on-disk vectors and stay searchable."""
+        store = VectorStore(
+            path=str(tmp_path / "qdrant"),
+            on_disk_vectors=True,
+            on_disk_hnsw=True,
+            on_disk_payload=True,
+        )
+        store.ensure_collection()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        config = store._client.get_collection("personal_kb").config
+        assert config.params.vectors.on_disk is True
+        results = store.search(sample_embeddings[0], top_k=1)
+        assert results[0].chunk == sample_chunks[0]
+        store.close()
+
+    def test_remote_transport_settings(self):
+        """gRPC, timeout and pool size should be passed to both remote clients."""
+        with (
+            patch("src.vectorstore.QdrantClient") as client,
+            patch("src.vectorstore.AsyncQdrantClient") as async_client,
+        ):
+            VectorStore(
+                url="http://localhost:6333",
+                use_memory=False,
+                prefer_grpc=True,
+                grpc_port=7334,
+                timeout=3,
+                pool_size=2,
+            )
+        expected = {
+            "url": "http://localhost:6333",
+            "prefer_grpc": True,
+            "grpc_port": 7334,
+            "timeout": 3,
+            "pool_size": 2,
+        }
+        client.assert_called_once_with(**expected)
+        async_client.assert_called_once_with(**expected)
+
     def test_add_and_search(self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]):
         """add_chunks should store data retrievable by search."""
         store = VectorStore(use_memory=True)
@@ -25,6 +148,49 @@ class TestVectorStore:
         results = store.search(sample_embeddings[0], top_k=3)
         assert len(results) > 0
 
+    def test_add_and_search_numpy_arrays(
+        self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """add_chunks and search should accept float32 arrays directly."""
+        store = VectorStore(use_memory=True)
+        store.ensure_collection()
+        embeddings = np.asarray(sample_embeddings, dtype=np.float32)
+        store.add_chunks(sample_chunks, embeddings)
+        results = store.search(embeddings[1], top_k=1)
+        assert results[0].chunk.text == sample_chunks[1].text
+
+    def test_add_chunks_in_batches_from_generators(
+        self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """add_chunks should consume iterables and upsert them in fixed-size batches."""
+        store = VectorStore(use_memory=True, upsert_batch_size=2)
+        store.ensure_collection()
+        count = store.add_chunks(iter(sample_chunks), (e for e in sample_embeddings))
+        assert count == 3
+        assert store.last_upsert_stats.count == 3
+        assert store.last_upsert_stats.points_per_second > 0
+        assert len(store.search(sample_embeddings[2], top_k=5)) == 3
+
+    def test_add_chunks_length_mismatch_raises(
+        self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """Chunks and embeddings of different lengths should be rejected."""
+        store = VectorStore(use_memory=True)
+        store.ensure_collection()
+        with pytest.raises(ValueError):
+            store.add_chunks(sample_chunks, sample_embeddings[:2])
+
+    def test_delete_points(self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]):
+        """delete_points should remove only the given chunks."""
+        store = VectorStore(use_memory=True)
+        store.ensure_collection()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        store.delete_points([point_id(sample_chunks[0])])
+        assert store.count() == 2
+        assert sample_chunks[0] not in [
+            r.chunk for r in store.search(sample_embeddings[0], top_k=5)
+        ]
+
     def test_search_returns_search_results(
         self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
     ):
@@ -101,3 +267,417 @@ class TestVectorStore:
         store.ensure_collection()
         results = store.search(sample_embeddings[0], top_k=3)
         assert results == []
+
+
+class TestDocstore:
+    """Tests for VectorStore with an external chunk docstore."""
+
+    @pytest.fixture
+    def store(self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]):
+        from src.docstore import ChunkDocstore
+
+        store = VectorStore(use_memory=True, docstore=ChunkDocstore(tmp_path / "docstore.sqlite"))
+        store.ensure_collection()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        return store
+
+    def test_payload_holds_only_filter_fields(self, store):
+        """Points should not carry the chunk text when a docstore is used."""
+        points, _ = store._client.scroll(collection_name="personal_kb", with_payload=True)
+        assert all(set(p.payload) == {"source", "source_type", "date_added"} for p in points)
+
+    def test_search_hydrates_from_docstore(
+        self, store, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """search() and search_batch() should return the full chunks."""
+        assert store.search(sample_embeddings[1], top_k=1)[0].chunk == sample_chunks[1]
+        batched = store.search_batch(sample_embeddings, top_k=1)
+        assert [results[0].chunk for results in batched] == sample_chunks
+
+    def test_filtered_search(self, store, sample_embeddings: list[list[float]]):
+        """Filters should still apply to the remaining payload fields."""
+        results = store.search(
+            sample_embeddings[0], top_k=5, search_filter=SearchFilter(sources=["doc2.txt"])
+        )
+        assert [r.chunk.source for r in results] == ["doc2.txt"]
+
+    def test_delete_points_removes_docstore_entries(self, store, sample_chunks: list[Chunk]):
+        """delete_points should delete the chunks from the docstore too."""
+        store.delete_points([point_id(sample_chunks[0])])
+        assert store._docstore.get_many([point_id(sample_chunks[0])]) == {}
+
+    def test_search_without_docstore_explains_missing_text(
+        self, store, sample_embeddings: list[list[float]]
+    ):
+        """Searching index-only payloads without the docstore should say what is wrong."""
+        store._docstore = None
+        with pytest.raises(ValueError, match="DOCSTORE_PATH"):
+            store.search(sample_embeddings[0], top_k=1)
+
+
+class TestSearchBatch:
+    """search_batch() should match per-query search() on both backends."""
+
+    @pytest.fixture
+    def store(self, make_store, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]):
+        store = make_store()
+        store.ensure_collection()
+        store.add_chunks(sample_chunks, sample_embeddings)
+        return store
+
+    def test_batch_matches_single_searches(self, store, sample_embeddings: list[list[float]]):
+        """Each batch result should equal the corresponding single search."""
+        batched = store.search_batch(sample_embeddings, top_k=2)
+        assert len(batched) == len(sample_embeddings)
+        for query, results in zip(sample_embeddings, batched, strict=True):
+            assert [r.chunk for r in results] == [r.chunk for r in store.search(query, top_k=2)]
+
+    def test_score_threshold_applied(self, store, sample_embeddings: list[list[float]]):
+        """Results below score_threshold should not be returned."""
+        (results,) = store.search_batch([sample_embeddings[0]], top_k=3, score_threshold=0.5)
+        assert len(results) == 1
+        assert results[0].score == pytest.approx(1.0)
+
+    def test_empty_batch(self, store):
+        """An empty batch should return an empty list."""
+        assert store.search_batch(np.empty((0, 384), dtype=np.float32)) == []
+
+
+class TestAsyncMethods:
+    """aadd_chunks()/asearch() should match the sync methods on both backends."""
+
+    @pytest.fixture
+    def store(self, make_store):
+        store = make_store()
+        store.ensure_collection()
+        return store
+
+    async def test_aadd_and_asearch(
+        self, store, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """Chunks added asynchronously should be found by asearch()."""
+        assert await store.aadd_chunks(sample_chunks, sample_embeddings) == 3
+        results = await store.asearch(sample_embeddings[1], top_k=1)
+        assert results[0].chunk == sample_chunks[1]
+        assert results == store.search(sample_embeddings[1], top_k=1)
+        await store.aclose()
+
+    async def test_asearch_with_filter(self, store, sample_embeddings: list[list[float]]):
+        """asearch() should apply the search filter."""
+        await store.aadd_chunks(_mixed_chunks(), sample_embeddings)
+        results = await store.asearch(
+            sample_embeddings[0], top_k=5, search_filter=SearchFilter(source_type="bookmark")
+        )
+        assert {r.chunk.text for r in results} == {"Old bookmark", "New bookmark"}
+
+
+def _on_event_loop() -> bool:
+    """Whether the calling thread is running an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class TestAsyncRemote:
+    """On the remote path, asearch()/aadd_chunks() should keep blocking I/O off the loop."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """A hybrid store with a docstore, whose async client forwards to the sync one."""
+        from src.docstore import ChunkDocstore
+
+        store = VectorStore(
+            use_memory=True,
+            embedding_dimension=4,
+            hybrid=True,
+            docstore=ChunkDocstore(tmp_path / "docstore.sqlite"),
+        )
+        store.ensure_collection()
+        get_collection = store._client.get_collection
+        upsert = store._client.upsert
+        query_batch_points = store._client.query_batch_points
+
+        class ForwardingAsyncClient:
+            async def get_collection(self, *args, **kwargs):
+                return get_collection(*args, **kwargs)
+
+            async def upsert(self, *args, **kwargs):
+                return upsert(*args, **kwargs)
+
+            async def query_batch_points(self, *args, **kwargs):
+                return query_batch_points(*args, **kwargs)
+
+        store._async_client = ForwardingAsyncClient()
+        store._sparse_collections.clear()
+        return store
+
+    @pytest.fixture
+    def blocking_calls(self, store, monkeypatch) -> list[tuple[str, bool]]:
+        """(name, ran on the event loop) for each blocking docstore or sync client call."""
+        calls = []
+
+        def record(obj, name):
+            method = getattr(obj, name)
+
+            def wrapper(*args, **kwargs):
+                calls.append((name, _on_event_loop()))
+                return method(*args, **kwargs)
+
+            monkeypatch.setattr(obj, name, wrapper)
+
+        record(store._docstore, "put_many")
+        record(store._docstore, "get_many")
+        record(store._client, "get_collection")
+        return calls
+
+    async def test_loop_not_blocked(self, store, blocking_calls: list[tuple[str, bool]]):
+        """Docstore reads and writes run in worker threads; collection info comes async."""
+        chunks = [
+            Chunk(text="The cat sat on the mat", source="a.txt", chunk_index=0),
+            Chunk(text="Quarterly revenue grew", source="b.txt", chunk_index=0),
+        ]
+        await store.aadd_chunks(chunks, np.eye(2, 4, dtype=np.float32))
+        results = await store.asearch(np.eye(1, 4, dtype=np.float32)[0], query_text="cat")
+        assert results[0].chunk == chunks[0]
+        assert {name for name, _ in blocking_calls} >= {"put_many", "get_many"}
+        assert not any(on_loop for _, on_loop in blocking_calls)
+
+
+class TestFilteredSearch:
+    """Filtered search should behave the same on both vector store backends."""
+
+    @pytest.fixture
+    def store(self, make_store, sample_embeddings: list[list[float]]):
+        store = make_store()
+        store.ensure_collection()
+        store.add_chunks(_mixed_chunks(), sample_embeddings)
+        return store
+
+    def _texts(self, store, search_filter: SearchFilter) -> set[str]:
+        results = store.search([1.0] * 384, top_k=5, search_filter=search_filter)
+        return {r.chunk.text for r in results}
+
+    def test_filter_by_source_type(self, store):
+        """source_type should restrict results to notes or bookmarks."""
+        assert self._texts(store, SearchFilter(source_type="note")) == {"Note"}
+        assert self._texts(store, SearchFilter(source_type="bookmark")) == {
+            "Old bookmark",
+            "New bookmark",
+        }
+
+    def test_filter_by_sources(self, store):
+        """sources should restrict results to the listed sources."""
+        search_filter = SearchFilter(sources=["https://example.com/old", "data/notes/a.txt"])
+        assert self._texts(store, search_filter) == {"Note", "Old bookmark"}
+
+    def test_filter_by_date_range(self, store):
+        """added_after/added_before should bound date_added."""
+        search_filter = SearchFilter(
+            source_type="bookmark", added_after=datetime(2024, 6, 1, tzinfo=UTC)
+        )
+        assert self._texts(store, search_filter) == {"New bookmark"}
+        search_filter = SearchFilter(added_before=datetime(2024, 1, 1, tzinfo=UTC))
+        assert self._texts(store, search_filter) == {"Old bookmark"}
+
+    def test_with_vectors(self, store):
+        """with_vectors should return each result's stored vector."""
+        results = store.search([0.0, 1.0] + [0.0] * 382, top_k=1, with_vectors=True)
+        assert results[0].embedding == pytest.approx([0.0, 1.0] + [0.0] * 382)
+
+    def test_payload_round_trip(self, store):
+        """source_type and date_added should survive storage."""
+        result = store.search([0.0, 0.0, 1.0] + [0.0] * 381, top_k=1)[0]
+        assert result.chunk.source_type == "bookmark"
+        assert result.chunk.date_added == datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class TestHybridSearch:
+    """Hybrid dense + BM25 search should behave the same on both backends."""
+
+    @pytest.fixture
+    def store(self, make_store):
+        store = make_store(embedding_dimension=8, hybrid=True)
+        store.ensure_collection()
+        chunks = [
+            Chunk(text="The cat sat on the mat", source="a.txt", chunk_index=0),
+            Chunk(text="Build failed with error code E4012", source="b.txt", chunk_index=0),
+            Chunk(text="Dogs enjoy long walks", source="c.txt", chunk_index=0),
+        ]
+        # Orthogonal vectors: the dense search alone always ranks a.txt first.
+        store.add_chunks(chunks, np.eye(3, 8, dtype=np.float32))
+        return store
+
+    @staticmethod
+    def _query() -> np.ndarray:
+        query = np.zeros(8, dtype=np.float32)
+        query[0] = 1.0
+        return query
+
+    def test_exact_term_promotes_keyword_match(self, store):
+        """A chunk matching the query's rare term should rank first."""
+        results = store.search(self._query(), top_k=2, query_text="E4012")
+        assert [r.chunk.source for r in results] == ["b.txt", "a.txt"]
+
+    def test_without_query_text_is_dense_only(self, store):
+        """Omitting query_text should fall back to plain dense ranking."""
+        results = store.search(self._query(), top_k=1)
+        assert results[0].chunk.source == "a.txt"
+
+    def test_batch(self, store):
+        """search_batch should fuse each query with its own text."""
+        queries = np.stack([self._query(), self._query()])
+        results = store.search_batch(queries, top_k=1, query_texts=["E4012", "walks"])
+        assert [r[0].chunk.source for r in results] == ["b.txt", "c.txt"]
+
+    def test_with_vectors(self, store):
+        """with_vectors should return the stored dense vector for fused results."""
+        results = store.search(self._query(), top_k=2, query_text="E4012", with_vectors=True)
+        assert results[0].embedding == pytest.approx([0, 1, 0, 0, 0, 0, 0, 0])
+        assert store.search(self._query(), top_k=1)[0].embedding is None
+
+    def test_filter_applies_to_sparse_candidates(self, store):
+        """Keyword matches outside the filter should not be returned."""
+        results = store.search(
+            self._query(),
+            top_k=3,
+            query_text="E4012",
+            search_filter=SearchFilter(sources=["a.txt"]),
+        )
+        assert [r.chunk.source for r in results] == ["a.txt"]
+
+    def test_reopen_collection_without_sparse_vectors(self, tmp_path):
+        """A collection built without hybrid search should stay usable, then gain BM25 on rebuild."""
+        chunks = [
+            Chunk(text="The cat sat on the mat", source="a.txt", chunk_index=0),
+            Chunk(text="Build failed with error code E4012", source="b.txt", chunk_index=0),
+        ]
+        vectors = np.eye(2, 8, dtype=np.float32)
+        store = VectorStore(path=str(tmp_path), embedding_dimension=8, use_alias=True)
+        store.ensure_collection()
+        store.add_chunks(chunks[:1], vectors[:1])
+        store.close()
+
+        store = VectorStore(path=str(tmp_path), embedding_dimension=8, use_alias=True, hybrid=True)
+        assert store.ensure_collection() is False
+        store.add_chunks(chunks[1:], vectors[1:])
+        results = store.search(self._query(), top_k=2, query_text="E4012")
+        assert [r.chunk.source for r in results] == ["a.txt", "b.txt"]
+
+        store.begin_rebuild()
+        store.ensure_collection()
+        store.add_chunks(chunks, vectors)
+        store.commit_rebuild()
+        results = store.search(self._query(), top_k=2, query_text="E4012")
+        assert [r.chunk.source for r in results] == ["b.txt", "a.txt"]
+        store.close()
+
+
+class TestAliasRebuild:
+    """Blue/green rebuilds through a collection alias."""
+
+    @pytest.fixture
+    def store(self, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]):
+        store = VectorStore(use_memory=True, use_alias=True)
+        store.ensure_collection()
+        store.add_chunks(sample_chunks[:1], sample_embeddings[:1])
+        return store
+
+    def _rebuild(self, store: VectorStore, chunks: list[Chunk], embeddings) -> None:
+        store.begin_rebuild()
+        assert store.ensure_collection() is True
+        store.add_chunks(chunks, embeddings)
+        store.commit_rebuild()
+
+    def test_alias_points_at_first_version(self, store):
+        """A new aliased collection should be created as version 1."""
+        assert store.serving_collection() == "personal_kb_v1"
+        assert store.ensure_collection() is False
+
+    def test_searches_use_old_version_until_commit(
+        self, store, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """During a rebuild, writes go to the new version and searches to the old one."""
+        store.begin_rebuild()
+        store.ensure_collection()
+        store.add_chunks(sample_chunks[1:], sample_embeddings[1:])
+        assert store.count() == 2
+        assert {r.chunk.text for r in store.search([1.0] * 384)} == {sample_chunks[0].text}
+
+        store.commit_rebuild()
+        assert store.serving_collection() == "personal_kb_v2"
+        assert {r.chunk.text for r in store.search([1.0] * 384)} == {
+            c.text for c in sample_chunks[1:]
+        }
+
+    def test_keeps_previous_version_only(
+        self, store, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """After two rebuilds, only the current and the replaced version should remain."""
+        self._rebuild(store, sample_chunks[1:2], sample_embeddings[1:2])
+        self._rebuild(store, sample_chunks[2:], sample_embeddings[2:])
+        names = {c.name for c in store._client.get_collections().collections}
+        assert names == {"personal_kb_v2", "personal_kb_v3"}
+
+    def test_rollback(
+        self, store, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """rollback should serve the replaced version again."""
+        self._rebuild(store, sample_chunks[1:], sample_embeddings[1:])
+        assert store.rollback_target() == "personal_kb_v1"
+        assert store.rollback() == "personal_kb_v1"
+        assert store.count() == 1
+        with pytest.raises(ValueError, match="No collection older"):
+            store.rollback()
+
+    def test_migrates_plain_collection(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """A plain collection should keep serving until the first rebuild replaces it."""
+        store = VectorStore(path=str(tmp_path))
+        store.ensure_collection()
+        store.add_chunks(sample_chunks[:1], sample_embeddings[:1])
+        store.close()
+
+        store = VectorStore(path=str(tmp_path), use_alias=True)
+        assert store.ensure_collection() is False
+        assert store.serving_collection() == "personal_kb"
+        self._rebuild(store, sample_chunks[1:], sample_embeddings[1:])
+        assert store.serving_collection() == "personal_kb_v1"
+        assert store.count() == 2
+        store.close()
+
+    def test_docstore_entries_follow_live_versions(
+        self, tmp_path, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """Docstore entries should stay while a kept version holds them, and go after."""
+        from src.docstore import ChunkDocstore
+
+        docstore = ChunkDocstore(tmp_path / "docstore.sqlite")
+        store = VectorStore(use_memory=True, use_alias=True, docstore=docstore)
+        store.ensure_collection()
+        store.add_chunks(sample_chunks[:2], sample_embeddings[:2])
+        self._rebuild(store, sample_chunks[1:], sample_embeddings[1:])
+
+        store.delete_points([point_id(sample_chunks[1])])
+        assert len(docstore) == 3
+        store.rollback()
+        assert {r.chunk.text for r in store.search([1.0] * 384)} == {
+            c.text for c in sample_chunks[:2]
+        }
+
+        self._rebuild(store, sample_chunks[2:], sample_embeddings[2:])
+        ids = [point_id(c) for c in sample_chunks]
+        assert set(docstore.get_many(ids)) == {ids[0], ids[1], ids[2]}
+        self._rebuild(store, sample_chunks[2:], sample_embeddings[2:])
+        assert set(docstore.get_many(ids)) == {ids[2]}
+
+    def test_delete_collection_removes_versions(
+        self, store, sample_chunks: list[Chunk], sample_embeddings: list[list[float]]
+    ):
+        """delete_collection should drop the alias and every version."""
+        self._rebuild(store, sample_chunks[1:], sample_embeddings[1:])
+        store.delete_collection()
+        assert store._client.get_collections().collections == []
+        assert store.serving_collection() is None
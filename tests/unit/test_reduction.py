@@ -0,0 +1,55 @@
+"""Tests for embedding dimensionality reduction."""
+
+import numpy as np
+import pytest
+
+from src.reduction import EmbeddingProjection
+
+
+def _corpus(n: int = 64, dim: int = 32) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((n, dim)).astype(np.float32)
+
+
+class TestEmbeddingProjection:
+    """Tests for the EmbeddingProjection class."""
+
+    def test_truncation_keeps_leading_dimensions(self):
+        """Truncation should keep the first N components, renormalized."""
+        projection = EmbeddingProjection.truncation(4, 2)
+        reduced = projection.apply(np.array([3.0, 4.0, 5.0, 6.0]))
+        np.testing.assert_allclose(reduced, [0.6, 0.8], rtol=1e-6)
+
+    def test_pca_output_shape_and_norm(self):
+        """PCA output should have the target dimension and unit-norm rows."""
+        corpus = _corpus()
+        projection = EmbeddingProjection.fit_pca(corpus, 8)
+        reduced = projection.apply(corpus)
+        assert reduced.shape == (64, 8)
+        assert reduced.dtype == np.float32
+        np.testing.assert_allclose(np.linalg.norm(reduced, axis=1), 1.0, rtol=1e-5)
+
+    def test_pca_same_projection_for_single_vector(self):
+        """A single query should be projected exactly like a corpus row."""
+        corpus = _corpus()
+        projection = EmbeddingProjection.fit_pca(corpus, 8)
+        np.testing.assert_allclose(
+            projection.apply(corpus[3]), projection.apply(corpus)[3], rtol=1e-5, atol=1e-6
+        )
+
+    def test_pca_needs_enough_vectors(self):
+        """Fitting PCA with fewer vectors than dimensions should raise."""
+        with pytest.raises(ValueError, match="at least 8"):
+            EmbeddingProjection.fit_pca(_corpus(n=4), 8)
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """A saved projection should reload with identical output."""
+        corpus = _corpus()
+        projection = EmbeddingProjection.fit_pca(corpus, 8, source_model="model")
+        path = tmp_path / "projection.npz"
+        projection.save(path)
+
+        loaded = EmbeddingProjection.load(path)
+        assert loaded.matches("pca", 8, "model")
+        assert not loaded.matches("pca", 16, "model")
+        np.testing.assert_array_equal(loaded.apply(corpus), projection.apply(corpus))
@@ -72,6 +72,58 @@ class TestRetrievalAgentSearch:
         assert isinstance(results, list)
 
 
+class TestRetrievalAgentSearchBatch:
+    """Tests for the RetrievalAgent.search_batch() method."""
+
+    def test_search_batch_matches_search(self, retrieval_agent: RetrievalAgent):
+        """search_batch() should return the same results as one search() per query."""
+        queries = ["Project Alpha deadline", "Kubernetes networking CNI"]
+        batched = retrieval_agent.search_batch(queries)
+        assert [[r.chunk for r in results] for results in batched] == [
+            [r.chunk for r in retrieval_agent.search(query)] for query in queries
+        ]
+
+
+class TestRetrievalAgentMMR:
+    """Tests for MMR re-selection in RetrievalAgent.search()."""
+
+    def test_max_per_source(self, monkeypatch, test_settings):
+        """With MMR and a per-source cap of 1, each source should appear once."""
+        monkeypatch.setenv("MMR_ENABLED", "true")
+        monkeypatch.setenv("MMR_MAX_PER_SOURCE", "1")
+        embedding_model = EmbeddingModel(model_name=test_settings.embedding_model)
+        vectorstore = VectorStore(
+            use_memory=True, embedding_dimension=test_settings.embedding_dimension
+        )
+        vectorstore.ensure_collection()
+        texts = [
+            "Project Alpha deadline is March 30, 2024.",
+            "Project Alpha deadline is March 30, 2024, for the first milestone.",
+            "Project Alpha deadline may move to April.",
+        ]
+        chunks = [
+            Chunk(text=t, source="project_alpha.txt", chunk_index=i) for i, t in enumerate(texts)
+        ]
+        vectorstore.add_chunks(chunks, embedding_model.embed_texts(texts))
+        agent = RetrievalAgent(
+            RetrievalDeps(vectorstore=vectorstore, embedding_model=embedding_model)
+        )
+
+        results = agent.search("Project Alpha deadline")
+        assert [r.chunk.source for r in results] == ["project_alpha.txt"]
+
+
+class TestRetrievalAgentQueryCache:
+    """Tests for query embedding caching in RetrievalAgent.search()."""
+
+    def test_repeated_query_hits_cache(self, retrieval_agent: RetrievalAgent):
+        """A repeated query should be served from the query embedding cache."""
+        first = retrieval_agent.search("Project Alpha deadline")
+        second = retrieval_agent.search("Project  Alpha deadline")
+        assert retrieval_agent.query_cache.hits == 1
+        assert [r.chunk.source for r in first] == [r.chunk.source for r in second]
+
+
 class TestRetrievalAgentFormatResults:
     """Tests for the RetrievalAgent.format_results() method."""
 
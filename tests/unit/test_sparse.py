@@ -0,0 +1,58 @@
+"""Tests for BM25 sparse encoding and reciprocal rank fusion."""
+
+from src.sparse import BM25Encoder, reciprocal_rank_fusion, term_id, tokenize
+
+
+class TestTokenize:
+    """Tests for tokenize and term_id."""
+
+    def test_lowercases_and_splits_on_punctuation(self):
+        """Tokens should be lowercase words, with punctuation dropped."""
+        assert tokenize("Error E4012: build-failed!") == ["error", "e4012", "build", "failed"]
+
+    def test_term_id_is_stable_and_non_negative(self):
+        """The same token should always map to the same 31-bit ID."""
+        assert term_id("qdrant") == term_id("qdrant")
+        assert 0 <= term_id("qdrant") < 2**31
+        assert term_id("qdrant") != term_id("numpy")
+
+
+class TestBM25Encoder:
+    """Tests for BM25Encoder."""
+
+    def test_document_weights_saturate(self):
+        """Repeating a term should raise its weight, but by less each time."""
+        encoder = BM25Encoder()
+        weights = [
+            dict(zip(*encoder.encode_document("cat " * n)))[term_id("cat")] for n in (1, 2, 3)
+        ]
+        assert weights[0] < weights[1] < weights[2] < 1.2 + 1
+        assert weights[1] - weights[0] > weights[2] - weights[1]
+
+    def test_longer_documents_weigh_terms_less(self):
+        """Length normalization should lower a term's weight in longer chunks."""
+        encoder = BM25Encoder()
+        short = dict(zip(*encoder.encode_document("cat dog")))
+        long = dict(zip(*encoder.encode_document("cat " + "dog " * 200)))
+        assert long[term_id("cat")] < short[term_id("cat")]
+
+    def test_query_has_unique_unit_weights(self):
+        """Query vectors should count each term once."""
+        ids, values = BM25Encoder().encode_query("cat cat dog")
+        assert sorted(ids) == sorted({term_id("cat"), term_id("dog")})
+        assert values == [1.0, 1.0]
+
+
+class TestReciprocalRankFusion:
+    """Tests for reciprocal_rank_fusion."""
+
+    def test_items_ranked_well_in_both_lists_win(self):
+        """An item near the top of both lists should beat a single first place."""
+        fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "d", "a"]])
+        assert [key for key, _ in fused][:2] == ["b", "a"]
+
+    def test_scores(self):
+        """Each appearance should add 1 / (k + rank)."""
+        fused = dict(reciprocal_rank_fusion([["a"], ["b", "a"]], k=10))
+        assert fused["a"] == 1 / 11 + 1 / 12
+        assert fused["b"] == 1 / 11